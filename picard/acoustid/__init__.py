@@ -315,8 +315,10 @@ class AcoustIDClient(QtCore.QObject):
         self._fingerprint(AcoustIDTask(file, next_func))
 
     def stop_analyze(self, file):
-        new_queue = deque()
-        for task in self._queue:
-            if task.file != file and task.file.state != File.State.REMOVED:
-                new_queue.appendleft(task)
-        self._queue = new_queue
+        self.stop_analyze_files((file,))
+
+    def stop_analyze_files(self, files):
+        files = set(files)
+        self._queue = deque(
+            task for task in self._queue if task.file not in files and task.file.state != File.State.REMOVED
+        )
@@ -30,7 +30,10 @@ from PyQt6 import QtCore
 
 from picard import log
 from picard.i18n import N_
-from picard.util import load_json
+from picard.util import (
+    IgnoreUpdatesContext,
+    load_json,
+)
 
 from picard.ui.enums import MainAction
 
@@ -116,6 +119,8 @@ class AcoustIDManager:
         self.tagger = QtCore.QCoreApplication.instance()
         self._submissions = {}
         self._acoustid_api = acoustid_api
+        # Checking for unsubmitted fingerprints is deferred while entered
+        self.suspend_check = IgnoreUpdatesContext(on_last_exit=self._check_unsubmitted)
 
     def add(self, file, recordingid):
         if not file.acoustid_fingerprint or not file.acoustid_length:
@@ -156,6 +161,8 @@ class AcoustIDManager:
                 yield (file, submission)
 
     def _check_unsubmitted(self):
+        if self.suspend_check:
+            return
         enabled = next(self._unsubmitted(), None) is not None
         self.tagger.window.enable_action(MainAction.SUBMIT_ACOUSTID, enabled)
 
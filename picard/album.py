@@ -51,6 +51,7 @@ from collections.abc import (
     Iterable,
 )
 from enum import IntEnum
+from functools import partial
 import traceback
 
 from PyQt6 import QtNetwork
@@ -93,6 +94,7 @@ from picard.util import (
     find_best_match,
     format_time,
     mbid_validate,
+    thread,
 )
 from picard.util.textencoding import asciipunct
 from picard.webservice import PendingRequest
@@ -112,6 +114,32 @@ def _copy_artist_nodes(source, target_node):
             credit['artist'] = artist_node
 
 
+def _run_tagging_scripts(scripts, tracks, album_metadata):
+    """Run the tagger `scripts` on the metadata of `tracks` and on
+    `album_metadata`.
+
+    Each script runs on all tracks and then on the album, before the next
+    script runs. Intended to be run on a worker thread, hence it uses its own
+    parsers.
+    """
+    for script in scripts:
+        parser = ScriptParser()
+        for track in tracks:
+            # Run tagger script for each track
+            try:
+                parser.eval(script.content, track.metadata)
+            except ScriptError:
+                log.exception("Failed to run tagger script %s on track", script.name)
+            track.metadata.strip_whitespace()
+            track.scripted_metadata.update(track.metadata)
+        # Run tagger script for the album itself
+        try:
+            parser.eval(script.content, album_metadata)
+        except ScriptError:
+            log.exception("Failed to run tagger script %s on album", script.name)
+        album_metadata.strip_whitespace()
+
+
 class AlbumArtist(MetadataItem):
     def __init__(self, album_artist_id):
         super().__init__(album_artist_id)
@@ -191,6 +219,14 @@ class Album(MetadataItem):
         self._load_request = None
         self.release_group: ReleaseGroup | None = None
         self._files_count = 0
+        # Counters for the album status, maintained incrementally as files
+        # get added, removed or change their saved state.
+        self._matched_tracks = set()
+        self._single_file_tracks = set()
+        self._unsaved_files = set()
+        self._completeness_key = None
+        self._completeness_tracks = set()
+        self._num_complete_tracks = 0
         self._pending_tasks = {}
         self._tracks_loaded = False
         self._discids = set()
@@ -215,8 +251,13 @@ class Album(MetadataItem):
         timeout: float | None = None,
         plugin_id: str | None = None,
         request_factory: Callable[[], PendingRequest] | None = None,
+        on_cancel: Callable[[], None] | None = None,
     ):
-        """Add a pending task that must complete before album finalization."""
+        """Add a pending task that must complete before album finalization.
+
+        on_cancel gets called if the task is cancelled or times out, as the
+        handlers of aborted requests are not called.
+        """
         import time
 
         if timeout is not None:
@@ -238,6 +279,7 @@ class Album(MetadataItem):
             started_at=time.time(),
             timeout=timeout,
             plugin_id=plugin_id,
+            on_cancel=on_cancel,
         )
         self._pending_tasks[task_id] = task_info
         log.debug("Added %s task %s: %s", task_type.name, task_id, description)
@@ -265,6 +307,8 @@ class Album(MetadataItem):
                 except (RuntimeError, ValueError, AttributeError):
                     # Task may already be completed or invalid
                     pass
+            if task_info.on_cancel:
+                task_info.on_cancel()
         self._pending_tasks.clear()
 
     def check_timed_out_tasks(self):
@@ -284,6 +328,8 @@ class Album(MetadataItem):
                     except RuntimeError:
                         pass
                 self._pending_tasks.pop(task_id, None)
+                if task_info.on_cancel:
+                    task_info.on_cancel()
 
     def has_critical_tasks(self):
         """Check if there are any critical tasks pending."""
@@ -322,6 +368,20 @@ class Album(MetadataItem):
         if not save:
             yield from self.unmatched_files.iterfiles()
 
+    def detach_files(self):
+        """Detach all files from the album, which is about to be removed.
+
+        Unlike removing the files one by one, neither the album, nor its tracks,
+        nor the item views get updated.
+        """
+        for track in self.tracks:
+            track.detach_files()
+        unmatched_files = self.unmatched_files
+        if unmatched_files.can_show_coverart:
+            for file in unmatched_files.files:
+                file.metadata_images_changed.disconnect(unmatched_files.update_metadata_images)
+        unmatched_files.files.clear()
+
     def iter_correctly_matched_tracks(self):
         yield from (track for track in self.tracks if track.num_linked_files == 1)
 
@@ -518,14 +578,16 @@ class Album(MetadataItem):
         request_id = f'recording_rels_{offset}'
 
         def create_request():
-            self._load_request = self.tagger.mb_api.browse_recordings(
-                self._recordings_request_finished,
+            request = self.tagger.mb_api.browse_recordings(
+                partial(self._recordings_request_finished, offset=offset),
                 inc=inc,
                 release=self.id,
                 limit=limit,
                 offset=offset,
             )
-            return self._load_request
+            if not offset:
+                self._load_request = request
+            return request
 
         self.add_task(
             request_id,
@@ -534,30 +596,46 @@ class Album(MetadataItem):
             request_factory=create_request,
         )
 
-    def _recordings_request_finished(self, document, http, error):
-        offset = document.get('recording-offset', 0) if not error else 0
+    def _has_pending_recording_requests(self):
+        return any(task_id.startswith('recording_rels_') for task_id in self._pending_tasks)
+
+    def _recordings_request_finished(self, document, http, error, offset=0):
         request_id = f'recording_rels_{offset}'
+        if request_id not in self._pending_tasks:
+            # Loading was cancelled
+            return
 
         if error:
             self.error_append(http.errorString())
             self.complete_task(request_id)
             self._finalize_loading(error)
-        else:
-            for recording in document.get('recordings', []):
-                recording_id = recording.get('id')
-                if recording_id:
-                    self._recordings_map[recording_id] = recording
+            return
+
+        for recording in document.get('recordings', []):
+            recording_id = recording.get('id')
+            if recording_id:
+                self._recordings_map[recording_id] = recording
+
+        if not offset:
+            # The first page tells how many recordings there are in total,
+            # request all remaining pages at once. The web service still
+            # applies rate limiting to the queued requests.
             count = document.get('recording-count', 0)
-            next_offset = offset + RECORDING_QUERY_LIMIT
-            if next_offset < count:
-                self.complete_task(request_id)
+            for next_offset in range(RECORDING_QUERY_LIMIT, count, RECORDING_QUERY_LIMIT):
                 self._request_recording_relationships(offset=next_offset)
-            else:
-                # Merge separately loaded recording relationships into release node
-                self._merge_release_recording_relationships()
-                self._run_album_metadata_processors()
-                self.complete_task(request_id)
-                self._finalize_loading(error)
+
+        self.complete_task(request_id)
+        if self._has_pending_recording_requests():
+            return
+
+        if self.status == AlbumStatus.ERROR:
+            # Another page failed to load, finish error handling
+            self._finalize_loading(True)
+        else:
+            # Merge separately loaded recording relationships into release node
+            self._merge_release_recording_relationships()
+            self._run_album_metadata_processors()
+            self._finalize_loading(False)
 
     def _merge_recording_relationships(self, track_node):
         if 'relations' not in track_node['recording']:
@@ -590,7 +668,6 @@ class Album(MetadataItem):
         _copy_artist_nodes(_create_artist_node_dict(track_node), track_node['recording'])
 
         track = Track(track_node['recording']['id'], self)
-        self._new_tracks.append(track)
 
         # Get track metadata
         tm = track.metadata
@@ -603,24 +680,32 @@ class Album(MetadataItem):
         if extra_metadata:
             tm.update(extra_metadata)
 
-        # Run track metadata plugins
-        try:
-            run_track_metadata_processors(track, tm, track_node, self._release_node)
-        except BaseException:
-            self.error_append(traceback.format_exc())
-
         return track
 
     def _load_tracks(self):
+        """Build the tracks of the release from the release node.
+
+        This is run on a worker thread. The tracks are returned detached from
+        the album as a list of `(track, track_node)` tuples and get attached
+        in `_load_tracks_finished` on the main thread.
+        """
+        loaded_tracks = []
         artists = set()
         all_media = []
         absolutetracknumber = 0
+        main_thread = self.tagger.thread()
 
         def _load_track(node, mm, artists, extra_metadata):
             nonlocal absolutetracknumber
             absolutetracknumber += 1
             extra_metadata['~absolutetracknumber'] = absolutetracknumber
-            self._finalize_loading_track(node, mm, artists, extra_metadata)
+            track = self._finalize_loading_track(node, mm, artists, extra_metadata)
+            # Track objects are created on the worker thread, hand them over
+            # to the main thread where they will be used from now on.
+            track.moveToThread(main_thread)
+            for track_artist in track._track_artists:
+                track_artist.moveToThread(main_thread)
+            loaded_tracks.append((track, node))
 
         va = self._new_metadata['musicbrainz_albumartistid'] == VARIOUS_ARTISTS_ID
 
@@ -666,45 +751,82 @@ class Album(MetadataItem):
         self._new_metadata['media'] = " / ".join(list(OrderedDict.fromkeys(all_media)))
 
         multiartists = len(artists) > 1
-        for track in self._new_tracks:
+        for track, _track_node in loaded_tracks:
             track.metadata['~totalalbumtracks'] = totalalbumtracks
             if multiartists:
                 track.metadata['~multiartist'] = '1'
-        # Preserve release JSON for session export after load finished
-        self._release_node_cache = self._release_node
-        del self._release_node
-        del self._release_artist_nodes
-        self._tracks_loaded = True
+        return loaded_tracks
+
+    def _start_loading_tracks(self):
+        """Schedule building the tracks on the thread pool.
+
+        A critical task is registered for the duration of the build, so the
+        album can neither be finalized nor reloaded while the worker thread
+        operates on the release data.
+        """
+        self.add_task('load_tracks', TaskType.CRITICAL, f'Build tracks for {self.id}')
+        thread.run_task(self._load_tracks, self._load_tracks_finished)
+
+    def _load_tracks_finished(self, result=None, error=None):
+        if 'load_tracks' not in self._pending_tasks:
+            # Album got removed or loading was cancelled in the meantime
+            log.debug("Discarding tracks built for %r, loading was cancelled", self)
+            return
+        if error:
+            self.error_append(str(error))
+        else:
+            for track, track_node in result:
+                self._new_tracks.append(track)
+                # Run track metadata plugins
+                try:
+                    run_track_metadata_processors(track, track.metadata, track_node, self._release_node)
+                except BaseException:
+                    self.error_append(traceback.format_exc())
+            # Preserve release JSON for session export after load finished
+            self._release_node_cache = self._release_node
+            del self._release_node
+            del self._release_artist_nodes
+            self._tracks_loaded = True
+        self.complete_task('load_tracks')
+        self._finalize_loading(bool(error))
 
     def _finalize_loading_album(self):
+        for track in self._new_tracks:
+            track.orig_metadata.copy(track.metadata)
+
+        scripts = list(iter_active_tagging_scripts())
+        if not scripts:
+            self._attach_loaded_album()
+            return
+
+        # Run the tagger scripts on the thread pool, so that the user
+        # interface stays responsive for releases with many tracks. Script
+        # functions, including those of plugins, get called on the worker.
+        self.add_task('tagger_scripts', TaskType.CRITICAL, f'Tagger scripts for {self.id}')
+        thread.run_task(
+            partial(_run_tagging_scripts, scripts, self._new_tracks, self._new_metadata),
+            self._tagging_scripts_finished,
+        )
+
+    def _tagging_scripts_finished(self, result=None, error=None):
+        if 'tagger_scripts' not in self._pending_tasks:
+            # Album got removed or loading was cancelled in the meantime
+            return
+        if error:
+            self.error_append(str(error))
+        self.complete_task('tagger_scripts')
+        self._attach_loaded_album()
+
+    def _attach_loaded_album(self):
         with self.suspend_metadata_images_update:
             for track in self._new_tracks:
-                track.orig_metadata.copy(track.metadata)
                 track.metadata_images_changed.connect(self.update_metadata_images)
-
-            # Prepare parser for user's script
-            for script in iter_active_tagging_scripts():
-                parser = ScriptParser()
-                for track in self._new_tracks:
-                    # Run tagger script for each track
-                    try:
-                        parser.eval(script.content, track.metadata)
-                    except ScriptError:
-                        log.exception("Failed to run tagger script %s on track", script.name)
-                    track.metadata.strip_whitespace()
-                    track.scripted_metadata.update(track.metadata)
-                # Run tagger script for the album itself
-                try:
-                    parser.eval(script.content, self._new_metadata)
-                except ScriptError:
-                    log.exception("Failed to run tagger script %s on album", script.name)
-                self._new_metadata.strip_whitespace()
-
             unmatched_files = [file for track in self.tracks for file in track.files]
             self.metadata = self._new_metadata
             self.orig_metadata.copy(self.metadata)
             self.orig_metadata.images.clear()
             self.tracks = self._new_tracks
+            self._completeness_key = None
             del self._new_metadata
             del self._new_tracks
             self.loaded = True
@@ -735,9 +857,7 @@ class Album(MetadataItem):
             },
             timeout=3000,
         )
-        for func, _run_on_error in self._after_load_callbacks:
-            func()
-        self._after_load_callbacks = []
+        self._run_after_load_callbacks()
         if self.ui_item.isSelected():
             self.tagger.window.refresh_metadatabox()
             self.tagger.window.cover_art_box.update_metadata()
@@ -769,19 +889,17 @@ class Album(MetadataItem):
                 del self._new_metadata
                 del self._new_tracks
                 self.loaded = True
-                for func, run_on_error in self._after_load_callbacks:
-                    if run_on_error:
-                        func()
+                self._run_after_load_callbacks(error=True)
             return
 
         if self.has_critical_tasks():
             return
 
         if not self._tracks_loaded:
-            self._load_tracks()
+            self._start_loading_tracks()
+            return
 
-        if not self.has_critical_tasks():
-            self._finalize_loading_album()
+        self._finalize_loading_album()
 
     def load(self, priority=False, refresh=False):
         if self.has_critical_tasks():
@@ -867,26 +985,58 @@ class Album(MetadataItem):
         else:
             self._after_load_callbacks.append((func, run_on_error))
 
+    def _run_after_load_callbacks(self, error=False):
+        """Run the callbacks registered with `run_when_loaded`.
+
+        If loading failed only the callbacks registered with run_on_error get
+        run, the others are kept. If a callback starts reloading the album,
+        the remaining callbacks are kept for when that reload finished.
+        """
+        callbacks = self._after_load_callbacks
+        self._after_load_callbacks = []
+        remaining = []
+        for index, (func, run_on_error) in enumerate(callbacks):
+            if error and not run_on_error:
+                remaining.append((func, run_on_error))
+                continue
+            func()
+            if not self.loaded:
+                remaining.extend(callbacks[index + 1 :])
+                break
+        self._after_load_callbacks[:0] = remaining
+
     def stop_loading(self):
         if self._load_request:
             self.tagger.webservice.abort_task(self._load_request)
             self._load_request = None
 
     def update(self, update_tracks=True, update_selection=True):
-        if self.ui_item:
+        if not self.ui_item:
+            return
+        if update_tracks:
+            # Adding and removing track items can not be deferred
             self.ui_item.update(update_tracks, update_selection=update_selection)
+        else:
+            self.ui_item.schedule_update(update_tracks=False, update_selection=update_selection)
 
     def add_file(self, track, file, new_album=True):
         self._files_count += 1
+        self._update_track_counters(track)
+        if not file.is_saved():
+            self._unsaved_files.add(file)
         if new_album:
             self.update(update_tracks=False)
-            self.add_metadata_images_from_children([file])
+            # The images of the track changed together with the file
+            self.add_metadata_images_from_children([track, file])
 
     def remove_file(self, track, file, new_album=True):
         self._files_count -= 1
+        self._update_track_counters(track)
+        self._unsaved_files.discard(file)
         if new_album:
             self.update(update_tracks=False)
             self.remove_metadata_images_from_children([file])
+            self.add_metadata_images_from_children([track])
 
     @staticmethod
     def _match_files(files, tracks, unmatched_files, threshold=0):
@@ -980,8 +1130,50 @@ class Album(MetadataItem):
     def is_album_like(self):
         return True
 
+    def _update_track_counters(self, track):
+        if track.files:
+            self._matched_tracks.add(track)
+        else:
+            self._matched_tracks.discard(track)
+        is_single_file = track.num_linked_files == 1
+        if is_single_file == (track in self._single_file_tracks):
+            return
+        if is_single_file:
+            self._single_file_tracks.add(track)
+        else:
+            self._single_file_tracks.discard(track)
+        if track in self._completeness_tracks:
+            self._num_complete_tracks += 1 if is_single_file else -1
+
+    def update_file_saved_state(self, file):
+        """Update the unsaved files counter after the saved state of file changed."""
+        if file.is_saved():
+            self._unsaved_files.discard(file)
+        else:
+            track = file.parent_item
+            if track in self._matched_tracks and file in track.files:
+                self._unsaved_files.add(file)
+
+    def _get_num_incomplete_tracks(self):
+        config = get_config()
+        # The tracks of NAT albums get appended and removed in place
+        key = (
+            len(self.tracks),
+            config.setting['completeness_ignore_videos'],
+            config.setting['completeness_ignore_pregap'],
+            config.setting['completeness_ignore_data'],
+            config.setting['completeness_ignore_silence'],
+        )
+        if key != self._completeness_key:
+            # Tracks or settings changed, determine which tracks need
+            # exactly one file for the album to be complete.
+            self._completeness_key = key
+            self._completeness_tracks = {track for track in self.tracks if not track.ignored_for_completeness()}
+            self._num_complete_tracks = len(self._completeness_tracks & self._single_file_tracks)
+        return len(self._completeness_tracks) - self._num_complete_tracks
+
     def get_num_matched_tracks(self):
-        return sum(1 for track in self.tracks if track.is_linked())
+        return len(self._matched_tracks)
 
     def get_num_unmatched_files(self):
         return len(self.unmatched_files.files)
@@ -992,19 +1184,15 @@ class Album(MetadataItem):
     def is_complete(self):
         if not self.tracks:
             return False
-        for track in self.tracks:
-            if not track.is_complete():
-                return False
-        return not self.get_num_unmatched_files()
+        if self.get_num_unmatched_files():
+            return False
+        return not self._get_num_incomplete_tracks()
 
     def is_modified(self):
-        return any(self._iter_unsaved_files())
+        return bool(self._unsaved_files)
 
     def get_num_unsaved_files(self):
-        return sum(1 for file in self._iter_unsaved_files())
-
-    def _iter_unsaved_files(self):
-        yield from (file for file in self.iterfiles(save=True) if not file.is_saved())
+        return len(self._unsaved_files)
 
     def column(self, column: str) -> str:
         if column == 'title':
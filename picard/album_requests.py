@@ -19,6 +19,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import IntEnum
 import time
@@ -45,6 +46,7 @@ class TaskInfo:
     timeout: float | None = None
     plugin_id: str | None = None
     request: PendingRequest | None = None  # PendingRequest object if available
+    on_cancel: Callable[[], None] | None = None  # Called if the task gets cancelled
 
     def __post_init__(self):
         if self.started_at is None:
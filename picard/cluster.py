@@ -164,15 +164,28 @@ class Cluster(FileList):
         self.add_files([file], new_album=new_album)
 
     def remove_file(self, file: File, new_album=True):
+        self.remove_files([file], new_album=new_album)
+
+    def remove_files(self, files: Iterable[File], new_album=True):
+        """Remove several files at once, updating the cluster only once."""
+        current_files = set(self.files)
+        removed_files = [file for file in dict.fromkeys(files) if file in current_files]
+        if not removed_files:
+            return
         self.tagger.window.set_processing(True)
-        self.files.remove(file)
+        if len(removed_files) == 1:
+            self.files.remove(removed_files[0])
+        else:
+            removed = set(removed_files)
+            self.files[:] = [file for file in self.files if file not in removed]
         self.update(signal=False)
-        self.ui_item.remove_file(file)
+        self.ui_item.remove_files(removed_files)
         if self.can_show_coverart:
-            file.metadata_images_changed.disconnect(self.update_metadata_images)
-            self.remove_metadata_images_from_children([file])
+            for file in removed_files:
+                file.metadata_images_changed.disconnect(self.update_metadata_images)
+            self.remove_metadata_images_from_children(removed_files)
         if new_album:
-            self._update_related_album(removed_files=[file])
+            self._update_related_album(removed_files=removed_files)
         self.tagger.window.set_processing(False)
         if not self.special and self.get_num_files() == 0:
             self.tagger.remove_cluster(self)
@@ -180,7 +193,7 @@ class Cluster(FileList):
     def update(self, signal=True):
         self.metadata['~totalalbumtracks'] = self.metadata['totaltracks'] = len(self.files)
         if signal and self.ui_item:
-            self.ui_item.update()
+            self.ui_item.schedule_update()
 
     def get_num_files(self):
         return len(self.files)
@@ -355,8 +368,8 @@ class UnclusteredFiles(Cluster):
         super().add_files(files, new_album=new_album)
         self.tagger.window.enable_action(MainAction.CLUSTER, self.files)
 
-    def remove_file(self, file, new_album=True):
-        super().remove_file(file, new_album=new_album)
+    def remove_files(self, files, new_album=True):
+        super().remove_files(files, new_album=new_album)
         self.tagger.window.enable_action(MainAction.CLUSTER, self.files)
 
     def lookup_metadata(self):
@@ -58,6 +58,13 @@ MUSICBRAINZ_OAUTH_CLIENT_SECRET = 'IVg2qnvErgX046Ptz3FsTxW4dbyQM9Jr'
 # Cover art archive URL
 CAA_URL = 'https://coverartarchive.org'
 
+# Maximum size in bytes of the disk cache for downloaded cover art images
+COVER_DOWNLOAD_CACHE_SIZE = 200 * 1000 * 1000
+# Seconds after which downloaded cover art images get revalidated
+COVER_DOWNLOAD_CACHE_TTL = 7 * 24 * 60 * 60
+# Maximum size in bytes of the disk cache for Cover Art Archive index documents
+CAA_INDEX_CACHE_SIZE = 20 * 1000 * 1000
+
 # Documentation ReadTheDocs project information
 READTHEDOCS_PROJECT = 'picard-docs'
 READTHEDOCS_PROJECT_API = 'https://app.readthedocs.org/api/v3/projects/' + READTHEDOCS_PROJECT
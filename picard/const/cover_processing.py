@@ -224,7 +224,8 @@ def get_image_format_from_format(format_string: str) -> ImageFormat:
     return None
 
 
-COVER_PROCESSING_SLEEP = 0.001
+# Maximum size in bytes of the disk cache for processed cover art images
+COVER_PROCESSING_CACHE_SIZE = 100 * 1000 * 1000
 
 
 ALLOWED_QT_FORMATS = set([str(x, 'utf-8') for x in QtGui.QImageWriter.supportedImageFormats()])
@@ -171,6 +171,7 @@ DEFAULT_COVER_RESIZE_MODE = ResizeModes.MAINTAIN_ASPECT_RATIO
 
 DEFAULT_COVER_CONVERTING_FORMAT = ImageFormat.JPEG
 DEFAULT_COVER_IMAGE_QUALITY = 90
+DEFAULT_COVER_MAX_CONCURRENT_DOWNLOADS = 4
 
 DEFAULT_QUICK_MENU_ITEMS = ['save_images_to_tags', 'save_images_to_files']
 
@@ -25,7 +25,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
-from collections.abc import Generator
+from collections import deque
 from functools import partial
 import traceback
 
@@ -35,6 +35,7 @@ from picard import log
 from picard.album import Album
 from picard.album_requests import TaskType
 from picard.config import get_config
+from picard.coverart.downloadslots import download_slots
 from picard.coverart.image import (
     CoverArtImage,
     CoverArtImageError,
@@ -56,6 +57,30 @@ from picard.extension_points.metadata import register_album_metadata_processor
 from picard.i18n import N_
 from picard.metadata import Metadata
 from picard.util import imageinfo
+from picard.webservice.utils import hostkey_from_url
+
+
+class QueuedImage:
+    """Cover art image taken from the queue, while loading and until processed."""
+
+    def __init__(self, image: CoverArtImage):
+        self.image = image
+        self.loaded = False
+        self.data = None
+        self.info = None
+        # Downloaded images need to pass the image filters
+        self.filter = False
+        # Host of the download slot held while downloading
+        self.hostkey = None
+
+
+class CacheLookup:
+    """Lookup of the image at the head of the queue in the download cache."""
+
+    def __init__(self, image: CoverArtImage):
+        self.image = image
+        self.done = False
+        self.data = None
 
 
 class CoverArt:
@@ -66,7 +91,15 @@ class CoverArt:
         self.release = release  # not used in this class, but used by providers
         self.front_image_found: bool = False
         self.image_processing = CoverArtImageProcessing(album)
-        self._queue_generator: Generator[None, None, None] | None = None
+        self.download_cache = getattr(album.tagger, 'downloaded_image_cache', None)
+        self._active = False
+        self._running = False
+        self._waiting_for_provider = False
+        self._processing = False
+        self._only_one_front_image = False
+        # Images taken from the queue, in queue order
+        self._loading: deque[QueuedImage] = deque()
+        self._cache_lookup: CacheLookup | None = None
 
     def __repr__(self):
         return "%s for %r" % (self.__class__.__name__, self.album)
@@ -74,79 +107,130 @@ class CoverArt:
     def retrieve(self):
         """Retrieve available cover art images for the release"""
         config = get_config()
-        if config.setting['save_images_to_tags'] or config.setting['save_images_to_files']:
+        save_images_to_tags = config.setting['save_images_to_tags']
+        save_images_to_files = config.setting['save_images_to_files']
+        if save_images_to_tags or save_images_to_files:
+            self._only_one_front_image = (
+                save_images_to_tags and not save_images_to_files and config.setting['embed_only_one_front_image']
+            )
             self.providers = cover_art_providers()
-            self._queue_generator = self._start_queue()
-            self.next_in_queue()
+            self._active = True
+            self._run_queue()
         else:
             log.debug("Cover art disabled by user options.")
 
     def next_in_queue(self):
-        """Run the next item in the queue.
-        Async cover art providers should call this once they have finished processing.
+        """Continue with the queue.
+        Async cover art providers should call this once they have finished queuing images.
         """
-        if not self._queue_generator:
-            log.error(f'CoverArt.next_in_queue called for {self.album} without active queue generator')
+        if not self._active:
+            log.error(f'CoverArt.next_in_queue called for {self.album} without active queue')
             return
+        self._waiting_for_provider = False
+        self._run_queue()
 
-        try:
-            next(self._queue_generator)
-        except StopIteration:
-            self._queue_generator = None
-            self.image_processing.wait_for_processing()
+    def _stop(self):
+        self._active = False
+        self.image_processing.finish_processing()
 
-    def _start_queue(self) -> Generator[None, None, None]:
-        """Creates a generator that processes all cover art providers.
-        The generator will yield if async providers are loading data, otherwise
-        it iterates over queued images and processes them.
-        """
-        config = get_config()
-        save_images_to_tags = config.setting['save_images_to_tags']
-        save_images_to_files = config.setting['save_images_to_files']
-        embed_only_one_front_image = config.setting['embed_only_one_front_image']
-
-        while True:
-            if self.album.id not in self.album.tagger.albums:
-                # album removed
-                log.debug(f'Cover art processing aborted, {self.album} got removed')
-                return
+    def _run_queue(self):
+        """Load queued images and process the loaded ones.
 
-            if (
-                self.front_image_found
-                and save_images_to_tags
-                and not save_images_to_files
-                and embed_only_one_front_image
-            ):
-                # no need to continue
+        Several images get loaded at the same time, but they get processed one
+        after the other in queue order. This way the selection of the front
+        image does not depend on the order downloads finish in.
+        Once all images are processed the next provider queues its images.
+        """
+        if self._running:
+            # Called from within the loop below, which handles the new state
+            return
+        self._running = True
+        try:
+            while self._active:
+                if self.album.id not in self.album.tagger.albums:
+                    # album removed
+                    log.debug(f'Cover art processing aborted, {self.album} got removed')
+                    self._stop()
+                elif self.front_image_found and self._only_one_front_image:
+                    # no need to continue
+                    self._stop()
+                elif self._processing:
+                    return
+                elif self._loading and self._loading[0].loaded:
+                    self._process_queued_image(self._loading.popleft())
+                else:
+                    self._start_loading()
+                    if self._loading:
+                        if self._loading[0].loaded:
+                            continue
+                        # Wait for downloads
+                        return
+                    if not self._queue_empty() or self._waiting_for_provider:
+                        # Wait for a download slot or the provider
+                        return
+                    if self._requeue() == CoverArtProvider.QueueState.WAIT:
+                        self._waiting_for_provider = True
+        except StopIteration:
+            # Cover art processing complete - no need to finalize,
+            # album already finalized when critical requests completed
+            self._stop()
+        finally:
+            self._running = False
+
+    def _start_loading(self):
+        """Start loading images from the queue, as far as download slots are available."""
+        while not self._queue_empty():
+            image = self._queue_peek()
+            busy = bool(self._loading) or self._processing
+            if not image.support_types:
+                if self.front_image_found:
+                    # we already have one front image, no need to try other type-less
+                    # sources
+                    log.debug("Skipping %r, one front image is already available", self._queue_get())
+                    continue
+                if busy:
+                    # Whether the image is needed depends on the images before
+                    return
+            if busy and self._only_one_front_image:
+                # Subsequent images are not needed if this one is a front image
                 return
+            hostkey = None
+            data = None
+            if not image.datahash and image.url and image.url.scheme() != 'file':
+                if self.download_cache is not None:
+                    lookup = self._cache_lookup
+                    if lookup is None or lookup.image is not image:
+                        lookup = self._look_up_downloaded_data(image)
+                    if not lookup.done:
+                        # Wait for the download cache
+                        return
+                    data = lookup.data
+                if data is None:
+                    hostkey = hostkey_from_url(image.url)
+                    if not download_slots.acquire(hostkey):
+                        download_slots.wait(hostkey, self._run_queue)
+                        return
+            queued = QueuedImage(self._queue_get())
+            self._cache_lookup = None
+            queued.hostkey = hostkey
+            self._loading.append(queued)
+            if data is not None:
+                self._set_downloaded_data(queued, data)
+                queued.loaded = True
+            else:
+                self._load_image(queued)
 
-            while self._queue_empty():
-                try:
-                    queue_state = self._requeue()
-                    if queue_state == CoverArtProvider.QueueState.WAIT:
-                        yield
-                except StopIteration:
-                    # Cover art processing complete - no need to finalize,
-                    # album already finalized when critical requests completed
-                    return
+    def _look_up_downloaded_data(self, image: CoverArtImage) -> CacheLookup:
+        lookup = CacheLookup(image)
+        self._cache_lookup = lookup
+        self.download_cache.get(image.url, partial(self._downloaded_data_looked_up, lookup))
+        return lookup
 
-            # We still have some items to try!
-            image = self._queue_get()
-            if not image.support_types and self.front_image_found:
-                # we already have one front image, no need to try other type-less
-                # sources
-                log.debug("Skipping %r, one front image is already available", image)
-                continue
-            else:
-                try:
-                    state = self._handle_queued_image(image)
-                    if state == CoverArtProvider.QueueState.WAIT:
-                        yield
-                except CoverArtImageIOError as error:
-                    # It doesn't make sense to store/download more images if we can't
-                    # save them in the temporary folder, abort.
-                    log.error(f'Cover art image IO error, {self.album}, {image}: {error}')
-                    return
+    def _downloaded_data_looked_up(self, lookup: CacheLookup, data):
+        lookup.data = data
+        lookup.done = True
+        if lookup is self._cache_lookup:
+            self._run_queue()
 
     def _requeue(self) -> CoverArtProvider.QueueState:
         # requeue from next provider
@@ -164,34 +248,33 @@ class CoverArt:
             raise
         return result
 
-    def _handle_queued_image(self, image: CoverArtImage) -> CoverArtProvider.QueueState:
+    def _load_image(self, queued: QueuedImage):
+        image = queued.image
         # image has already data loaded
         if image.datahash:
-            info = imageinfo.ImageInfo(
+            queued.data = image.data
+            queued.info = imageinfo.ImageInfo(
                 width=image.width,
                 height=image.height,
                 mime=image.mimetype,
                 extension=image.extension,
                 datalen=image.datalength,
             )
-            self._process_image_data(image, image.data, info)
-            return CoverArtProvider.QueueState.WAIT
+            queued.loaded = True
         # local files, load image data from filesystem
         elif image.url and image.url.scheme() == 'file':
             try:
                 path = image.url.toLocalFile()
                 with open(path, 'rb') as file:
                     data = file.read()
-                    image_info = imageinfo.identify(data)
-                    self._process_image_data(image, data, image_info)
-                return CoverArtProvider.QueueState.WAIT
+                    queued.info = imageinfo.identify(data)
+                    queued.data = data
             except imageinfo.IdentificationError as e:
                 log.error("Couldn't identify image file %r: %s", path, e)
-                return CoverArtProvider.QueueState.FINISHED
             except OSError as exc:
                 (errnum, errmsg) = exc.args
                 log.error("Failed to read %r: %s (%d)", path, errmsg, errnum)
-                return CoverArtProvider.QueueState.FINISHED
+            queued.loaded = True
         # download image from the web
         elif image.url:
             self._message(
@@ -207,9 +290,13 @@ class CoverArt:
             task_id = f'coverart_{id(image)}'
 
             def create_request():
+                handler = partial(self._coverart_downloaded, queued)
+                if self.download_cache is not None:
+                    self.download_cache.download(self.album.tagger.webservice, image.url, handler)
+                    return None
                 return self.album.tagger.webservice.download_url(
                     url=image.url,
-                    handler=partial(self._coverart_downloaded, image),
+                    handler=handler,
                     priority=True,
                 )
 
@@ -218,12 +305,32 @@ class CoverArt:
                 TaskType.OPTIONAL,
                 f'Cover art download: {image.types_as_string(translate=False)}',
                 request_factory=create_request,
+                on_cancel=partial(self._download_cancelled, queued),
             )
-            return CoverArtProvider.QueueState.WAIT
         else:
             # We should never end here
             raise CoverArtImageError(f'Cannot handle image {image!r}, no image data and no URL')
 
+    def _process_queued_image(self, queued: QueuedImage):
+        image = queued.image
+        if queued.data is None:
+            return
+        if not image.support_types and self.front_image_found:
+            log.debug("Skipping %r, one front image is already available", image)
+            return
+        if queued.filter and image.can_be_filtered:
+            if not run_image_filters(queued.data, queued.info, self.album, image):
+                return
+        self._processing = True
+        try:
+            self._process_image_data(image, queued.data, queued.info)
+        except CoverArtImageIOError as error:
+            # It doesn't make sense to store/download more images if we can't
+            # save them in the temporary folder, abort.
+            log.error(f'Cover art image IO error, {self.album}, {image}: {error}')
+            self._processing = False
+            self._stop()
+
     def _process_image_data(self, image: CoverArtImage, data, image_info):
         self.album.add_task(
             f'coverart_processing_{id(image)}',
@@ -237,7 +344,8 @@ class CoverArt:
             self.album.error_append("Coverart processing_error: %s" % error)
         self.album.complete_task(f'coverart_processing_{id(image)}')
         self._set_metadata(image)
-        self.next_in_queue()
+        self._processing = False
+        self._run_queue()
 
     def _set_metadata(self, image: CoverArtImage):
         if image.can_be_saved_to_metadata:
@@ -252,8 +360,9 @@ class CoverArt:
         else:
             log.debug("Not storing to metadata: %r", image)
 
-    def _coverart_downloaded(self, image: CoverArtImage, data, http, error):
-        """Handle finished download, save it to metadata"""
+    def _coverart_downloaded(self, queued: QueuedImage, data, http, error):
+        """Handle finished download, the image gets processed in queue order"""
+        image = queued.image
         task_id = f'coverart_{id(image)}'
         self.album.complete_task(task_id)
 
@@ -271,20 +380,30 @@ class CoverArt:
                 },
                 echo=None,
             )
-            try:
-                image_info = imageinfo.identify(data)
-                filters_result = True
-                if image.can_be_filtered:
-                    filters_result = run_image_filters(data, image_info, self.album, image)
-                if filters_result:
-                    # next_in_queue will be called by _process_image_data
-                    self._process_image_data(image, data, image_info)
-                    return
-            except imageinfo.IdentificationError as e:
-                log.warning("Couldn't identify image %r: %s", image, e)
-                return
+            self._set_downloaded_data(queued, data)
 
-        self.next_in_queue()
+        queued.loaded = True
+        self._release_download_slot(queued)
+        self._run_queue()
+
+    def _download_cancelled(self, queued: QueuedImage):
+        """Stop loading images once the download task got cancelled, the
+        download handler won't get called."""
+        self._stop()
+        self._release_download_slot(queued)
+
+    def _release_download_slot(self, queued: QueuedImage):
+        if queued.hostkey is not None:
+            download_slots.release(queued.hostkey)
+            queued.hostkey = None
+
+    def _set_downloaded_data(self, queued: QueuedImage, data):
+        try:
+            queued.info = imageinfo.identify(data)
+            queued.data = data
+            queued.filter = True
+        except imageinfo.IdentificationError as e:
+            log.warning("Couldn't identify image %r: %s", queued.image, e)
 
     def queue_put(self, image: CoverArtImage):
         """Add an image to queue"""
@@ -293,7 +412,11 @@ class CoverArt:
 
     def _queue_get(self) -> CoverArtImage:
         """Get next image and remove it from queue"""
-        return self.__queue.pop(0)
+        return self.__queue.popleft()
+
+    def _queue_peek(self) -> CoverArtImage:
+        """Get next image without removing it from queue"""
+        return self.__queue[0]
 
     def _queue_empty(self):
         """Returns True if the queue is empty"""
@@ -301,7 +424,7 @@ class CoverArt:
 
     def _queue_new(self):
         """Initialize the queue"""
-        self.__queue: list[CoverArtImage] = []
+        self.__queue: deque[CoverArtImage] = deque()
 
     def _message(self, *args, **kwargs):
         """Display message to status bar"""
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Caches of downloaded cover art images and Cover Art Archive indexes.
+
+The same cover art is often used by several releases of a release group or
+gets loaded again when an album is refreshed. Downloaded images are kept on
+disk, so that each image is downloaded once per session. Images downloaded
+in earlier sessions get used as they are for a while and are revalidated
+with their ETag afterwards.
+
+The Cover Art Archive index of a release can change at any time, it is
+revalidated on each load. Unchanged indexes only cost a 304 response.
+
+Cache entries are read and written on worker threads, the results get
+delivered on the main thread.
+"""
+
+from functools import partial
+from hashlib import blake2b
+import json
+import re
+import time
+
+from PyQt6.QtCore import QUrl
+from PyQt6.QtNetwork import QNetworkRequest
+
+from picard import log
+from picard.const import (
+    CAA_INDEX_CACHE_SIZE,
+    COVER_DOWNLOAD_CACHE_SIZE,
+    COVER_DOWNLOAD_CACHE_TTL,
+)
+from picard.util import thread
+from picard.util.diskcache import DiskCache
+
+
+_CAA_IMAGE_RE = re.compile(r'/(\d+(?:-\d+)?)\.\w+$')
+
+
+def download_key(url: QUrl):
+    """Return the cache key for an image URL.
+
+    Cover Art Archive images are identified by their image id and thumbnail
+    size, whatever the release and protocol in the URL.
+    """
+    path = url.path()
+    match = None
+    if url.host().endswith('coverartarchive.org'):
+        match = _CAA_IMAGE_RE.search(path)
+    if match:
+        key = 'caa:' + match.group(1)
+    else:
+        key = '%s%s?%s' % (url.host(), path, url.query())
+    return blake2b(key.encode('utf-8'), digest_size=20).hexdigest()
+
+
+class DownloadCache:
+    """Disk cache of downloaded documents, revalidated with their ETag or
+    Last-Modified date once they are older than ttl seconds."""
+
+    # Entries revalidated once are used for the rest of the session
+    validate_once_per_session = True
+    # Use the cached data if the server can't be reached
+    use_cached_on_error = False
+
+    def __init__(self, directory, max_size, ttl, name):
+        self.disk_cache = DiskCache(directory, max_size, name=name)
+        self.ttl = ttl
+        # Keys of the entries downloaded or revalidated in this session
+        self._validated = set()
+        # Maps the keys of running downloads to their handlers
+        self._downloading = {}
+        # Maps the keys of entries being written to their (info, data)
+        self._writing = {}
+
+    def _read(self, key):
+        entry = self.disk_cache.get(key)
+        if entry is None:
+            return None, None
+        try:
+            header, data = entry.split(b'\n', 1)
+            return json.loads(header), data
+        except ValueError:
+            log.debug("Invalid %s cache entry %s", self.disk_cache.name, key)
+            return None, None
+
+    def _read_async(self, key, callback):
+        """Read the entry for key on a worker thread.
+
+        callback gets called with `(info, data)` on the main thread. Entries
+        still being written are passed to callback right away.
+        """
+        if key in self._writing:
+            callback(*self._writing[key])
+            return
+
+        def read_finished(result=None, error=None):
+            if error:
+                result = (None, None)
+            callback(*result)
+
+        thread.run_task(partial(self._read, key), read_finished)
+
+    def _write(self, key, data, etag, last_modified):
+        info = {'etag': etag, 'last_modified': last_modified, 'fetched': time.time()}
+        if self.validate_once_per_session:
+            self._validated.add(key)
+        self._writing[key] = (info, data)
+        thread.run_task(partial(self._put, key, info, data), partial(self._written, key, info))
+
+    def _put(self, key, info, data):
+        header = json.dumps(info).encode('utf-8')
+        self.disk_cache.put(key, header + b'\n' + data)
+
+    def _written(self, key, info, result=None, error=None):
+        # A newer version of the entry may be written meanwhile
+        if key in self._writing and self._writing[key][0] is info:
+            del self._writing[key]
+
+    def get(self, url: QUrl, callback):
+        """Look up the data of url.
+
+        callback gets called on the main thread with the data if url was
+        downloaded before and is still valid, with None otherwise.
+        """
+        key = download_key(url)
+        self._read_async(key, partial(self._got, url, key, callback))
+
+    def _got(self, url, key, callback, info, data):
+        if info is not None and key not in self._validated:
+            if time.time() - info['fetched'] >= self.ttl:
+                info = None
+            elif self.validate_once_per_session:
+                self._validated.add(key)
+        if info is None:
+            callback(None)
+            return
+        log.debug("Using previously downloaded %s", url.toString())
+        callback(data)
+
+    def download(self, webservice, url: QUrl, handler, priority=True):
+        """Download url and store the data in the cache.
+
+        handler gets called with `(data, http, error)`, like for
+        `WebService.download_url`. Concurrent downloads of the same document
+        are merged into one request. As the request is shared by several
+        albums, it is not returned and can't be aborted by any of them.
+        """
+        key = download_key(url)
+        if key in self._downloading:
+            log.debug("Waiting for running download of %s", url.toString())
+            self._downloading[key].append(handler)
+            return
+        self._downloading[key] = [handler]
+        self._read_async(key, partial(self._start_download, webservice, url, key, priority))
+
+    def _start_download(self, webservice, url, key, priority, info, data):
+        cached = None
+        kwargs = {}
+        if info is not None:
+            cached = (info, data)
+            headers = {}
+            if info['etag']:
+                headers['If-None-Match'] = info['etag']
+            if info.get('last_modified'):
+                headers['If-Modified-Since'] = info['last_modified']
+            if headers:
+                # Revalidate the outdated entry
+                kwargs['headers'] = headers
+                kwargs['cacheloadcontrol'] = QNetworkRequest.CacheLoadControl.AlwaysNetwork
+        webservice.download_url(
+            url=url,
+            handler=partial(self._downloaded, key, cached),
+            priority=priority,
+            **kwargs,
+        )
+
+    def _downloaded(self, key, cached, data, http, error):
+        handlers = self._downloading.pop(key)
+        status = http.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if error:
+            if cached is not None and self.use_cached_on_error and (not status or status >= 500):
+                log.warning("Using previously downloaded %s: %s", http.url().toString(), http.errorString())
+                data = cached[1]
+                error = None
+        else:
+            etag = http.rawHeader(b'ETag').data().decode('latin-1')
+            last_modified = http.rawHeader(b'Last-Modified').data().decode('latin-1')
+            if cached is not None and status == 304:
+                log.debug("Previously downloaded %s is unchanged", http.url().toString())
+                info, data = cached
+                etag = etag or info['etag']
+                last_modified = last_modified or info.get('last_modified', '')
+            if data:
+                self._write(key, data, etag, last_modified)
+        for handler in handlers:
+            handler(data, http, error)
+
+    def log_statistics(self):
+        self.disk_cache.log_statistics()
+
+
+class DownloadedImageCache(DownloadCache):
+    def __init__(self, directory, max_size=COVER_DOWNLOAD_CACHE_SIZE, ttl=COVER_DOWNLOAD_CACHE_TTL):
+        super().__init__(directory, max_size, ttl, name="downloaded cover art")
+
+
+class CaaIndexCache(DownloadCache):
+    """Cache of the Cover Art Archive index documents of releases and
+    release groups. Indexes are revalidated each time they are requested,
+    the cached index is used when the Cover Art Archive can't be reached."""
+
+    validate_once_per_session = False
+    use_cached_on_error = True
+
+    def __init__(self, directory, max_size=CAA_INDEX_CACHE_SIZE):
+        super().__init__(directory, max_size, 0, name="Cover Art Archive index")
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Per host limit of concurrent cover art downloads.
+
+The limit is shared by the cover art downloads of all albums. It never exceeds
+the congestion window the web service rate control currently allows for the
+host, so that requests don't pile up in the web service queue while the host
+is throttled.
+"""
+
+from collections import (
+    Counter,
+    defaultdict,
+)
+
+from picard.config import get_config
+from picard.webservice import ratecontrol
+
+
+class DownloadSlots:
+    def __init__(self):
+        self._active = Counter()
+        self._waiting = defaultdict(list)
+
+    def limit(self, hostkey):
+        config = get_config()
+        limit = config.setting['cover_max_concurrent_downloads']
+        window = int(ratecontrol.CONGESTION_WINDOW_SIZE[hostkey])
+        return max(1, min(limit, window))
+
+    def active(self, hostkey):
+        return self._active[hostkey]
+
+    def acquire(self, hostkey):
+        """Take a download slot for hostkey, returns False if none is available."""
+        if self._active[hostkey] >= self.limit(hostkey):
+            return False
+        self._active[hostkey] += 1
+        return True
+
+    def release(self, hostkey):
+        """Release a download slot and notify the callbacks waiting for hostkey."""
+        self._active[hostkey] -= 1
+        if self._active[hostkey] <= 0:
+            del self._active[hostkey]
+        waiting = self._waiting.pop(hostkey, None)
+        if waiting:
+            for callback in waiting:
+                callback()
+
+    def wait(self, hostkey, callback):
+        """Call callback once a slot for hostkey got released."""
+        if callback not in self._waiting[hostkey]:
+            self._waiting[hostkey].append(callback)
+
+
+download_slots = DownloadSlots()
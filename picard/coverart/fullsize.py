@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Deferred download of full size cover art images.
+
+With the "thumbnails first" option of the Cover Art Archive provider albums
+get loaded with small thumbnails only. The full size images get downloaded
+once the files using them are saved, the files are saved after the thumbnails
+have been replaced.
+"""
+
+from contextlib import ExitStack
+import copy
+from functools import partial
+
+from picard import log
+from picard.coverart.image import (
+    CoverArtImage,
+    CoverArtImageError,
+)
+from picard.coverart.processing import (
+    CoverArtImageProcessing,
+    run_image_filters,
+)
+from picard.util import imageinfo
+
+
+class FullSizeRequest:
+    def __init__(self, thumbnail: CoverArtImage, album):
+        self.thumbnail = thumbnail
+        self.album = album
+        self.files = []
+
+
+def _file_album(file):
+    track = file.parent_item
+    return getattr(track, 'album', None)
+
+
+def _full_size_image(thumbnail: CoverArtImage) -> CoverArtImage:
+    image = copy.copy(thumbnail)
+    image.url = thumbnail.full_size_url
+    image.types = list(thumbnail.types)
+    image.full_size_url = None
+    image.datahash = None
+    image.can_be_filtered = True
+    image.can_be_processed = True
+    return image
+
+
+def _replace_image(obj, old: CoverArtImage, new: CoverArtImage | None):
+    """Replace old by new in the images of obj, remove it if new is None."""
+    images = obj.metadata.images
+    for index, image in enumerate(images):
+        if image is old:
+            if new is None:
+                del images[index]
+            else:
+                images[index] = new
+            obj.metadata_images_changed.emit()
+            return True
+    return False
+
+
+class FullSizeImageLoader:
+    def __init__(self):
+        # Maps files waiting to be saved to the ids of their thumbnails
+        self._waiting_files = {}
+        # Maps the ids of thumbnails being replaced to their requests
+        self._requests = {}
+
+    @property
+    def pending(self):
+        return len(self._requests)
+
+    def save_files(self, files):
+        """Save files, after downloading the full size images they need."""
+        for file in files:
+            if file in self._waiting_files:
+                continue
+            thumbnails = [image for image in file.metadata.images if image.full_size_url is not None]
+            album = _file_album(file)
+            if not thumbnails or album is None:
+                file.save()
+                continue
+            file.set_pending()
+            self._waiting_files[file] = {id(thumbnail) for thumbnail in thumbnails}
+            for thumbnail in thumbnails:
+                request = self._requests.get(id(thumbnail))
+                if request is None:
+                    request = FullSizeRequest(thumbnail, album)
+                    request.files.append(file)
+                    self._requests[id(thumbnail)] = request
+                    self._download(request)
+                else:
+                    request.files.append(file)
+
+    def _download(self, request):
+        url = request.thumbnail.full_size_url
+        tagger = request.album.tagger
+        handler = partial(self._downloaded, request)
+        download_cache = getattr(tagger, 'downloaded_image_cache', None)
+        if download_cache is None:
+            log.debug("Downloading full size cover art image %s", url.toString())
+            tagger.webservice.download_url(url=url, handler=handler, priority=False)
+            return
+        download_cache.get(url, partial(self._downloaded_data_looked_up, request, download_cache))
+
+    def _downloaded_data_looked_up(self, request, download_cache, data):
+        url = request.thumbnail.full_size_url
+        handler = partial(self._downloaded, request)
+        if data is not None:
+            handler(data, None, None)
+        else:
+            log.debug("Downloading full size cover art image %s", url.toString())
+            download_cache.download(request.album.tagger.webservice, url, handler, priority=False)
+
+    def _downloaded(self, request, data, http, error):
+        url = request.thumbnail.full_size_url.toString()
+        if error:
+            log.error("Couldn't download full size cover art image %s: %s", url, http.errorString())
+            self._finish(request, request.thumbnail)
+            return
+        try:
+            info = imageinfo.identify(data)
+        except imageinfo.IdentificationError as e:
+            log.warning("Couldn't identify full size cover art image %s: %s", url, e)
+            self._finish(request, request.thumbnail)
+            return
+        image = _full_size_image(request.thumbnail)
+        if not run_image_filters(data, info, request.album, image):
+            self._finish(request, None)
+            return
+        try:
+            image_processing = CoverArtImageProcessing(request.album)
+            image_processing.run_image_processors(image, data, info, partial(self._processed, request))
+        except CoverArtImageError as e:
+            log.error("Failed storing full size cover art image %s: %s", url, e)
+            self._finish(request, request.thumbnail)
+
+    def _processed(self, request, image, error):
+        if error:
+            request.album.error_append("Coverart processing_error: %s" % error)
+        self._finish(request, image)
+
+    def _finish(self, request, image):
+        thumbnail = request.thumbnail
+        del self._requests[id(thumbnail)]
+        if image is thumbnail:
+            # Save the thumbnail, instead of trying to download it again
+            thumbnail.full_size_url = None
+        else:
+            self._replace(request, image)
+        files = []
+        for file in request.files:
+            waiting = self._waiting_files[file]
+            waiting.discard(id(thumbnail))
+            if not waiting:
+                del self._waiting_files[file]
+                files.append(file)
+        # The images of a file change if its album got refreshed meanwhile,
+        # the new thumbnails need to be replaced as well.
+        self.save_files(files)
+
+    def _replace(self, request, image):
+        thumbnail = request.thumbnail
+        album = request.album
+        log.debug("Replacing %r with %r", thumbnail, image)
+        with ExitStack() as stack:
+            stack.enter_context(album.suspend_metadata_images_update)
+            _replace_image(album, thumbnail, image)
+            for track in album.tracks:
+                stack.enter_context(track.suspend_metadata_images_update)
+                _replace_image(track, thumbnail, image)
+            files = set(album.iterfiles())
+            files.update(request.files)
+            for file in files:
+                if _replace_image(file, thumbnail, image):
+                    file.update(signal=False)
+        album.update(update_tracks=False)
+
+
+full_size_image_loader = FullSizeImageLoader()
@@ -29,6 +29,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from contextlib import contextmanager
+from functools import partial
 import gc
 from hashlib import blake2b
 import os
@@ -62,6 +64,7 @@ from picard.util import (
     is_absolute_path,
     periodictouch,
     sanitize_filename,
+    thread,
 )
 from picard.util.filenaming import (
     make_save_path,
@@ -83,6 +86,8 @@ class DataHash:
 
     __datahashes: WeakValueDictionary[str, 'DataHash'] = WeakValueDictionary()
     __datafile_mutex = QMutex()
+    # Files of released instances, while deleting them is deferred
+    __deferred_files: list[str] | None = None
 
     def __new__(cls, data: bytes, prefix: str = 'picard', suffix: str = ''):
         """Creates a new instance of DataHash for data.
@@ -168,15 +173,48 @@ class DataHash:
         if not self._filename:
             return
 
+        deferred_files = DataHash.__deferred_files
+        if deferred_files is not None:
+            deferred_files.append(self._filename)
+            return
+
+        DataHash._delete_files((self._filename,))
+
+    @staticmethod
+    def _delete_files(filenames):
         DataHash.__datafile_mutex.lock()
         try:
-            os.unlink(self._filename)
-            periodictouch.unregister_file(self._filename)
-        except BaseException as e:
-            log.debug("Failed to delete file %r: %s", self._filename, e)
+            for filename in filenames:
+                try:
+                    os.unlink(filename)
+                    periodictouch.unregister_file(filename)
+                except BaseException as e:
+                    log.debug("Failed to delete file %r: %s", filename, e)
         finally:
             DataHash.__datafile_mutex.unlock()
 
+    @staticmethod
+    @contextmanager
+    def deferred_file_deletion():
+        """Collects the temporary files of all DataHash instances released inside
+        this context and deletes them at once in a background thread when leaving it.
+
+        Meant for releasing many images at once, e.g. when removing many files.
+        """
+        if DataHash.__deferred_files is not None:
+            # Nested usage, the outermost context deletes the files
+            yield
+            return
+        DataHash.__deferred_files = []
+        try:
+            yield
+        finally:
+            filenames = DataHash.__deferred_files
+            DataHash.__deferred_files = None
+            if filenames:
+                log.debug("Deleting %d released image data files", len(filenames))
+                thread.run_task(partial(DataHash._delete_files, filenames))
+
     @staticmethod
     def remove_all_files():
         """This removes all temporary DataHash files stored on disk.
@@ -238,6 +276,9 @@ class CoverArtImage:
         # thumbnail is used to link to another CoverArtImage, ie. for PDFs
         self.thumbnail = None
         self.external_file_coverart = None
+        # full_size_url is set for thumbnails standing in for a full size
+        # image which only gets downloaded once it is needed for saving
+        self.full_size_url = None
         self.can_be_saved_to_tags = True
         self.can_be_saved_to_disk = True
         self.can_be_saved_to_metadata = True
@@ -20,22 +20,22 @@
 
 from collections.abc import Callable
 from functools import partial
-from queue import Queue
+from hashlib import blake2b
+from threading import Lock
 import time
 
 from picard import log
 from picard.album import Album
 from picard.config import get_config
-from picard.const.cover_processing import COVER_PROCESSING_SLEEP
 from picard.coverart.image import (
     CoverArtImage,
     CoverArtImageError,
-    CoverArtImageIOError,
 )
 from picard.coverart.processing import (  # noqa: F401 # pylint: disable=unused-import
     filters,
     processors,
 )
+from picard.coverart.processing.cache import make_cache_key
 from picard.extension_points.cover_art_filters import (
     ext_point_cover_art_filters,
     ext_point_cover_art_metadata_filters,
@@ -67,103 +67,252 @@ def run_image_metadata_filters(metadata):
     return True
 
 
+# Settings the results of the built-in image processors depend on
+PROCESSING_SETTINGS = (
+    'cover_tags_resize',
+    'cover_tags_enlarge',
+    'cover_tags_resize_target_width',
+    'cover_tags_resize_target_height',
+    'cover_tags_resize_mode',
+    'cover_tags_convert_images',
+    'cover_tags_convert_to_format',
+    'cover_file_resize',
+    'cover_file_enlarge',
+    'cover_file_resize_target_width',
+    'cover_file_resize_target_height',
+    'cover_file_resize_mode',
+    'cover_file_convert_images',
+    'cover_file_convert_to_format',
+    'cover_image_quality',
+)
+
+
+def processing_settings_fingerprint(queues):
+    """Return a fingerprint of the processors and the settings they use.
+
+    Returns None if the results can not be cached, either because no
+    processors run at all or because processors provided by plugins are
+    active, which might depend on settings not known here.
+    """
+    if not any(queues.values()):
+        return None
+    parts = []
+    for target in sorted(queues, key=lambda t: t.value):
+        names = []
+        for processor in queues[target]:
+            cls = type(processor)
+            if not cls.__module__.startswith('picard.') or cls.__module__.startswith('picard.plugins.'):
+                return None
+            names.append('%s.%s' % (cls.__module__, cls.__qualname__))
+        parts.append('%s=%s' % (target.name, ','.join(names)))
+    setting = get_config().setting
+    for name in PROCESSING_SETTINGS:
+        parts.append('%s=%r' % (name, setting[name]))
+    return blake2b(';'.join(parts).encode('utf-8'), digest_size=20).hexdigest()
+
+
 def handle_processing_exceptions(func):
-    def wrapper(self, *args, **kwargs):
+    def wrapper(self, job, *args, **kwargs):
         try:
-            func(self, *args, **kwargs)
+            func(self, job, *args, **kwargs)
         except (CoverArtImageError, CoverArtProcessingError) as e:
-            self.errors.put(e)
+            job.errors.append(e)
 
     return wrapper
 
 
+class ProcessingJob:
+    """Processing state of a single cover art image.
+
+    The image gets decoded and the processors for both targets run once, then
+    the processors for tags and external files run as separate tasks on copies
+    of the image. The last finished branch completes the job.
+    """
+
+    def __init__(
+        self,
+        coverartimage: CoverArtImage,
+        initial_data: bytes,
+        image_info: ImageInfo,
+        callback: Callable[[CoverArtImage, Exception | None], None],
+    ):
+        self.coverartimage = coverartimage
+        self.initial_data = initial_data
+        self.image_info = image_info
+        self.callback = callback
+        self.start_time = time.time()
+        self.save_images_to_tags = False
+        self.save_images_to_files = False
+        self.cache_keys = None
+        self.results = {}
+        self.errors = []
+        self.has_branches = False
+        self.finished = False
+        self._pending_branches = 0
+        self._lock = Lock()
+
+    def start_branches(self, count):
+        self._pending_branches = count
+        self.has_branches = count > 0
+
+    def finish_branch(self):
+        """Mark a branch as finished, returns True for the last one."""
+        with self._lock:
+            self._pending_branches -= 1
+            return self._pending_branches == 0
+
+
 class CoverArtImageProcessing:
     def __init__(self, album: Album):
         self.album = album
         self.queues = get_cover_art_processors()
-        self.task_counter: thread.TaskCounter = thread.TaskCounter()
-        self.errors = Queue()
+        self.cache = getattr(album.tagger, 'processed_image_cache', None)
+        self.cache_fingerprint = None
+        if self.cache is not None:
+            self.cache_fingerprint = processing_settings_fingerprint(self.queues)
+
+    def _cache_keys(self, initial_data, targets):
+        if self.cache_fingerprint is None or not targets:
+            return None
+        source_hash = blake2b(initial_data).hexdigest()
+        return {target: make_cache_key(source_hash, target, self.cache_fingerprint) for target in targets}
+
+    def _load_cached_results(self, cache_keys, initial_data):
+        results = {}
+        for target, key in cache_keys.items():
+            data = self.cache.get(key)
+            if data is None:
+                return None
+            # Empty entries mark images not changed by the processors
+            results[target] = data or initial_data
+        return results
+
+    def _store_cached_results(self, cache_keys, initial_data, results):
+        for target, key in cache_keys.items():
+            data = results[target]
+            self.cache.put(key, b'' if data == initial_data else data)
+
+    def _run_task(self, func, next_func=None, priority=0):
+        thread.run_task(
+            func,
+            next_func=next_func,
+            priority=priority,
+            thread_pool=self.album.tagger.image_processing_thread_pool,
+        )
 
     @handle_processing_exceptions
     def _run_processors_queue(
         self,
-        coverartimage: CoverArtImage,
-        initial_data: bytes,
-        start_time: int | float,
-        save_images_to_tags: bool,
-        save_images_to_files: bool,
+        job: ProcessingJob,
         image: ProcessingImage,
         target: ImageProcessor.Target,
     ):
-        data = initial_data
+        data = job.initial_data
         try:
             queue = self.queues[target]
             if queue:
                 for processor in queue:
                     processor.run(image, target)
-                    time.sleep(COVER_PROCESSING_SLEEP)
                 data = image.get_result()
-        except CoverArtProcessingError as e:
-            raise e
+            job.results[target] = data
         finally:
             if target in ImageProcessor.Target.SAME | ImageProcessor.Target.TAGS:
-                coverartimage.set_data(data if save_images_to_tags else initial_data)
-            if save_images_to_files and target in ImageProcessor.Target.SAME | ImageProcessor.Target.FILE:
-                coverartimage.set_external_file_data(data)
+                job.coverartimage.set_data(data if job.save_images_to_tags else job.initial_data)
+            if job.save_images_to_files and target in ImageProcessor.Target.SAME | ImageProcessor.Target.FILE:
+                job.coverartimage.set_external_file_data(data)
             log.debug(
                 "Image processing for %s cover art image %s finished in %d ms",
                 target.name,
-                coverartimage,
-                1000 * (time.time() - start_time),
+                job.coverartimage,
+                1000 * (time.time() - job.start_time),
             )
 
+    def _load_from_cache(self, job: ProcessingJob):
+        """Set the processed images from the cache, returns False if not cached."""
+        targets = []
+        if job.save_images_to_tags:
+            targets.append(ImageProcessor.Target.TAGS)
+        if job.save_images_to_files:
+            targets.append(ImageProcessor.Target.FILE)
+        job.cache_keys = self._cache_keys(job.initial_data, targets)
+        if not job.cache_keys:
+            return False
+        cached_results = self._load_cached_results(job.cache_keys, job.initial_data)
+        if cached_results is None:
+            return False
+        job.coverartimage.set_data(cached_results.get(ImageProcessor.Target.TAGS, job.initial_data))
+        if job.save_images_to_files:
+            job.coverartimage.set_external_file_data(cached_results[ImageProcessor.Target.FILE])
+        log.debug(
+            "Processed cover art image %s loaded from cache in %d ms",
+            job.coverartimage,
+            1000 * (time.time() - job.start_time),
+        )
+        return True
+
     @handle_processing_exceptions
-    def _run_image_processors(
-        self,
-        coverartimage: CoverArtImage,
-        initial_data: bytes,
-        image_info: ImageInfo,
-    ):
+    def _start_job(self, job: ProcessingJob):
+        """Decode the image and run the common processors.
+
+        Starts the tasks for the tags and file processors, the job is complete
+        once job.finish_branch() returned True. Jobs without branches are
+        complete right away.
+        """
         config = get_config()
+        job.save_images_to_tags = config.setting['save_images_to_tags']
+        job.save_images_to_files = config.setting['save_images_to_files']
         try:
-            start_time = time.time()
-            image = ProcessingImage(initial_data, image_info)
-            save_images_to_tags = config.setting['save_images_to_tags']
-            save_images_to_files = config.setting['save_images_to_files']
-
-            run_queue_common = partial(
-                self._run_processors_queue,
-                coverartimage,
-                initial_data,
-                start_time,
-                save_images_to_tags,
-                save_images_to_files,
-            )
+            if not (job.save_images_to_tags or job.save_images_to_files):
+                job.coverartimage.set_data(job.initial_data)
+                return
+            if self._load_from_cache(job):
+                return
 
-            # Run processors for both tags and external files in this thread, as this is the basis
-            # for the specialized processors.
-            if save_images_to_files or save_images_to_tags:
-                run_queue_common(image, ImageProcessor.Target.SAME)
-            else:
-                coverartimage.set_data(initial_data)
-
-            # Start separate threads to run tag and file only processors in parallel
-            sub_task_counter = thread.TaskCounter()
-            if save_images_to_files:
-                run_queue_files = partial(run_queue_common, image.copy(), ImageProcessor.Target.FILE)
-                thread.run_task(run_queue_files, task_counter=sub_task_counter)
-            if save_images_to_tags:
-                run_queue_tags = partial(run_queue_common, image.copy(), ImageProcessor.Target.TAGS)
-                thread.run_task(run_queue_tags, task_counter=sub_task_counter)
-            sub_task_counter.wait_for_tasks()
+            image = ProcessingImage(job.initial_data, job.image_info)
+            # Run processors for both tags and external files first, as this
+            # is the basis for the specialized processors.
+            self._run_processors_queue(job, image, ImageProcessor.Target.SAME)
         except IdentificationError as e:
             raise CoverArtProcessingError(e) from e
         except CoverArtProcessingError:
-            coverartimage.set_data(initial_data)
-            if config.setting['save_images_to_files']:
-                coverartimage.set_external_file_data(initial_data)
+            job.coverartimage.set_data(job.initial_data)
+            if job.save_images_to_files:
+                job.coverartimage.set_external_file_data(job.initial_data)
             raise
 
+        # Run tag and file only processors in parallel. They get precedence
+        # over decoding further images, this limits the number of decoded
+        # images held in memory to the number of threads.
+        branches = []
+        if job.save_images_to_files:
+            branches.append(ImageProcessor.Target.FILE)
+        if job.save_images_to_tags:
+            branches.append(ImageProcessor.Target.TAGS)
+        job.start_branches(len(branches))
+        for target in branches:
+            self._run_task(partial(self._run_branch, job, image.copy(), target), priority=1)
+
+    def _run_branch(self, job: ProcessingJob, image: ProcessingImage, target: ImageProcessor.Target):
+        try:
+            self._run_processors_queue(job, image, target)
+        finally:
+            if job.finish_branch():
+                self._complete_job(job)
+
+    def _complete_job(self, job: ProcessingJob):
+        results = job.results
+        if job.cache_keys and ImageProcessor.Target.SAME in results and results.keys() >= job.cache_keys.keys():
+            self._store_cached_results(job.cache_keys, job.initial_data, results)
+        thread.to_main(self._finish_job, job)
+
+    def _finish_job(self, job: ProcessingJob, error=None):
+        if job.finished:
+            return
+        job.finished = True
+        for processing_error in job.errors:
+            self.album.error_append(processing_error)
+        job.callback(job.coverartimage, error)
+
     def run_image_processors(
         self,
         coverartimage: CoverArtImage,
@@ -171,23 +320,25 @@ class CoverArtImageProcessing:
         image_info: ImageInfo,
         callback: Callable[[CoverArtImage, Exception | None], None],
     ):
+        """Process the image data and set the results on coverartimage.
+
+        The processing runs in the image processing thread pool, callback gets
+        called on the main thread once all processing has finished.
+        """
         if coverartimage.can_be_processed:
-            run_processors = partial(self._run_image_processors, coverartimage, initial_data, image_info)
+            job = ProcessingJob(coverartimage, initial_data, image_info, callback)
 
-            def next_func(result, error=None):
-                callback(coverartimage, error)
+            def next_func(result=None, error=None):
+                # Jobs with branches get completed by the last finished branch
+                if error or not job.has_branches:
+                    self._finish_job(job, error)
 
-            thread.run_task(run_processors, next_func=next_func, task_counter=self.task_counter)
+            self._run_task(partial(self._start_job, job), next_func=next_func)
         else:
             coverartimage.set_data(initial_data)
             callback(coverartimage, None)
 
-    def wait_for_processing(self):
-        self.task_counter.wait_for_tasks()
-        has_io_error = False
-        while not self.errors.empty():
-            error = self.errors.get()
-            self.album.error_append(error)
-            if isinstance(error, CoverArtImageIOError):
-                has_io_error = True
-        return has_io_error
+    def finish_processing(self):
+        """Called once all images of the album have been processed."""
+        if self.cache_fingerprint is not None:
+            self.cache.log_statistics()
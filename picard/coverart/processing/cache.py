@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Disk cache for the results of the cover art image processors.
+
+Resizing and converting cover art requires decoding and re-encoding the
+images, which is by far the most expensive part of loading the cover art of
+an album. The results only depend on the source image and the processing
+settings, so they are kept on disk and reused across albums and sessions.
+"""
+
+from hashlib import blake2b
+
+from picard.const.cover_processing import COVER_PROCESSING_CACHE_SIZE
+from picard.util.diskcache import DiskCache
+
+
+def make_cache_key(source_hash, target, fingerprint):
+    """Return the cache key for processing the source image for the given target."""
+    key = '%s:%s:%s' % (source_hash, target.name, fingerprint)
+    return blake2b(key.encode('utf-8'), digest_size=20).hexdigest()
+
+
+class ProcessedImageCache(DiskCache):
+    """Disk cache of processed images.
+
+    An empty entry means the processing did not change the source image.
+    """
+
+    def __init__(self, directory, max_size=COVER_PROCESSING_CACHE_SIZE):
+        super().__init__(directory, max_size, name="processed cover art")
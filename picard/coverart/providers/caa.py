@@ -35,6 +35,7 @@ from collections import (
     namedtuple,
 )
 
+from PyQt6.QtCore import QUrl
 from PyQt6.QtNetwork import (
     QNetworkReply,
     QNetworkRequest,
@@ -62,12 +63,16 @@ from picard.i18n import (
     N_,
     gettext as _,
 )
+from picard.util import load_json
 from picard.webservice import ratecontrol
 
 from picard.ui.caa_types_selector import CAATypesSelectorDialog
 from picard.ui.forms.ui_provider_options_caa import Ui_CaaOptions
 
 
+# Size of the thumbnails used with the "thumbnails first" option
+THUMBNAILS_FIRST_SIZE = 250
+
 CaaSizeItem = namedtuple('CaaSizeItem', ['thumbnail', 'label'])
 CaaThumbnailListItem = namedtuple('CAAThumbnailListItem', ['url', 'width'])
 
@@ -147,6 +152,7 @@ class ProviderOptionsCaa(ProviderOptions):
         self.ui.cb_image_size.setCurrentIndex(index)
 
         self.ui.cb_approved_only.setChecked(config.setting['caa_approved_only'])
+        self.ui.cb_thumbnails_first.setChecked(config.setting['caa_thumbnails_first'])
         self.ui.restrict_images_types.setChecked(config.setting['caa_restrict_image_types'])
         self.caa_image_types = config.setting['caa_image_types']
         self.caa_image_types_to_omit = config.setting['caa_image_types_to_omit']
@@ -157,6 +163,7 @@ class ProviderOptionsCaa(ProviderOptions):
         size = self.ui.cb_image_size.currentData()
         config.setting['caa_image_size'] = size
         config.setting['caa_approved_only'] = self.ui.cb_approved_only.isChecked()
+        config.setting['caa_thumbnails_first'] = self.ui.cb_thumbnails_first.isChecked()
         config.setting['caa_restrict_image_types'] = self.ui.restrict_images_types.isChecked()
         config.setting['caa_image_types'] = self.caa_image_types
         config.setting['caa_image_types_to_omit'] = self.caa_image_types_to_omit
@@ -197,6 +204,7 @@ class CoverArtProviderCaa(CoverArtProvider):
             self.included_types = {t.lower() for t in config.setting['caa_image_types']}
             self.excluded_types = {t.lower() for t in config.setting['caa_image_types_to_omit']}
             self.included_types_count = len(self.included_types)
+        self._index_cancelled = False
 
     @property
     def _has_suitable_artwork(self):
@@ -260,8 +268,18 @@ class CoverArtProviderCaa(CoverArtProvider):
 
     def queue_images(self):
         task_id = f'caa_json_{self.metadata["musicbrainz_albumid"]}'
+        index_cache = getattr(self.album.tagger, 'caa_index_cache', None)
 
         def create_request():
+            if index_cache is not None:
+                # The download is shared by albums requesting the same index
+                # and can't be aborted
+                index_cache.download(
+                    self.album.tagger.webservice,
+                    QUrl(CAA_URL + self._caa_path),
+                    self._caa_index_downloaded,
+                )
+                return None
             return self.album.tagger.webservice.get_url(
                 url=CAA_URL + self._caa_path,
                 handler=self._caa_json_downloaded,
@@ -275,10 +293,28 @@ class CoverArtProviderCaa(CoverArtProvider):
             TaskType.OPTIONAL,
             f'CAA JSON metadata for {self.metadata["musicbrainz_albumid"]}',
             request_factory=create_request,
+            on_cancel=self._caa_index_cancelled if index_cache is not None else None,
         )
         # we will call next_in_queue() after json parsing
         return CoverArtProvider.QueueState.WAIT
 
+    def _caa_index_cancelled(self):
+        """The shared index download can't be aborted, its result gets ignored instead"""
+        self._index_cancelled = True
+
+    def _caa_index_downloaded(self, data, http, error):
+        """Parse the CAA JSON file downloaded through the index cache"""
+        if self._index_cancelled:
+            log.debug("Ignoring CAA JSON for %s, the album was cancelled", self.metadata['musicbrainz_albumid'])
+            return
+        if not error:
+            try:
+                data = load_json(data)
+            except ValueError as e:
+                log.error("Unable to parse the CAA JSON for %s: %s", http.url().toString(), e)
+                error = e
+        self._caa_json_downloaded(data, http, error)
+
     def _caa_json_downloaded(self, data, http, error):
         """Parse CAA JSON file and queue CAA cover art images for download"""
         task_id = f'caa_json_{self.metadata["musicbrainz_albumid"]}'
@@ -330,12 +366,25 @@ class CoverArtProviderCaa(CoverArtProvider):
                                 continue
                             # FIXME: try other urls in case of 404
                             url = thumbnail_list[0].url
+                        full_size_url = None
+                        if config.setting['caa_thumbnails_first'] and not is_pdf:
+                            # Load the album with a small thumbnail, the image
+                            # of the configured size is downloaded when saving
+                            small_list = caa_url_fallback_list(THUMBNAILS_FIRST_SIZE, image['thumbnails'])
+                            if small_list and small_list[0].url != url:
+                                full_size_url = url
+                                url = small_list[0].url
                         coverartimage = self.coverartimage_class(
                             url,
                             types=image['types'],
                             is_front=image['front'],
                             comment=image['comment'],
                         )
+                        if full_size_url is not None:
+                            coverartimage.full_size_url = QUrl(full_size_url)
+                            # Filters and processors run on the full size image
+                            coverartimage.can_be_filtered = False
+                            coverartimage.can_be_processed = False
                         if thumbnail_list and is_pdf:
                             # thumbnail will be used to "display" PDF in info
                             # dialog
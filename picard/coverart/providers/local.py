@@ -22,9 +22,11 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from functools import partial
 import os
 import re
 
+from picard.album_requests import TaskType
 from picard.config import get_config
 from picard.coverart.image import LocalFileCoverArtImage
 from picard.coverart.providers.provider import (
@@ -33,6 +35,8 @@ from picard.coverart.providers.provider import (
 )
 from picard.coverart.utils import CAA_TYPES
 from picard.i18n import N_
+from picard.util import thread
+from picard.util.dirlisting import directory_listings
 
 from picard.ui.forms.ui_provider_options_local import Ui_LocalOptions
 
@@ -73,32 +77,52 @@ class CoverArtProviderLocal(CoverArtProvider):
     def queue_images(self):
         config = get_config()
         regex = config.setting['local_cover_regex']
-        if regex:
-            _match_re = re.compile(regex, re.IGNORECASE)
-            dirs_done = set()
-
-            for file in self.album.iterfiles():
-                current_dir = os.path.dirname(file.filename)
-                if current_dir in dirs_done:
-                    continue
-                dirs_done.add(current_dir)
-                for image in self.find_local_images(current_dir, _match_re):
-                    self.queue_put(image)
-        return CoverArtProvider.QueueState.FINISHED
+        if not regex:
+            return CoverArtProvider.QueueState.FINISHED
+        match_re = re.compile(regex, re.IGNORECASE)
+        dirs = []
+        for file in self.album.iterfiles():
+            current_dir = os.path.dirname(file.filename)
+            if current_dir not in dirs:
+                dirs.append(current_dir)
+        if not dirs:
+            return CoverArtProvider.QueueState.FINISHED
+        # Scanning the directories can be slow, e.g. on network shares
+        task_id = f'local_cover_art_{self.album.id}'
+        self.album.add_task(task_id, TaskType.OPTIONAL, f'Local cover art for {self.album.id}')
+        thread.run_task(
+            partial(self._find_all_local_images, dirs, match_re),
+            partial(self._local_images_found, task_id),
+        )
+        # we will call next_in_queue() once the images are found
+        return CoverArtProvider.QueueState.WAIT
+
+    def _find_all_local_images(self, dirs, match_re):
+        images = []
+        for current_dir in dirs:
+            images.extend(self.find_local_images(current_dir, match_re))
+        return images
+
+    def _local_images_found(self, task_id, result=None, error=None):
+        self.album.complete_task(task_id)
+        if error:
+            self.error("Local cover art error: %s" % error)
+        else:
+            for image in result:
+                self.queue_put(image)
+        self.next_in_queue()
 
     def get_types(self, string):
         found = {x.lower() for x in self._types_split_re.split(string) if x}
         return list(found.intersection(self._known_types))
 
     def find_local_images(self, current_dir, match_re):
-        for root, _dirs, files in os.walk(current_dir):
+        for root, _dirs, files in directory_listings.walk(current_dir):
             for filename in files:
                 m = match_re.search(filename)
                 if not m:
                     continue
-                filepath = os.path.join(current_dir, root, filename)
-                if not os.path.exists(filepath):
-                    continue
+                filepath = os.path.join(root, filename)
                 try:
                     type_from_filename = self.get_types(m.group(1))
                 except IndexError:
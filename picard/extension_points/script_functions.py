@@ -112,7 +112,11 @@ def register_script_function(
     passed to ``function``.
     If ``check_argcount`` is ``False`` the number of arguments passed to the
     function will not be verified.
-    If ``documentation`` is ``None``, ``function.__doc__`` will be used."""
+    If ``documentation`` is ``None``, ``function.__doc__`` will be used.
+
+    Script functions are not only called on the main thread. Tagger scripts
+    of loaded albums and file naming scripts run on worker threads, so the
+    functions must not access the user interface."""
 
     argspec = getfullargspec(function)
 
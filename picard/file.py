@@ -109,12 +109,14 @@ from picard.util import (
     thread,
     tracknum_and_title_from_filename,
 )
+from picard.util.dirlisting import directory_listings
 from picard.util.filenaming import (
     get_available_filename,
     make_save_path,
     make_short_filename,
     move_ensure_casing,
 )
+from picard.util.picturecache import encoded_pictures
 from picard.util.scripttofilename import script_to_filename_with_metadata
 
 from picard.ui.filter import Filter
@@ -249,10 +251,11 @@ class File(MetadataItem):
         self.filename: str = filename
         self.base_filename: str = os.path.basename(filename)
         self._state = File.State.UNDEFINED
+        self._is_saved = False
+        self.similarity = 1.0
         self.state: File.State = File.State.PENDING
         self.error_type: File.ErrorType = File.ErrorType.UNKNOWN
 
-        self.similarity = 1.0
         self.parent_item: 'Cluster | Track | None' = None
 
         self._lookup_task = None
@@ -454,6 +457,8 @@ class File(MetadataItem):
         run_file_pre_save_processors(self)
         metadata = Metadata()
         metadata.copy(self.metadata)
+        # Files saved together share the encoded cover art images
+        encoded_pictures.start_saving()
         thread.run_task(
             partial(self._save_and_rename, self.filename, metadata),
             self._saving_finished,
@@ -530,9 +535,16 @@ class File(MetadataItem):
         # Save cover art images
         if config.setting['save_images_to_files']:
             self._save_images(os.path.dirname(new_filename), metadata)
+        # Directory contents changed by moving the file or saving images
+        if new_filename != old_filename:
+            directory_listings.invalidate(os.path.dirname(old_filename), parents=True)
+            directory_listings.invalidate(os.path.dirname(new_filename), parents=True)
+        elif config.setting['save_images_to_files']:
+            directory_listings.invalidate(os.path.dirname(new_filename))
         return new_filename
 
     def _saving_finished(self, result=None, error=None):
+        encoded_pictures.finish_saving()
         # Handle file removed before save
         # Result is None if save was skipped
         if (self.state == File.State.REMOVED or self.tagger.stopping) and result is None:
@@ -812,6 +824,21 @@ class File(MetadataItem):
     def is_saved(self) -> bool:
         return self.similarity == 1.0 and self.state == File.State.NORMAL
 
+    def _update_saved_state(self):
+        """Inform the album the file belongs to if the saved state changed.
+
+        Albums keep track of their unsaved files incrementally instead of
+        checking all files on each update.
+        """
+        is_saved = self.is_saved()
+        if is_saved == self._is_saved:
+            return
+        self._is_saved = is_saved
+        parent_item = self.parent_item
+        album = getattr(parent_item, 'album', None)
+        if album is not None:
+            album.update_file_saved_state(self)
+
     def _tags_to_update(self, ignored_tags):
         for name in set(self.metadata) | set(self.orig_metadata):
             if name.startswith('~'):
@@ -845,6 +872,7 @@ class File(MetadataItem):
                         self.state = File.State.CHANGED
                     else:
                         self.state = File.State.NORMAL
+            self._update_saved_state()
         if signal:
             log.debug("Updating file %r", self)
             self.update_item()
@@ -977,6 +1005,7 @@ class File(MetadataItem):
             File.num_pending_files -= 1
             self.tagger.tagger_stats_changed.emit()
         self._state = state
+        self._update_saved_state()
 
     def column(self, column: str) -> str:
         value = super().column(column)
@@ -1114,7 +1143,7 @@ class File(MetadataItem):
 
     def update_item(self, update_selection=True):
         if self.ui_item:
-            self.ui_item.update(update_selection=update_selection)
+            self.ui_item.schedule_update(update_selection=update_selection)
 
     def iterfiles(self, save=False):
         yield self
@@ -55,6 +55,7 @@ from picard.util.filenaming import (
     move_ensure_casing,
     replace_extension,
 )
+from picard.util.picturecache import encoded_pictures
 
 from .mutagenext import aac
 
@@ -237,7 +238,7 @@ class APEv2File(File):
             cover_filename = 'Cover Art (Front)'
             cover_filename += image.extension
             tags['Cover Art (Front)'] = mutagen.apev2.APEValue(
-                cover_filename.encode('ascii') + b'\0' + image.data, mutagen.apev2.BINARY
+                cover_filename.encode('ascii') + b'\0' + encoded_pictures.data(image), mutagen.apev2.BINARY
             )
             break
             # can't save more than one item with the same name
@@ -44,6 +44,7 @@ from picard.file import File
 from picard.formats.mutagenext import delall_ci
 from picard.metadata import Metadata
 from picard.util import encode_filename
+from picard.util.picturecache import encoded_pictures
 
 
 def unpack_image(data):
@@ -270,7 +271,10 @@ class ASFFile(File):
                 tags['WM/Picture'] = cover
         cover = []
         for image in metadata.images.to_be_saved_to_tags():
-            tag_data = pack_image(image.mimetype, image.data, image.id3_type, image.comment)
+            key = ('asf', image.mimetype, image.id3_type, image.comment)
+            tag_data = encoded_pictures.get(
+                image, key, lambda: pack_image(image.mimetype, image.data, image.id3_type, image.comment)
+            )
             cover.append(ASFByteArrayAttribute(tag_data))
         if cover:
             tags['WM/Picture'] = cover
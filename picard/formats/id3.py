@@ -70,6 +70,7 @@ from picard.util import (
     encode_filename,
     sanitize_date,
 )
+from picard.util.picturecache import encoded_pictures
 
 
 try:
@@ -763,7 +764,7 @@ class ID3File(File):
                     mime=image.mimetype,
                     type=image.id3_type,
                     desc=id3text(desctag, Id3Encoding.LATIN1),
-                    data=image.data,
+                    data=encoded_pictures.data(image),
                 )
             )
 
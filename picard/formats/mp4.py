@@ -49,6 +49,7 @@ from picard.file import File
 from picard.formats.mutagenext import delall_ci
 from picard.metadata import Metadata
 from picard.util import encode_filename
+from picard.util.picturecache import encoded_pictures
 
 
 def _add_text_values_to_metadata(metadata, name, values):
@@ -333,9 +334,9 @@ class MP4File(File):
         covr = []
         for image in metadata.images.to_be_saved_to_tags():
             if image.mimetype == 'image/jpeg':
-                covr.append(MP4Cover(image.data, MP4Cover.FORMAT_JPEG))
+                covr.append(MP4Cover(encoded_pictures.data(image), MP4Cover.FORMAT_JPEG))
             elif image.mimetype == 'image/png':
-                covr.append(MP4Cover(image.data, MP4Cover.FORMAT_PNG))
+                covr.append(MP4Cover(encoded_pictures.data(image), MP4Cover.FORMAT_PNG))
         if covr:
             tags['covr'] = covr
 
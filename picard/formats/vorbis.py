@@ -31,6 +31,7 @@
 
 
 import base64
+from functools import partial
 import re
 
 import mutagen.flac
@@ -56,6 +57,7 @@ from picard.util import (
     encode_filename,
     sanitize_date,
 )
+from picard.util.picturecache import encoded_pictures
 
 
 FLAC_MAX_BLOCK_SIZE = 2**24 - 1  # FLAC block size is limited to a 24 bit integer
@@ -247,6 +249,27 @@ class VCommentFile(File):
         self._info(metadata, file)
         return metadata
 
+    @staticmethod
+    def _create_picture(image, data, is_opus):
+        picture = mutagen.flac.Picture()
+        picture.data = data
+        picture.mime = image.mimetype
+        picture.desc = image.comment
+        picture.type = image.id3_type
+
+        # libopus expects width, height and depth to be either all zero
+        # or all non-zero. As depth is not easily available, do not set
+        # width and height either. See PICARD-2909.
+        if not is_opus:
+            picture.width = image.width
+            picture.height = image.height
+        return picture
+
+    @classmethod
+    def _encode_picture(cls, image, is_opus):
+        picture = cls._create_picture(image, image.data, is_opus)
+        return base64.b64encode(picture.write()).decode('ascii')
+
     def _save(self, filename, metadata):
         """Save metadata to the file."""
         log.debug("Saving file %r", filename)
@@ -311,20 +334,8 @@ class VCommentFile(File):
             tags.setdefault('DISCTOTAL', []).append(metadata['totaldiscs'])
 
         for image in images_to_save:
-            picture = mutagen.flac.Picture()
-            picture.data = image.data
-            picture.mime = image.mimetype
-            picture.desc = image.comment
-            picture.type = image.id3_type
-
-            # libopus expects width, height and depth to be either all zero
-            # or all non-zero. As depth is not easily available, do not set
-            # width and height either. See PICARD-2909.
-            if not is_opus:
-                picture.width = image.width
-                picture.height = image.height
-
             if is_flac:
+                picture = self._create_picture(image, encoded_pictures.data(image), is_opus)
                 # See https://xiph.org/flac/format.html#metadata_block_picture
                 expected_block_size = 8 * 4 + len(picture.data) + len(picture.mime) + len(picture.desc.encode('UTF-8'))
                 if expected_block_size > FLAC_MAX_BLOCK_SIZE:
@@ -337,7 +348,10 @@ class VCommentFile(File):
                     continue
                 file.add_picture(picture)
             else:
-                tags.setdefault('METADATA_BLOCK_PICTURE', []).append(base64.b64encode(picture.write()).decode('ascii'))
+                # The encoded block is the same for all files using the image
+                key = ('vorbis', image.mimetype, image.comment, image.id3_type, is_opus)
+                block = encoded_pictures.get(image, key, partial(self._encode_picture, image, is_opus))
+                tags.setdefault('METADATA_BLOCK_PICTURE', []).append(block)
 
         file.tags.update(tags)
 
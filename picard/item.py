@@ -43,7 +43,7 @@ from picard.config import get_config
 from picard.i18n import ngettext
 from picard.metadata import Metadata
 from picard.util import IgnoreUpdatesContext
-from picard.util.imagelist import ImageList
+from picard.util.imagelist import ImageMultiset
 
 
 if TYPE_CHECKING:
@@ -150,23 +150,6 @@ class Item:
         self._errors = []
 
 
-class ImageListState:
-    def __init__(self):
-        self.images = {}
-        self.has_common_images = True
-        self.first_obj = True
-
-    def process_images(self, src_obj_metadata):
-        src_dict = src_obj_metadata.images.hash_dict()
-        prev_len = len(self.images)
-        self.images.update(src_dict)
-        if len(self.images) != prev_len:
-            if not self.first_obj:
-                self.has_common_images = False
-        if self.first_obj:
-            self.first_obj = False
-
-
 class MetadataItem(QtCore.QObject, Item):
     metadata_images_changed = QtCore.pyqtSignal()
 
@@ -177,6 +160,8 @@ class MetadataItem(QtCore.QObject, Item):
         self.orig_metadata: Metadata = Metadata()
         self.update_children_metadata_attrs = {}
         self._iter_children_items_metadata_ignore_attrs = {}
+        # Reference counted images of the children, per metadata attribute
+        self._children_images = {}
         self.suspend_metadata_images_update = IgnoreUpdatesContext(on_exit=self.update_metadata_images)
         self._genres = Counter()
         self._folksonomy_tags = Counter()
@@ -245,41 +230,83 @@ class MetadataItem(QtCore.QObject, Item):
                 continue
             yield getattr(s, metadata_attr)
 
-    @staticmethod
-    def get_sources_metadata_images(sources_metadata):
-        images = set()
-        for s in sources_metadata:
-            images = images.union(s.images)
-        return images
+    def _iter_children_images_sources(self, metadata_attr):
+        for s in self.children_metadata_items():
+            if metadata_attr not in s._iter_children_items_metadata_ignore_attrs:
+                yield s
+
+    def _store_children_images(self, metadata_attr, multiset, images_changed):
+        metadata = getattr(self, metadata_attr)
+        common_changed = metadata.has_common_images != multiset.has_common_images
+        if images_changed:
+            metadata.images = multiset.to_imagelist()
+        metadata.has_common_images = multiset.has_common_images
+        return images_changed or common_changed
+
+    def _update_children_images(self, metadata_attr, sources, remove=False):
+        multiset = self._children_images.get(metadata_attr)
+        metadata = getattr(self, metadata_attr)
+        if multiset is None or not multiset.is_result(metadata.images):
+            # The images were never built from the children or got modified
+            # by something else, start over.
+            return self._rebuild_children_images(metadata_attr)
+        images_changed = False
+        for s in sources:
+            if metadata_attr in s._iter_children_items_metadata_ignore_attrs:
+                continue
+            if remove:
+                images_changed |= multiset.discard(s)
+            else:
+                images_changed |= multiset.add(s, getattr(s, metadata_attr).images)
+        return self._store_children_images(metadata_attr, multiset, images_changed)
+
+    def _rebuild_children_images(self, metadata_attr):
+        multiset = self._children_images.setdefault(metadata_attr, ImageMultiset())
+        metadata = getattr(self, metadata_attr)
+        sources = list(self._iter_children_images_sources(metadata_attr))
+        images_changed = multiset.retain(set(sources))
+        for s in sources:
+            # Only children with modified images get recounted
+            images_changed |= multiset.add(s, getattr(s, metadata_attr).images)
+        if not multiset.is_result(metadata.images):
+            images_changed = set(multiset.hashes()) != set(metadata.images.hash_dict())
+            if not images_changed:
+                multiset.adopt(metadata.images)
+        return self._store_children_images(metadata_attr, multiset, images_changed)
 
     def remove_metadata_images_from_children(self, removed_sources):
         """Remove the images in the metadata of `removed_sources` from the metadata.
 
+        Images still used by other children are kept.
+
         Args:
             removed_sources: List of child objects (`Track` or `File`) which's metadata images should be removed from
+
+        Returns:
+            bool: True, if images where changed, False otherwise
         """
         changed = False
 
         for metadata_attr in self.update_children_metadata_attrs:
-            removed_images = self.get_sources_metadata_images(getattr(s, metadata_attr) for s in removed_sources)
-            sources_metadata = list(self.iter_children_items_metadata(metadata_attr))
-            metadata = getattr(self, metadata_attr)
-            changed |= metadata.remove_images(sources_metadata, removed_images)
+            changed |= self._update_children_images(metadata_attr, removed_sources, remove=True)
 
         return changed
 
     def add_metadata_images_from_children(self, added_sources):
         """Add the images in the metadata of `added_sources` to the metadata.
 
+        Adding a child again updates the images counted for it.
+
         Args:
             added_sources: List of child objects (`Track` or `File`) which's metadata images should be added to current object
+
+        Returns:
+            bool: True, if images where changed, False otherwise
         """
         changed = False
 
         for metadata_attr in self.update_children_metadata_attrs:
-            added_images = self.get_sources_metadata_images(getattr(s, metadata_attr) for s in added_sources)
-            metadata = getattr(self, metadata_attr)
-            changed |= metadata.add_images(added_images)
+            changed |= self._update_children_images(metadata_attr, added_sources)
 
         return changed
 
@@ -289,8 +316,8 @@ class MetadataItem(QtCore.QObject, Item):
         Based on the type of the current object, this will update `self.metadata.images` to
         represent the metadata images of all children (`Track` or `File` objects).
 
-        This method will iterate over all children and completely rebuild
-        `self.metadata.images`. Whenever possible the more specific functions
+        This method will iterate over all children, but only recounts the images of
+        children which changed. Whenever possible the more specific functions
         `add_metadata_images_from_children` or `remove_metadata_images_from_children` should be used.
 
         Returns:
@@ -299,15 +326,7 @@ class MetadataItem(QtCore.QObject, Item):
         changed = False
 
         for metadata_attr in self.update_children_metadata_attrs:
-            state = ImageListState()
-            for src_obj_metadata in self.iter_children_items_metadata(metadata_attr):
-                state.process_images(src_obj_metadata)
-
-            updated_images = ImageList(state.images.values())
-            metadata = getattr(self, metadata_attr)
-            changed |= set(updated_images.hash_dict()) != set(metadata.images.hash_dict())
-            metadata.images = updated_images
-            metadata.has_common_images = state.has_common_images
+            changed |= self._rebuild_children_images(metadata_attr)
 
         return changed
 
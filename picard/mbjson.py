@@ -28,6 +28,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from collections import OrderedDict
+import threading
 from types import SimpleNamespace
 from typing import Any
 
@@ -540,33 +542,134 @@ def _should_skip_translation_due_to_scripts(text: str | None, config: Any | None
     return matched
 
 
+def _artist_translation_config_key(config: Any) -> tuple:
+    """
+    Build the part of the artist translation cache key depending on settings.
+
+    Parameters
+    ----------
+    config : Any
+        Configuration object with a ``setting`` mapping.
+
+    Returns
+    -------
+    tuple
+        The values of all settings affecting the artist name translation.
+    """
+    setting = config.setting
+    return (
+        tuple(setting['artist_locales']),
+        setting['translate_artist_names_script_exception'],
+        tuple(tuple(exception) for exception in setting['script_exceptions']),
+    )
+
+
+class ArtistTranslationCache:
+    """
+    Bounded, thread-safe LRU cache of translated artist names.
+
+    Entries are keyed by the artist MBID, the names and aliases of the artist
+    node and the relevant translation settings. Changing any of
+    those settings therefore results in cache misses for old entries, which
+    eventually get evicted.
+    """
+
+    def __init__(self, max_size: int = 5000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(node: dict[str, Any], config: Any) -> tuple | None:
+        artist_id = node.get('id')
+        if not artist_id:
+            return None
+        return (
+            artist_id,
+            node['name'],
+            node['sort-name'],
+            tuple(
+                (
+                    alias.get('locale'),
+                    alias.get('primary'),
+                    alias.get('type-id'),
+                    alias.get('name'),
+                    alias.get('sort-name'),
+                )
+                for alias in node.get('aliases') or ()
+            ),
+            _artist_translation_config_key(config),
+        )
+
+    def get(self, key: tuple) -> tuple[str, str] | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: tuple[str, str]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+artist_translation_cache = ArtistTranslationCache()
+
+
 def _translate_artist_node(node, config=None):
     config = config or get_config()
-    translated_name, sort_name = None, None
-    if config.setting['translate_artist_names']:
-        if _should_skip_translation_due_to_scripts(node['name'], config=config):
-            return node['name'], node['sort-name']
-
-        # Prepare dictionaries of available locale aliases
-        if 'aliases' in node:
-            full_locales, root_locales = _locales_from_aliases(node['aliases'])
-
-            # First pass to match full locale if available
-            for locale in config.setting['artist_locales']:
-                if locale in full_locales:
-                    return full_locales[locale][1]
-
-            # Second pass to match root locale if available
-            for locale in config.setting['artist_locales']:
-                lang = locale.split('_')[0]
-                if lang in root_locales:
-                    return root_locales[lang][1]
-
-        # No matches found in available alias locales
-        sort_name = node['sort-name']
-        translated_name = translate_from_sortname(node['name'] or '', sort_name)
-    else:
-        translated_name, sort_name = node['name'], node['sort-name']
+    if not config.setting['translate_artist_names']:
+        return node['name'], node['sort-name']
+
+    key = artist_translation_cache.make_key(node, config)
+    if key is None:
+        return _translate_artist_node_uncached(node, config)
+    result = artist_translation_cache.get(key)
+    if result is None:
+        result = _translate_artist_node_uncached(node, config)
+        artist_translation_cache.set(key, result)
+    return result
+
+
+def _translate_artist_node_uncached(node, config):
+    if _should_skip_translation_due_to_scripts(node['name'], config=config):
+        return node['name'], node['sort-name']
+
+    # Prepare dictionaries of available locale aliases
+    if 'aliases' in node:
+        full_locales, root_locales = _locales_from_aliases(node['aliases'])
+
+        # First pass to match full locale if available
+        for locale in config.setting['artist_locales']:
+            if locale in full_locales:
+                return full_locales[locale][1]
+
+        # Second pass to match root locale if available
+        for locale in config.setting['artist_locales']:
+            lang = locale.split('_')[0]
+            if lang in root_locales:
+                return root_locales[lang][1]
+
+    # No matches found in available alias locales
+    sort_name = node['sort-name']
+    translated_name = translate_from_sortname(node['name'] or '', sort_name)
     return (translated_name, sort_name)
 
 
@@ -42,8 +42,10 @@ from collections.abc import (
     Callable,
     Iterable,
     MutableMapping,
+    Set,
 )
 from functools import partial
+import sys
 from typing import TYPE_CHECKING
 
 from PyQt6 import QtCore
@@ -60,6 +62,7 @@ from picard.util import (
     ReadWriteLockContext,
     extract_year_from_date,
     linear_combination_of_weights,
+    next_generation,
 )
 from picard.util.imagelist import ImageList
 
@@ -154,8 +157,34 @@ def trackcount_score(actual, expected):
     return 0.0 if actual > expected else 0.3 if actual < expected else 1.0
 
 
+# Returned for Metadata without deleted tags, avoids allocating a set per object
+_NO_DELETED_TAGS = frozenset()
+
+
 class Metadata(MutableMapping[str, str | list[str] | None]):
-    """List of metadata items with dict-like access."""
+    """List of metadata items with dict-like access.
+
+    Copies made with `copy` or `Metadata(other)` share the stored tags with
+    the original until either of them gets modified. The value lists in the
+    store are never modified in place.
+
+    Many Metadata objects are alive at the same time, at least two per file.
+    To keep them small tag names are interned and the set of deleted tags
+    and the image list are only allocated when needed.
+    """
+
+    __slots__ = (
+        # Instance dictionaries are only allocated if other attributes get set
+        '__dict__',
+        '_deleted_tags',
+        '_generation',
+        '_images',
+        '_length',
+        '_lock',
+        '_shared',
+        '_store',
+        'has_common_images',
+    )
 
     __weights = [
         ('title', 22),
@@ -187,10 +216,14 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
         **kwargs,
     ):
         self._lock = ReadWriteLockContext()
+        self._generation = next_generation()
         self._store: dict[str, list[str]] = dict()
-        self.deleted_tags: set[str] = set()
-        self.images: ImageList = ImageList()
+        # True if _store might be shared with other Metadata objects
+        self._shared = False
+        self._deleted_tags: set[str] | None = None
+        self._images: ImageList | None = None
         self.has_common_images = True
+        self._length = 0
 
         if length is not None:
             self.length = length
@@ -209,7 +242,40 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
         return bool(len(self))
 
     def __len__(self):
-        return len(self._store) + len(self.images)
+        return len(self._store) + (len(self._images) if self._images is not None else 0)
+
+    @property
+    def generation(self) -> int:
+        """Generation number, which increases on every change of tags, length or images."""
+        if self._images is None:
+            return self._generation
+        return max(self._generation, self._images.generation)
+
+    def _changed(self):
+        self._generation = next_generation()
+
+    @property
+    def images(self) -> ImageList:
+        if self._images is None:
+            self._images = ImageList()
+            # Allocating the empty list is no change
+            self._images.generation = self._generation
+        return self._images
+
+    @images.setter
+    def images(self, images: ImageList):
+        self._images = images
+        self._changed()
+
+    @property
+    def deleted_tags(self) -> Set[str]:
+        """Names of the tags marked for deletion, must not be modified."""
+        return self._deleted_tags or _NO_DELETED_TAGS
+
+    @deleted_tags.setter
+    def deleted_tags(self, tags: Iterable[str]):
+        self._deleted_tags = set(tags) or None
+        self._changed()
 
     @property
     def length(self):
@@ -220,7 +286,9 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
         length = int(value)
         if length < 0:
             raise ValueError("negative value: %d" % length)
-        self._length = length
+        if length != self._length:
+            self._length = length
+            self._changed()
 
     @staticmethod
     def length_score(a: int, b: int):
@@ -459,27 +527,63 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
             m.deleted_tags = self.deleted_tags - other.deleted_tags
             return m
 
+    def _share_store(self, other):
+        """Copy on write, share the tags of other until either side modifies them.
+
+        The lock of other is held for writing while handing over its tags, as
+        other gets marked as shared. Otherwise other could modify the tags in
+        place at the same time.
+        """
+        with other._lock.lock_for_write():
+            if not other._store:
+                return
+            self._store = other._store
+            self._shared = other._shared = True
+        if self._deleted_tags:
+            self._deleted_tags.difference_update(self._store)
+        self._changed()
+
     def _update_from_metadata(self, other, copy_images=True):
-        for k, v in other.rawitems():
-            self._set(k, v[:])
+        if not self._store and isinstance(other, Metadata):
+            if other is not self:
+                self._share_store(other)
+        else:
+            changed = False
+            for k, v in other.rawitems():
+                # Values of other are already normalized and never modified
+                # in place, so they can be shared
+                if self._store.get(k) != v or k in self.deleted_tags:
+                    self._unshare()
+                    self._store[k] = v
+                    self._discard_deleted(k)
+                    changed = True
+            if changed:
+                self._changed()
 
         for tag in other.deleted_tags:
             self._del(tag)
 
-        if copy_images and other.images:
-            self.images = other.images.copy()
+        other_images = other._images if isinstance(other, Metadata) else other.images
+        if copy_images and other_images:
+            self.images = other_images.copy()
         if other.length:
             self.length = other.length
 
     def clear(self):
         with self._lock.lock_for_write():
-            self._store.clear()
-            self.images = ImageList()
+            self._store = dict()
+            self._shared = False
+            self._images = None
             self.length = 0
             self.clear_deleted()
 
     def clear_deleted(self):
-        self.deleted_tags = set()
+        self._deleted_tags = None
+        self._changed()
+
+    def _discard_deleted(self, name):
+        if self._deleted_tags:
+            self._deleted_tags.discard(name)
 
     @staticmethod
     def normalize_tag(name: str):
@@ -504,6 +608,12 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
     def __getitem__(self, name: str) -> str:
         return self.get(name) or ''
 
+    def _unshare(self):
+        # Must be called before modifying _store
+        if self._shared:
+            self._store = dict(self._store)
+            self._shared = False
+
     def _set(self, name, values):
         name = self.normalize_tag(name)
         if isinstance(values, str) or not isinstance(values, Iterable):
@@ -511,8 +621,11 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
         values = [str(value) for value in values if value or value == 0 or value == '']
         # Remove if there is only a single empty or blank element.
         if values and (len(values) > 1 or values[0]):
-            self._store[name] = values
-            self.deleted_tags.discard(name)
+            if self._store.get(name) != values or name in self.deleted_tags:
+                self._unshare()
+                self._store[sys.intern(name)] = values
+                self._discard_deleted(name)
+                self._changed()
         elif name in self._store:
             self._del(name)
 
@@ -529,12 +642,15 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
 
     def _del(self, name):
         name = self.normalize_tag(name)
-        try:
+        if name in self._store:
+            self._unshare()
             del self._store[name]
-        except KeyError:
-            pass
-        finally:
-            self.deleted_tags.add(name)
+            self._changed()
+        elif name not in self.deleted_tags:
+            self._changed()
+        if self._deleted_tags is None:
+            self._deleted_tags = set()
+        self._deleted_tags.add(sys.intern(name))
 
     def __delitem__(self, name: str):
         with self._lock.lock_for_write():
@@ -547,8 +663,10 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
         if value or value == 0:
             with self._lock.lock_for_write():
                 name = self.normalize_tag(name)
-                self._store.setdefault(name, []).append(str(value))
-                self.deleted_tags.discard(name)
+                self._unshare()
+                self._store[sys.intern(name)] = self._store.get(name, []) + [str(value)]
+                self._discard_deleted(name)
+                self._changed()
 
     def add_unique(self, name: str, value: str):
         name = self.normalize_tag(name)
@@ -563,10 +681,10 @@ class Metadata(MutableMapping[str, str | list[str] | None]):
         """
         with self._lock.lock_for_write():
             name = self.normalize_tag(name)
-            try:
+            if name in self._store:
+                self._unshare()
                 del self._store[name]
-            except KeyError:
-                pass
+                self._changed()
 
     def __iter__(self):
         with self._lock.lock_for_read():
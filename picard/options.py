@@ -48,6 +48,7 @@ from picard.const.defaults import (
     DEFAULT_COVER_CONVERTING_FORMAT,
     DEFAULT_COVER_IMAGE_FILENAME,
     DEFAULT_COVER_IMAGE_QUALITY,
+    DEFAULT_COVER_MAX_CONCURRENT_DOWNLOADS,
     DEFAULT_COVER_MAX_SIZE,
     DEFAULT_COVER_MIN_SIZE,
     DEFAULT_COVER_RESIZE_MODE,
@@ -111,6 +112,7 @@ IntOption('setting', 'caa_image_size', DEFAULT_CAA_IMAGE_SIZE)
 ListOption('setting', 'caa_image_types', DEFAULT_CAA_IMAGE_TYPE_INCLUDE)
 ListOption('setting', 'caa_image_types_to_omit', DEFAULT_CAA_IMAGE_TYPE_EXCLUDE)
 BoolOption('setting', 'caa_restrict_image_types', True)
+BoolOption('setting', 'caa_thumbnails_first', False)
 
 # picard/coverart/providers/local.py
 # Local Files
@@ -188,6 +190,12 @@ TextOption('setting', 'cd_lookup_device', ','.join(DEFAULT_DRIVES))
 # Cover Art
 ListOption('setting', 'ca_providers', DEFAULT_CA_PROVIDERS, title=N_("Cover art providers"))
 TextOption('setting', 'cover_image_filename', DEFAULT_COVER_IMAGE_FILENAME, title=N_("File name for images"))
+IntOption(
+    'setting',
+    'cover_max_concurrent_downloads',
+    DEFAULT_COVER_MAX_CONCURRENT_DOWNLOADS,
+    title=N_("Maximum concurrent cover art downloads per host"),
+)
 BoolOption('setting', 'embed_only_one_front_image', True, title=N_("Embed only a single front image"))
 BoolOption('setting', 'dont_replace_with_smaller_cover', False, title=N_("Never replace images with smaller ones"))
 BoolOption('setting', 'dont_replace_cover_of_types', False, title=N_("Never replace images of selected types"))
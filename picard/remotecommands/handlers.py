@@ -273,15 +273,15 @@ class RemoteCommandHandlers:
 
     @remote_command("Save all matched files from the album pane.")
     def save_matched(self, argstring):
+        files = []
         for album in self.tagger.albums.values():
             for track in album.iter_correctly_matched_tracks():
-                track.files[0].save()
+                files.append(track.files[0])
+        self.tagger.save(files)
 
     @remote_command("Save all modified files from the album pane.")
     def save_modified(self, argstring):
-        for track in self.tagger.iter_album_files():
-            if track.state == File.State.CHANGED:
-                track.save()
+        self.tagger.save([file for file in self.tagger.iter_album_files() if file.state == File.State.CHANGED])
 
     @remote_command("Scan all files in the cluster pane.")
     def scan(self, argstring):
@@ -396,7 +396,7 @@ class AlbumManager:
             self.loaded_albums[album_id] = album
             self._ui_state.ensure_album_visible(album, self._saved_expanded_albums)
             if not self._suppress_network:
-                album.load()
+                self._refresh_when_loaded(album)
 
     def load_needed_albums(self, grouped_items: GroupedItems, mb_cache: dict[str, Any]) -> None:
         """Ensure albums referenced by grouped items are available."""
@@ -463,7 +463,7 @@ class AlbumManager:
             album = self._build_from_cache(album_id, cached_node)
             self._ui_state.ensure_album_visible(album, self._saved_expanded_albums)
             if not self._suppress_network:
-                album.load()
+                self._refresh_when_loaded(album)
             return album
 
         if self._suppress_network:
@@ -473,6 +473,17 @@ class AlbumManager:
         self._ui_state.ensure_album_visible(album, self._saved_expanded_albums)
         return album
 
+    @staticmethod
+    def _refresh_when_loaded(album: Album) -> None:
+        """Reload the album from the network once it finished loading.
+
+        Albums built from the cache still build their tracks and run the
+        tagger scripts on worker threads, reloading is refused until then.
+        Callbacks registered afterwards, like the session overrides, run
+        once the reload finished.
+        """
+        album.run_when_loaded(album.load, run_on_error=True)
+
     def _build_from_cache(self, album_id: str, node: dict[str, Any]) -> Album:
         """Construct and finalize an album from cached MB data without network."""
         album = self._tagger.albums.get(album_id)
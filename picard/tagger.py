@@ -47,7 +47,10 @@
 
 
 import argparse
-from collections import namedtuple
+from collections import (
+    defaultdict,
+    namedtuple,
+)
 import contextlib
 from dataclasses import (
     dataclass,
@@ -108,6 +111,7 @@ from picard.const import (
     USER_DIR,
 )
 from picard.const.appdirs import (
+    cache_folder,
     plugin_folder,
     sessions_folder,
 )
@@ -118,7 +122,13 @@ from picard.const.sys import (
     IS_MACOS,
     IS_WIN,
 )
+from picard.coverart.downloadcache import (
+    CaaIndexCache,
+    DownloadedImageCache,
+)
+from picard.coverart.fullsize import full_size_image_loader
 from picard.coverart.image import DataHash
+from picard.coverart.processing.cache import ProcessedImageCache
 from picard.debug_opts import DebugOpt
 from picard.disc import (
     Disc,
@@ -183,6 +193,7 @@ from picard.util import (
     webbrowser2,
 )
 from picard.util.checkupdate import UpdateCheckManager
+from picard.util.dirlisting import directory_listings
 from picard.util.readthedocs import ReadTheDocs
 from picard.util.toc import (
     parse_toc_itunes_cddb,
@@ -220,6 +231,18 @@ def _patched_shutil_copystat(src, dst, *, follow_symlinks=True):
 _orig_shutil_copystat = shutil.copystat
 shutil.copystat = _patched_shutil_copystat
 
+# Minimum number of removed items for suspending the item views. Resuming
+# them sorts both trees again, which costs more than updating a few items.
+REMOVE_SUSPEND_VIEWS_THRESHOLD = 100
+
+
+def _suspend_views_for_removal(window, count):
+    """Return the context for removing count items, which suspends the item
+    views only for larger removals."""
+    if count >= REMOVE_SUSPEND_VIEWS_THRESHOLD:
+        return window.suspend_while_loading
+    return contextlib.nullcontext()
+
 
 class Tagger(QtWidgets.QApplication):
     tagger_stats_changed = QtCore.pyqtSignal()
@@ -263,6 +286,8 @@ class Tagger(QtWidgets.QApplication):
         self._init_webservice()
         self._init_readthedocs()
         self._init_format_registry()
+        self._init_processed_image_cache()
+        self._init_download_caches()
         self._init_fingerprinting()
         self._init_plugins()
         self._init_browser_integration()
@@ -314,6 +339,13 @@ class Tagger(QtWidgets.QApplication):
         self.register_cleanup(self.priority_thread_pool.waitForDone)
         self.priority_thread_pool.setMaxThreadCount(1)
 
+        # Cover art image processing is CPU bound and split into dependent
+        # tasks, run it separately so it neither delays nor gets delayed by
+        # other background tasks.
+        self.image_processing_thread_pool = QtCore.QThreadPool(self)
+        self.register_cleanup(self.image_processing_thread_pool.waitForDone)
+        self.image_processing_thread_pool.setMaxThreadCount(max(2, QtCore.QThread.idealThreadCount()))
+
         # Use a separate thread pool for file saving, with a thread count of 1,
         # to avoid race conditions in File._save_and_rename.
         self.save_thread_pool = QtCore.QThreadPool(self)
@@ -394,6 +426,18 @@ class Tagger(QtWidgets.QApplication):
         for format in DEFAULT_FORMATS:
             self.format_registry.register(format)
 
+    def _init_processed_image_cache(self):
+        """Initialize the disk cache for processed cover art images"""
+        self.processed_image_cache = ProcessedImageCache(os.path.join(cache_folder(), 'processed_covers'))
+        self.register_cleanup(self.processed_image_cache.log_statistics)
+
+    def _init_download_caches(self):
+        """Initialize the caches for downloaded cover art images and indexes"""
+        self.downloaded_image_cache = DownloadedImageCache(os.path.join(cache_folder(), 'downloaded_covers'))
+        self.register_cleanup(self.downloaded_image_cache.log_statistics)
+        self.caa_index_cache = CaaIndexCache(os.path.join(cache_folder(), 'caa_index'))
+        self.register_cleanup(self.caa_index_cache.log_statistics)
+
     def _init_fingerprinting(self):
         """Initialize fingerprinting"""
         acoustid_api = AcoustIdAPIHelper(self.webservice)
@@ -987,7 +1031,11 @@ class Tagger(QtWidgets.QApplication):
             current_path = normpath(local_paths.pop(0))
             try:
                 if os.path.isdir(current_path):
-                    for entry in os.scandir(current_path):
+                    with os.scandir(current_path) as it:
+                        entries = list(it)
+                    # Keep the listing for later lookups, e.g. of local cover art
+                    directory_listings.set_from_entries(current_path, entries)
+                    for entry in entries:
                         if ignore_hidden and is_hidden(entry.path):
                             continue
                         if recursive and entry.is_dir():
@@ -1067,8 +1115,7 @@ class Tagger(QtWidgets.QApplication):
 
     def save(self, objects):
         """Save the specified objects."""
-        for file in iter_files_from_objects(objects, save=True):
-            file.save()
+        full_size_image_loader.save_files(iter_files_from_objects(objects, save=True))
 
     def load_mbid(self, type, mbid):
         self.bring_tagger_front()
@@ -1117,13 +1164,36 @@ class Tagger(QtWidgets.QApplication):
         return self.release_groups.setdefault(rg_id, ReleaseGroup(rg_id))
 
     def remove_files(self, files, from_parent=True):
-        """Remove files from the tagger."""
-        for file in files:
-            if file.filename in self.files:
-                file.clear_lookup_task()
-                self._acoustid.stop_analyze(file)
-                del self.files[file.filename]
-                file.remove(from_parent)
+        """Remove files from the tagger.
+
+        The files get removed in bulk: Files are detached from their parents
+        grouped by parent, while item view and selection updates, AcoustID
+        submission checks and deleting released image data are deferred until
+        all files got removed.
+        """
+        files = [file for file in dict.fromkeys(files) if file.filename in self.files]
+        if files:
+            with (
+                _suspend_views_for_removal(self.window, len(files)),
+                self.window.ignore_selection_changes,
+                self.acoustidmanager.suspend_check,
+                DataHash.deferred_file_deletion(),
+            ):
+                self._acoustid.stop_analyze_files(files)
+                files_by_parent = defaultdict(list)
+                for file in files:
+                    file.clear_lookup_task()
+                    del self.files[file.filename]
+                    if from_parent and file.parent_item:
+                        files_by_parent[file.parent_item].append(file)
+                for parent, parent_files in files_by_parent.items():
+                    if isinstance(parent, Cluster):
+                        parent.remove_files(parent_files)
+                    else:
+                        for file in parent_files:
+                            parent.remove_file(file)
+                for file in files:
+                    file.remove(from_parent_item=False)
         self.tagger_stats_changed.emit()
 
     def remove_album(self, album):
@@ -1133,7 +1203,10 @@ class Tagger(QtWidgets.QApplication):
             return
         album.stop_loading()
         album.cancel_tasks()
-        self.remove_files(list(album.iterfiles()))
+        files = list(album.iterfiles())
+        # The whole album gets removed, there is no need to update it for each file
+        album.detach_files()
+        self.remove_files(files, from_parent=False)
         del self.albums[album.id]
         if album.release_group:
             album.release_group.remove_album(album.id)
@@ -1169,7 +1242,12 @@ class Tagger(QtWidgets.QApplication):
     def remove(self, objects):
         """Remove the specified objects."""
         files = []
-        with self.window.ignore_selection_changes:
+        count = len(objects) + sum(1 for file in iter_files_from_objects(objects))
+        with (
+            _suspend_views_for_removal(self.window, count),
+            self.window.ignore_selection_changes,
+            DataHash.deferred_file_deletion(),
+        ):
             for obj in objects:
                 if isinstance(obj, File):
                     files.append(obj)
@@ -1460,6 +1538,9 @@ class Tagger(QtWidgets.QApplication):
     def refresh(self, objs):
         for obj in objs:
             if obj.can_refresh:
+                # Local cover art might have been added or removed
+                for path in {os.path.dirname(file.filename) for file in obj.iterfiles()}:
+                    directory_listings.invalidate(path, recursive=True)
                 obj.load(priority=True, refresh=True)
 
     def bring_tagger_front(self):
@@ -221,17 +221,28 @@ class Track(FileListItem):
         self.files.remove(file)
         file.metadata_images_changed.disconnect(self.update_metadata_images)
         file.copy_metadata(file.orig_metadata, preserve_deleted=False)
-        if self.album:
-            self.album.remove_file(self, file, new_album=new_album)
         self.remove_metadata_images_from_children([file])
         if not self.files and self._orig_images:
             self.orig_metadata.images = self._orig_images
             self.metadata.images = self._orig_images.copy()
+        if self.album:
+            self.album.remove_file(self, file, new_album=new_album)
         run_file_post_removal_from_track_processors(self, file)
         self.update()
         if self.ui_item.isSelected():
             self.tagger.window.refresh_metadatabox()
 
+    def detach_files(self):
+        """Detach all files from the track, which gets removed together with its album.
+
+        Unlike `remove_file`, neither the track, nor the album or the files get updated.
+        """
+        files = list(self.files)
+        self.files.clear()
+        for file in files:
+            file.metadata_images_changed.disconnect(self.update_metadata_images)
+            run_file_post_removal_from_track_processors(self, file)
+
     @staticmethod
     def run_scripts(metadata, strip_whitespace=False):
         for script in iter_active_tagging_scripts():
@@ -46,6 +46,7 @@ from picard.coverart.image import CoverArtImageIOError
 from picard.i18n import gettext as _
 
 from picard.ui.colors import interface_colors
+from picard.ui.thumbnailloader import thumbnail_loader
 from picard.ui.widgets import ActiveLabel
 
 
@@ -69,6 +70,9 @@ class CoverArtThumbnail(ActiveLabel):
         else:
             self.pixel_ratio = self.tagger.primaryScreen().devicePixelRatio()
         self._pixmap_cache = pixmap_cache
+        # Cache keys of the images still being decoded
+        self._pending_keys = set()
+        thumbnail_loader.decoded.connect(self._image_decoded)
         self._update_default_pixmaps()
         self.setPixmap(self.shadow)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
@@ -170,6 +174,7 @@ class CoverArtThumbnail(ActiveLabel):
 
         self.data = data
         self.has_common_images = has_common_images
+        self._pending_keys = set()
 
         if not force and self.parent().isHidden():
             return
@@ -183,24 +188,46 @@ class CoverArtThumbnail(ActiveLabel):
             has_common_images = True
 
         key = hash(tuple(sorted(self.data, key=lambda x: x.types_as_string())) + (has_common_images, self.pixel_ratio))
+        self.current_pixmap_key = key
         try:
             pixmap = self._pixmap_cache[key]
         except KeyError:
-            if len(self.data) == 1:
-                pixmap = QtGui.QPixmap()
-                try:
-                    if pixmap.loadFromData(self.data[0].data):
-                        pixmap = self.decorate_cover(pixmap)
-                    else:
-                        pixmap = self.file_missing_pixmap
-                except CoverArtImageIOError:
-                    pixmap = self.file_missing_pixmap
-            else:
-                pixmap = self.render_cover_stack(self.data, has_common_images)
+            pixmap = self._render(has_common_images)
+            if pixmap is None:
+                # Show a placeholder until all images are decoded
+                self.setPixmap(self.shadow)
+                return
             self._pixmap_cache[key] = pixmap
 
         self.setPixmap(pixmap)
-        self.current_pixmap_key = key
+
+    def _render(self, has_common_images):
+        """Render the pixmap of the current images, returns None while
+        images are still being decoded."""
+        if len(self.data) > MAX_COVERS_TO_STACK:
+            images = self.data[: MAX_COVERS_TO_STACK - 1]
+        else:
+            images = self.data
+        (size,) = self.scaled(COVERART_WIDTH)
+        pixmaps = []
+        for image in images:
+            pixmap = thumbnail_loader.load(image, size)
+            if pixmap is None:
+                self._pending_keys.add(thumbnail_loader.cache_key(image, size))
+            pixmaps.append(pixmap)
+        if self._pending_keys:
+            return None
+        if len(self.data) == 1:
+            if pixmaps[0].isNull():
+                return self.file_missing_pixmap
+            return self.decorate_cover(pixmaps[0])
+        return self.render_cover_stack(pixmaps + self.data[len(pixmaps) :], has_common_images)
+
+    def _image_decoded(self, key):
+        if key in self._pending_keys:
+            self._pending_keys.discard(key)
+            if not self._pending_keys:
+                self.set_data(self.data, force=True, has_common_images=self.has_common_images)
 
     def decorate_cover(self, pixmap):
         offx = offy = 1
@@ -267,7 +294,7 @@ class CoverArtThumbnail(ActiveLabel):
             cy = h // 2
         for image in reversed(data_to_paint):
             if isinstance(image, QtGui.QPixmap):
-                thumb = image
+                thumb = image if not image.isNull() else self.file_missing_pixmap
             else:
                 thumb = QtGui.QPixmap()
                 try:
@@ -64,6 +64,9 @@ class Ui_CaaOptions(object):
         self.cb_approved_only = QtWidgets.QCheckBox(parent=CaaOptions)
         self.cb_approved_only.setObjectName("cb_approved_only")
         self.verticalLayout.addWidget(self.cb_approved_only)
+        self.cb_thumbnails_first = QtWidgets.QCheckBox(parent=CaaOptions)
+        self.cb_thumbnails_first.setObjectName("cb_thumbnails_first")
+        self.verticalLayout.addWidget(self.cb_thumbnails_first)
         spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
         self.verticalLayout.addItem(spacerItem1)
         self.label.setBuddy(self.cb_image_size)
@@ -73,6 +76,7 @@ class Ui_CaaOptions(object):
         CaaOptions.setTabOrder(self.restrict_images_types, self.select_caa_types)
         CaaOptions.setTabOrder(self.select_caa_types, self.cb_image_size)
         CaaOptions.setTabOrder(self.cb_image_size, self.cb_approved_only)
+        CaaOptions.setTabOrder(self.cb_approved_only, self.cb_thumbnails_first)
 
     def retranslateUi(self, CaaOptions):
         CaaOptions.setWindowTitle(_("Form"))
@@ -80,3 +84,4 @@ class Ui_CaaOptions(object):
         self.select_caa_types.setText(_("Select types…"))
         self.label.setText(_("Only use images of at most the following size:"))
         self.cb_approved_only.setText(_("Download only approved images"))
+        self.cb_thumbnails_first.setText(_("Load thumbnails first, download full size images when saving"))
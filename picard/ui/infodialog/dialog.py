@@ -30,7 +30,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 from html import escape
-import traceback
+import os
 
 from PyQt6 import (
     QtCore,
@@ -41,7 +41,6 @@ from PyQt6 import (
 from picard import log
 from picard.album import Album
 from picard.config import get_config
-from picard.coverart.image import CoverArtImageIOError
 from picard.coverart.utils import translated_types_as_string
 from picard.file import File
 from picard.i18n import gettext as _
@@ -169,29 +168,24 @@ class InfoDialog(PicardDialog):
             source = 'new_external_image'
         image = getattr(self.artwork_rows[row_index], source)
         item = QtWidgets.QTableWidgetItem()
+        display_image = None
 
         if image:
-            try:
-                data = None
-                if image.thumbnail:
-                    try:
-                        data = image.thumbnail.data
-                    except CoverArtImageIOError as e:
-                        log.warning(e)
-                else:
-                    data = image.data
-                if data:
-                    pixmap = QtGui.QPixmap()
-                    pixmap.loadFromData(data)
-                    item.setToolTip(self._artwork_tooltip(_("Double-click to open in external viewer"), image))
-                    item.setData(QtCore.Qt.ItemDataRole.UserRole, image)
-            except CoverArtImageIOError:
-                log.error(traceback.format_exc())
+            # The image gets decoded on a worker thread by the cover widget
+            display_image = image.thumbnail or image
+            if not display_image.datahash:
+                display_image = None
+            elif not image.thumbnail and not os.path.isfile(image.tempfile_filename):
+                log.error("Missing temporary file %r", image.tempfile_filename)
+                display_image = None
                 pixmap = self._pixmaps['missing']
                 item.setToolTip(self._artwork_tooltip(_("Missing temporary file"), image))
+            else:
+                item.setToolTip(self._artwork_tooltip(_("Double-click to open in external viewer"), image))
+                item.setData(QtCore.Qt.ItemDataRole.UserRole, image)
             infos = "<br />".join(escape(t) for t in self._artwork_infos(image))
 
-        img_wgt = ArtworkCoverWidget(pixmap=pixmap, text=infos)
+        img_wgt = ArtworkCoverWidget(pixmap=pixmap, text=infos, image=display_image)
         self.artwork_table.setCellWidget(row_index, col_index, img_wgt)
         self.artwork_table.setItem(row_index, col_index, item)
 
@@ -36,30 +36,38 @@ from PyQt6 import (
 
 from picard.i18n import gettext as _
 
+from picard.ui.thumbnailloader import thumbnail_loader
+
 
 class ArtworkCoverWidget(QtWidgets.QWidget):
-    """A QWidget that can be added to artwork column cell of ArtworkTable."""
+    """A QWidget that can be added to artwork column cell of ArtworkTable.
+
+    Either a pixmap or a CoverArtImage image can be displayed, the image gets
+    decoded on a worker thread.
+    """
 
     SIZE = 170
 
-    def __init__(self, pixmap=None, text=None, size=None, parent=None):
+    def __init__(self, pixmap=None, text=None, size=None, image=None, parent=None):
         super().__init__(parent=parent)
         layout = QtWidgets.QVBoxLayout()
-
-        if pixmap is not None:
-            if size is None:
-                size = self.SIZE
-            image_label = QtWidgets.QLabel()
-            image_label.setPixmap(
-                pixmap.scaled(
-                    size,
-                    size,
-                    QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                    QtCore.Qt.TransformationMode.SmoothTransformation,
-                )
-            )
-            image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(image_label)
+        self.size = size if size is not None else self.SIZE
+        self.image = image
+        self.image_key = None
+
+        if pixmap is not None or image is not None:
+            self.image_label = QtWidgets.QLabel()
+            self.image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(self.image_label)
+            if image is not None:
+                pixmap = thumbnail_loader.load(image, self.size)
+                if pixmap is None:
+                    # Keep the space for the image until it is decoded
+                    self.image_key = thumbnail_loader.cache_key(image, self.size)
+                    self.image_label.setMinimumSize(self.size, self.size)
+                    thumbnail_loader.decoded.connect(self._image_decoded)
+            if pixmap is not None:
+                self._set_pixmap(pixmap)
 
         if text is not None:
             text_label = QtWidgets.QLabel()
@@ -70,6 +78,25 @@ class ArtworkCoverWidget(QtWidgets.QWidget):
 
         self.setLayout(layout)
 
+    def _set_pixmap(self, pixmap):
+        self.image_label.setPixmap(
+            pixmap.scaled(
+                self.size,
+                self.size,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+        )
+
+    def _image_decoded(self, key):
+        if key != self.image_key:
+            return
+        thumbnail_loader.decoded.disconnect(self._image_decoded)
+        self.image_key = None
+        pixmap = thumbnail_loader.load(self.image, self.size)
+        if pixmap is not None:
+            self._set_pixmap(pixmap)
+
 
 class ArtworkTable(QtWidgets.QTableWidget):
     H_SIZE = 200
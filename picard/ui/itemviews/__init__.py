@@ -80,6 +80,8 @@ from picard.ui.itemviews.columns import (
     FILEVIEW_COLUMNS,
 )
 from picard.ui.itemviews.custom_columns import DelegateColumn
+from picard.ui.itemviews.custom_columns.script_provider import metadata_generation
+from picard.ui.itemviews.updatescheduler import ItemUpdateScheduler
 
 
 def get_match_color(similarity, basecolor):
@@ -134,6 +136,7 @@ class MainPanel(QtWidgets.QSplitter):
             view.itemSelectionChanged.connect(partial(_view_update_selection, view))
 
         TreeItem.window = window
+        TreeItem.update_scheduler = window.item_update_scheduler
         TreeItem.base_color = self.palette().base().color()
         TreeItem.text_color = self.palette().text().color()
         TreeItem.text_color_secondary = (
@@ -344,6 +347,30 @@ class AlbumTreeView(BaseTreeView):
         self.takeTopLevelItem(self.indexOfTopLevelItem(album.ui_item))
 
 
+def get_column_text(obj, column):
+    """Returns the text displayed for obj in column, or None if it could not be evaluated."""
+    # Local import to avoid cycles
+    from picard.ui.itemviews.custom_columns import CustomColumn
+
+    if isinstance(column, CustomColumn):
+        # Hide custom column values for container/group rows, but preserve Title and status icon.
+        # - ClusterList: Represents the "Clusters" root. Title is set elsewhere.
+        # - Special Cluster instances (e.g. "Unclustered Files"): Should show their Title
+        #   but no other per-entity values in custom columns.
+        is_group_row = isinstance(obj, ClusterList) or (isinstance(obj, Cluster) and getattr(obj, 'special', False))
+        if is_group_row and (column.key != 'title' and not column.status_icon):
+            return ""
+        try:
+            return column.provider.evaluate(obj)
+        except (AttributeError, TypeError, ValueError, KeyError, NotImplementedError) as exc:
+            log.debug("Custom column '%s' evaluate failed: %r", column.key, exc)
+            return None
+    return obj.column(column.key)
+
+
+_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+
+
 class TreeItem(QtWidgets.QTreeWidgetItem):
     """
     Wrapper for items displayed in the main tree view.
@@ -352,6 +379,8 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
     (Album, Track, File) with a visual row. Handles sorting/filtering flags.
     """
 
+    update_scheduler: ItemUpdateScheduler | None = None
+
     def __init__(self, obj, sortable=False, filterable=True, parent=None):
         super().__init__(parent)
         self._obj = None
@@ -359,6 +388,9 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
         self.sortable = sortable
         self.filterable = filterable
         self._sortkeys = {}
+        # Texts of custom columns, evaluated on demand when shown or sorted
+        self._lazy_texts = {}
+        self._stale_columns = set()
         self.post_init()
 
     @property
@@ -392,21 +424,70 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
         # gets implemented by sub classes
         pass
 
+    def schedule_update(self, **kwargs):
+        """Request an update of this item.
+
+        The update is deferred and merged with other pending updates if an
+        update scheduler is active, otherwise the item gets updated at once.
+        """
+        if TreeItem.update_scheduler is not None:
+            TreeItem.update_scheduler.schedule(self, **kwargs)
+        else:
+            self.update(**kwargs)
+
+    @staticmethod
+    def update_window_selection():
+        if TreeItem.update_scheduler is not None:
+            TreeItem.update_scheduler.request_selection_update()
+        else:
+            TreeItem.window.update_selection(new_selection=False)
+
     def setText(self, column, text):
         self._sortkeys[column] = None
+        if column in self._lazy_texts:
+            del self._lazy_texts[column]
+            self._stale_columns.discard(column)
         return super().setText(column, text)
 
+    def data(self, column, role):
+        if role == _DISPLAY_ROLE and column in self._lazy_texts:
+            generation, text = self._lazy_texts[column]
+            if column in self._stale_columns or generation != metadata_generation(self.obj):
+                text = self._evaluate_column(column, text)
+            return text
+        return super().data(column, role)
+
+    def invalidate_column(self, column):
+        """Mark the text of column as outdated, it gets evaluated again when needed."""
+        self._lazy_texts.setdefault(column, (None, ""))
+        self._stale_columns.add(column)
+        self._sortkeys[column] = None
+
+    def _evaluate_column(self, column, previous_text):
+        self._stale_columns.discard(column)
+        generation = metadata_generation(self.obj)
+        text = get_column_text(self.obj, self.columns[column])
+        if text is None:
+            text = previous_text
+        self._lazy_texts[column] = (generation, text)
+        return text
+
     def __lt__(self, other):
         tree_widget = self.treeWidget()
         if not self.sortable or not tree_widget:
             return False
         column = tree_widget.sortColumn()
+        if column == getattr(tree_widget, 'deferred_sort_column', -1):
+            # Keep the current order until the sort values are available
+            return False
         return self.sortkey(column) < other.sortkey(column)
 
     def sortkey(self, column):
-        sortkey = self._sortkeys.get(column)
-        if sortkey is not None:
-            return sortkey
+        # Sort keys are only valid for the metadata they were computed from
+        generation = metadata_generation(self.obj)
+        cached = self._sortkeys.get(column)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
 
         this_column = self.columns[column]
 
@@ -416,13 +497,14 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
             sortkey = sort_key(self.text(column), numeric=True)
         else:
             sortkey = sort_key(self.text(column))
-        self._sortkeys[column] = sortkey
+        self._sortkeys[column] = (generation, sortkey)
         return sortkey
 
     def update_colums_text(self, color=None, bgcolor=None):
         # Local import to avoid cycles
         from picard.ui.itemviews.custom_columns import CustomColumn
 
+        invalidated = False
         for i, column in enumerate(self.columns):
             if color is not None:
                 self.setForeground(i, color)
@@ -439,26 +521,19 @@ class TreeItem(QtWidgets.QTreeWidgetItem):
                     self.setTextAlignment(i, QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
 
                 if isinstance(column, CustomColumn):
-                    # Invalidate caches for this object to reflect tag changes
+                    # Invalidate caches for this object, the values of scripts
+                    # can depend on more than its metadata (e.g. the album
+                    # state). The value is only evaluated once it gets painted
+                    # or sorted.
                     column.invalidate_cache(self.obj)
-                    # Hide custom column values for container/group rows, but preserve Title and status icon.
-                    # - ClusterList: Represents the "Clusters" root. Title is set elsewhere.
-                    # - Special Cluster instances (e.g. "Unclustered Files"): Should show their Title
-                    #   but no other per-entity values in custom columns.
-                    is_group_row = isinstance(self.obj, ClusterList) or (
-                        isinstance(self.obj, Cluster) and getattr(self.obj, 'special', False)
-                    )
-                    if is_group_row and (column.key != 'title' and not column.status_icon):
-                        self.setText(i, "")
-                        continue
-
-                    try:
-                        self.setText(i, column.provider.evaluate(self.obj))
-                    except (AttributeError, TypeError, ValueError, KeyError, NotImplementedError) as exc:
-                        log.debug("Custom column '%s' evaluate failed: %r", column.key, exc)
+                    self.invalidate_column(i)
+                    invalidated = True
                     continue
 
                 self.setText(i, self.obj.column(column.key))
+        if invalidated:
+            # Let the view repaint and, if needed, resort the row
+            self.emitDataChanged()
 
 
 class ClusterListItem(TreeItem):
@@ -477,9 +552,9 @@ class ClusterItem(TreeItem):
         self.update_colums_text()
         album = self.obj.album
         if self.obj.special and album and album.loaded:
-            album.ui_item.update(update_tracks=False)
+            album.ui_item.schedule_update(update_tracks=False)
         if update_selection and self.isSelected():
-            TreeItem.window.update_selection(new_selection=False)
+            TreeItem.update_window_selection()
 
     def add_file(self, file):
         self.add_files([file])
@@ -497,8 +572,25 @@ class ClusterItem(TreeItem):
             item.update()
 
     def remove_file(self, file):
-        file.ui_item.setSelected(False)
-        self.removeChild(file.ui_item)
+        self.remove_files([file])
+
+    def remove_files(self, files):
+        items = [file.ui_item for file in files if file.ui_item is not None]
+        for item in items:
+            if item.isSelected():
+                item.setSelected(False)
+        if len(items) == self.childCount():
+            self.takeChildren()
+        elif len(items) * 2 > self.childCount():
+            # Removing the items one by one requires searching each of them,
+            # it is faster to re-add the remaining items.
+            removed = {id(item) for item in items}
+            remaining = [item for item in self.takeChildren() if id(item) not in removed]
+            for item in remaining:
+                self.addChild(item)
+        else:
+            for item in items:
+                self.removeChild(item)
         self.update()
         if self.obj.is_permanently_hidden:
             self.setHidden(True)
@@ -563,7 +655,7 @@ class AlbumItem(TreeItem):
                 self.setToolTip(self.columns.status_icon_column, _("Album unchanged"))
         self.update_colums_text()
         if selection_changed and update_selection:
-            TreeItem.window.update_selection(new_selection=False)
+            TreeItem.update_window_selection()
         # Workaround for PICARD-1446: Expand/collapse indicator for the release
         # is briefly missing on Windows
         self.emitDataChanged()
@@ -648,9 +740,9 @@ class TrackItem(TreeItem):
             self.setToolTip(self.columns.status_icon_column, icon_tooltip)
         self.update_colums_text(color=color, bgcolor=bgcolor)
         if update_selection and self.isSelected():
-            TreeItem.window.update_selection(new_selection=False)
+            TreeItem.update_window_selection()
         if update_album:
-            self.parent().update(update_tracks=False, update_selection=update_selection)
+            self.parent().schedule_update(update_tracks=False, update_selection=update_selection)
 
 
 class FileItem(TreeItem):
@@ -669,10 +761,10 @@ class FileItem(TreeItem):
         bgcolor = get_match_color(file.similarity, TreeItem.base_color)
         self.update_colums_text(color=color, bgcolor=bgcolor)
         if update_selection and self.isSelected():
-            TreeItem.window.update_selection(new_selection=False)
+            TreeItem.update_window_selection()
         parent = self.parent()
         if isinstance(parent, TrackItem) and update_track:
-            parent.update(update_files=False, update_selection=update_selection)
+            parent.schedule_update(update_files=False, update_selection=update_selection)
 
     @staticmethod
     def decide_file_icon_info(file):
@@ -86,12 +86,14 @@ from picard.util import (
     iter_files_from_objects,
     normpath,
     restore_method,
+    thread,
 )
 
 from picard.ui.collectionmenu import CollectionMenu
 from picard.ui.enums import MainAction
 from picard.ui.filter import Filter
 from picard.ui.itemviews.custom_columns import DelegateColumn
+from picard.ui.itemviews.custom_columns.script_provider import metadata_generation
 from picard.ui.itemviews.events import header_events
 from picard.ui.ratingwidget import RatingWidget
 from picard.ui.scriptsmenu import ScriptsMenu
@@ -103,6 +105,10 @@ from picard.ui.widgets.configurablecolumnsheader import (
 
 FILE_FILTERS = {'~filename', '~filepath'}
 
+# Number of rows without a cached value above which the values of a script
+# column get computed on a worker thread before sorting by that column
+BULK_SORT_THRESHOLD = 500
+
 
 def _alternative_versions(album):
     config = get_config()
@@ -184,6 +190,11 @@ class BaseTreeView(QtWidgets.QTreeWidget):
         # Should multiple files dropped be assigned to tracks sequentially?
         self._move_to_multi_tracks = True
 
+        # Column for which sorting waits on values computed in the background
+        self.deferred_sort_column = -1
+        self._bulk_sort_serial = 0
+        self._bulk_sort_resorting = False
+
         self._init_header()
 
         self.setAcceptDrops(True)
@@ -487,6 +498,9 @@ class BaseTreeView(QtWidgets.QTreeWidget):
 
         header = ConfigurableColumnsHeader(self.columns, parent=self)
         self.setHeader(header)
+        # Must be connected before sorting gets enabled, so that it runs before
+        # the view sorts its items
+        header.sortIndicatorChanged.connect(self._on_sort_indicator_changed)
 
         # Set up delegates for delegate columns
         delegate_instances = {}
@@ -519,6 +533,56 @@ class BaseTreeView(QtWidgets.QTreeWidget):
         for i in range(self.topLevelItemCount()):
             _clear_item_sort_cache(self.topLevelItem(i))
 
+    def _on_sort_indicator_changed(self, column, order):
+        """Compute the values of a script column in bulk before sorting by it.
+
+        Evaluating the script for every row of a large tree would block the
+        UI. If many values are not cached yet the rows keep their order for
+        now, the values get computed on a worker thread and the view gets
+        sorted once they are available.
+        """
+        self.deferred_sort_column = -1
+        if self._bulk_sort_resorting or not 0 <= column < len(self.columns):
+            return
+        provider = getattr(self.columns[column], 'script_provider', None)
+        if provider is None:
+            return
+        objs = []
+        iterator = QtWidgets.QTreeWidgetItemIterator(self)
+        while iterator.value():
+            obj = getattr(iterator.value(), 'obj', None)
+            if obj is not None and not provider.is_cached(obj):
+                objs.append(obj)
+            iterator += 1
+        if len(objs) < BULK_SORT_THRESHOLD:
+            return
+        log.debug("Computing %d values of column %r before sorting", len(objs), self.columns[column].key)
+        self._bulk_sort_serial += 1
+        self.deferred_sort_column = column
+        # Values of items changed while computing must not be cached
+        generations = [metadata_generation(obj) for obj in objs]
+        thread.run_task(
+            partial(provider.compute_values, objs),
+            partial(self._on_bulk_sort_values_computed, self._bulk_sort_serial, column, provider, objs, generations),
+        )
+
+    def _on_bulk_sort_values_computed(self, serial, column, provider, objs, generations, result=None, error=None):
+        if serial != self._bulk_sort_serial:
+            # Sorting got changed meanwhile
+            return
+        self.deferred_sort_column = -1
+        if error is not None:
+            log.error("Failed computing values of column %r: %r", self.columns[column].key, error)
+        else:
+            for obj, generation, value in zip(objs, generations, result, strict=True):
+                provider.prime(obj, value, generation)
+        if self.sortColumn() == column:
+            self._bulk_sort_resorting = True
+            try:
+                self.sortByColumn(column, self.header().sortIndicatorOrder())
+            finally:
+                self._bulk_sort_resorting = False
+
     def supportedDropActions(self):
         return QtCore.Qt.DropAction.CopyAction | QtCore.Qt.DropAction.MoveAction
 
@@ -41,6 +41,7 @@ from picard.ui.itemviews.custom_columns.protocols import (
     HeaderIconProvider,
     SortKeyProvider,
 )
+from picard.ui.itemviews.custom_columns.script_provider import ChainedValueProvider
 
 
 class CustomColumn(Column):
@@ -107,6 +108,19 @@ class CustomColumn(Column):
         if isinstance(self.provider, CacheInvalidatable):
             self.provider.invalidate(obj)
 
+    @property
+    def script_provider(self) -> ChainedValueProvider | None:
+        """The script provider computing the values, if this is a script column.
+
+        Sorting adapters wrapping a script provider are looked through.
+        """
+        provider = self.provider
+        while provider is not None:
+            if isinstance(provider, ChainedValueProvider):
+                return provider
+            provider = getattr(provider, '_base', None)
+        return None
+
 
 class DelegateColumn(Column):
     """A column that uses a delegate for custom rendering and optional sorting."""
@@ -23,20 +23,33 @@
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Callable
+from collections.abc import (
+    Callable,
+    Iterable,
+)
 import contextlib
 import re
 from time import perf_counter
 from weakref import WeakKeyDictionary
 
 from picard import log
-from picard.item import Item
+from picard.item import (
+    Item,
+    MetadataItem,
+)
 from picard.script import ScriptParser
 
 from picard.ui.itemviews.custom_columns.context import ContextStrategyManager
 from picard.ui.itemviews.custom_columns.resolve import ValueResolverChain
 
 
+def metadata_generation(obj: Item) -> int | None:
+    """Return the generation of the item's metadata, ``None`` if unknown."""
+    if isinstance(obj, MetadataItem):
+        return obj.metadata.generation
+    return None
+
+
 class ChainedValueProvider:
     """Provide script-evaluated values with caching and performance limits.
 
@@ -47,6 +60,9 @@ class ChainedValueProvider:
     - Fallback id-cache: A bounded FIFO cache keyed by ``id(obj)`` for
       objects that cannot be weakly referenced. Evictions use O(1)
       ``deque.popleft``.
+    - Cached values are stored together with the generation of the item's
+      metadata and are only used while the generation is unchanged. Items
+      without a metadata generation keep their values until invalidated.
     """
 
     # Defaults can be overridden by subclasses or patched in tests
@@ -86,11 +102,12 @@ class ChainedValueProvider:
         self._max_runtime_ms = max_runtime_ms
 
         self._context_manager = ContextStrategyManager()
+        self._parser_factory = parser_factory
         # Reuse a parser instance or factory through resolver chain
         self._value_resolver = ValueResolverChain(parser=parser, parser_factory=parser_factory)
 
-        self._cache: WeakKeyDictionary[Item, str] = WeakKeyDictionary()
-        self._id_cache: dict[int, str] = {}
+        self._cache: WeakKeyDictionary[Item, tuple[int | None, str]] = WeakKeyDictionary()
+        self._id_cache: dict[int, tuple[int | None, str]] = {}
         self._id_order: deque[int] = deque()
         self._id_cache_max = max(self.DEFAULT_MIN_ID_CACHE_SIZE, int(cache_size))
 
@@ -110,23 +127,16 @@ class ChainedValueProvider:
         str
             Computed value (empty on failure).
         """
-        can_cache = True
-        avoid_cache_for_obj = False
+        generation = metadata_generation(obj)
         try:
-            if obj in self._cache:
-                return self._cache[obj]
+            cached = self._cache.get(obj)
         except TypeError as e:
             log.debug("Weak cache lookup failed (non-weakrefable object): %r", e)
-            can_cache = False
+            cached = self._id_cache.get(id(obj))
+        if cached is not None and cached[0] == generation:
+            return cached[1]
         # Avoid caching for album-like objects that are not fully loaded yet
-        if getattr(obj, "is_album_like", False) and not getattr(obj, "loaded", True):
-            avoid_cache_for_obj = True
-
-        obj_id = id(obj)
-        if not can_cache:
-            cached = self._id_cache.get(obj_id)
-            if cached is not None:
-                return cached
+        avoid_cache_for_obj = getattr(obj, "is_album_like", False) and not getattr(obj, "loaded", True)
 
         start = perf_counter()
 
@@ -135,20 +145,77 @@ class ChainedValueProvider:
 
         elapsed_ms = (perf_counter() - start) * 1000.0
         should_cache = (result != "") and (elapsed_ms <= self._max_runtime_ms) and not avoid_cache_for_obj
-        if can_cache and should_cache:
-            try:
-                self._cache[obj] = result
-            except TypeError:
-                pass
-        elif not can_cache and should_cache:
-            self._id_cache[obj_id] = result
-            self._id_order.append(obj_id)
-            if len(self._id_order) > self._id_cache_max:
-                oldest = self._id_order.popleft()
-                self._id_cache.pop(oldest, None)
+        if should_cache:
+            self._store(obj, generation, result)
 
         return result
 
+    def _store(self, obj: Item, generation: int | None, value: str) -> None:
+        try:
+            self._cache[obj] = (generation, value)
+            return
+        except TypeError:
+            pass
+        obj_id = id(obj)
+        if obj_id not in self._id_cache:
+            self._id_order.append(obj_id)
+        self._id_cache[obj_id] = (generation, value)
+        if len(self._id_order) > self._id_cache_max:
+            oldest = self._id_order.popleft()
+            self._id_cache.pop(oldest, None)
+
+    def is_cached(self, obj: Item) -> bool:
+        """Return ``True`` if a valid value for the item is cached."""
+        try:
+            cached = self._cache.get(obj)
+        except TypeError:
+            cached = self._id_cache.get(id(obj))
+        return cached is not None and cached[0] == metadata_generation(obj)
+
+    def prime(self, obj: Item, value: str, generation: int | None = None) -> None:
+        """Cache a value computed elsewhere, e.g. by :meth:`compute_values`.
+
+        Parameters
+        ----------
+        obj
+            The item the value was computed for.
+        value
+            The computed value.
+        generation
+            Metadata generation of the item at the time the value was
+            computed. If the metadata changed since, the value is never used.
+
+        Album-like objects which are not fully loaded yet are not cached,
+        the same as for :meth:`evaluate`.
+        """
+        if getattr(obj, "is_album_like", False) and not getattr(obj, "loaded", True):
+            return
+        self._store(obj, generation, value)
+
+    def compute_values(self, objs: Iterable[Item]) -> list[str]:
+        """Evaluate the script for many items, bypassing the cache.
+
+        A separate resolver chain with its own parser is used, which allows
+        running this on a worker thread while the provider keeps serving
+        values to the UI. The results can be cached with :meth:`prime`.
+
+        Parameters
+        ----------
+        objs
+            The items to evaluate.
+
+        Returns
+        -------
+        list[str]
+            Computed values in the order of ``objs`` (empty on failure).
+        """
+        resolver = ValueResolverChain(parser_factory=self._parser_factory)
+        results = []
+        for obj in objs:
+            ctx, file_obj = self._context_manager.make_context(obj)
+            results.append(resolver.resolve_value(obj, self._simple_var, self._script, ctx, file_obj))
+        return results
+
     def __repr__(self) -> str:  # pragma: no cover - debug helper
         cls_name = self.__class__.__name__
         return (
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Coalesced refreshing of the items in the main tree views.
+
+Updating a tree item recomputes all column texts, icons and tooltips. Many
+operations (e.g. moving files into an album) request updates for the same
+items, and their parents, several times in a row. The scheduler collects those
+requests and performs each item update only once on the next event loop
+iteration. While loading is suspended updates are collected for a longer
+interval and all pending updates are performed once loading finished.
+"""
+
+from PyQt6 import QtCore
+
+from picard import log
+
+
+# Interval in milliseconds for performing updates while loading is suspended
+SUSPENDED_FLUSH_INTERVAL = 250
+
+
+def _is_attached(item):
+    try:
+        return item.treeWidget() is not None
+    except RuntimeError:
+        # The underlying C++ item has already been deleted
+        return False
+
+
+def _item_depth(item):
+    depth = 0
+    parent = item.parent()
+    while parent is not None:
+        depth += 1
+        parent = parent.parent()
+    return depth
+
+
+def _merge_update_args(args, new_args):
+    # All update flags of the tree items default to True, the merged update
+    # must cover everything any of the requests asked for.
+    merged = {}
+    for key in args.keys() | new_args.keys():
+        merged[key] = args.get(key, True) or new_args.get(key, True)
+    return merged
+
+
+class ItemUpdateScheduler:
+    """Collects update requests for tree items and performs them in one go.
+
+    Items are updated from the deepest level up, so that updates a child
+    item requests for its parents get merged with already pending updates
+    of those parents. Selection updates requested while flushing are
+    performed once at the end.
+    """
+
+    def __init__(self, update_selection=None):
+        self._update_selection = update_selection
+        # Tree items are not hashable, pending updates are indexed by item id
+        self._dirty = {}
+        self._flushing = False
+        self._selection_update_pending = False
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+        # Statistics about requested, performed and avoided updates
+        self.num_requested = 0
+        self.num_performed = 0
+        self.num_coalesced = 0
+        self.num_dropped = 0
+        self.num_selection_requested = 0
+        self.num_selection_performed = 0
+
+    @property
+    def num_avoided(self):
+        """Number of redundant item updates which were not performed"""
+        return self.num_coalesced + self.num_dropped
+
+    @property
+    def num_selection_avoided(self):
+        return self.num_selection_requested - self.num_selection_performed
+
+    @property
+    def flushing(self):
+        return self._flushing
+
+    def schedule(self, item, **kwargs):
+        """Mark item as dirty, the update gets performed with the given arguments later."""
+        self.num_requested += 1
+        pending = self._dirty.get(id(item))
+        if pending is None:
+            self._dirty[id(item)] = (item, kwargs)
+        else:
+            self.num_coalesced += 1
+            self._dirty[id(item)] = (item, _merge_update_args(pending[1], kwargs))
+        if not self._flushing and not self._timer.isActive():
+            self._timer.start()
+
+    def request_selection_update(self):
+        """Update the selection after flushing, or right away if not flushing."""
+        self.num_selection_requested += 1
+        if self._flushing:
+            self._selection_update_pending = True
+        else:
+            self._perform_selection_update()
+
+    def suspend(self):
+        self._timer.setInterval(SUSPENDED_FLUSH_INTERVAL)
+
+    def resume(self):
+        self._timer.setInterval(0)
+        self.flush()
+
+    def flush(self):
+        """Perform all pending item updates."""
+        if self._flushing or not self._dirty:
+            return
+        self._timer.stop()
+        self._flushing = True
+        num_performed = self.num_performed
+        try:
+            while self._dirty:
+                depths = {
+                    item_id: _item_depth(item) for item_id, (item, args) in self._dirty.items() if _is_attached(item)
+                }
+                if not depths:
+                    # Only items no longer shown in the views are left
+                    self.num_dropped += len(self._dirty)
+                    self._dirty.clear()
+                    break
+                max_depth = max(depths.values())
+                for item_id in [item_id for item_id, depth in depths.items() if depth == max_depth]:
+                    item, args = self._dirty.pop(item_id)
+                    self.num_performed += 1
+                    item.update(**args)
+        finally:
+            self._flushing = False
+        if self._selection_update_pending:
+            self._selection_update_pending = False
+            self._perform_selection_update()
+        log.debug(
+            "Performed %d item updates, %d redundant updates avoided so far",
+            self.num_performed - num_performed,
+            self.num_avoided,
+        )
+
+    def _perform_selection_update(self):
+        self.num_selection_performed += 1
+        if self._update_selection:
+            self._update_selection()
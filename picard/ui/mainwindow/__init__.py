@@ -139,6 +139,7 @@ from picard.ui.itemviews import (
     BaseTreeView,
     MainPanel,
 )
+from picard.ui.itemviews.updatescheduler import ItemUpdateScheduler
 from picard.ui.logview import (
     HistoryView,
     LogView,
@@ -194,6 +195,15 @@ class MainWindow(QtWidgets.QMainWindow, PreserveGeometry):
             on_first_enter=self.suspend_while_loading_enter,
             on_last_exit=self.suspend_while_loading_exit,
         )
+        # Item updates are coalesced, pending updates get performed before sorting
+        # and filtering are enabled again.
+        self.item_update_scheduler = ItemUpdateScheduler(
+            update_selection=partial(self.update_selection, new_selection=False)
+        )
+        self.register_suspend_while_loading(
+            on_enter=self.item_update_scheduler.suspend,
+            on_exit=self.item_update_scheduler.resume,
+        )
         self.register_suspend_while_loading(
             on_enter=partial(self.set_sorting, sorting=False),
             on_exit=partial(self.set_sorting, sorting=True),
@@ -71,6 +71,7 @@ from .edittagdialog import (
 )
 from .tagdiff import (
     TagDiff,
+    TagDiffAggregator,
     TagStatus,
 )
 
@@ -192,6 +193,11 @@ class MetadataBox(QtWidgets.QTableWidget):
         self.tracks = set()
         self.objects = set()
         self.tag_diff = None
+        # Per file tag diff contributions, only accessed from the update job
+        self._tag_diff_aggregator = TagDiffAggregator()
+        self._drop_tag_diff_cache = False
+        # Incremented for each update job, older jobs abort early
+        self._update_serial = 0
         self.selection_mutex = QtCore.QMutex()
         self.selection_dirty = False
         self.editing = None  # the QTableWidgetItem being edited
@@ -248,11 +254,14 @@ class MetadataBox(QtWidgets.QTableWidget):
             "va_name",
             "windows_compatibility",
         }
+        # Any setting can influence how file formats present tags
+        self._drop_tag_diff_cache = True
         if name in settings_to_watch:
             self.update(drop_album_caches=False)
 
     def _on_plugin_changed(self, plugin):
         """Handle plugin enabled/disabled - refresh metadata display"""
+        self._drop_tag_diff_cache = True
         self.update(drop_album_caches=False)
 
     def _get_file_lookup(self):
@@ -725,16 +734,30 @@ class MetadataBox(QtWidgets.QTableWidget):
             return
         if new_selection:
             self._update_selection()
+        self._update_serial += 1
+        serial = self._update_serial
         thread.run_task(
-            partial(self._update_tags, new_selection, drop_album_caches),
-            self._update_items,
+            partial(self._update_tags, new_selection, drop_album_caches, serial),
+            partial(self._on_tags_updated, serial),
             thread_pool=self.tagger.priority_thread_pool,
         )
 
-    def _update_tags(self, new_selection=True, drop_album_caches=False):
+    def _is_stale(self, serial):
+        return serial is not None and serial != self._update_serial
+
+    def _on_tags_updated(self, serial, result=None, error=None):
+        if self._is_stale(serial):
+            # A newer update job is pending, its result will be displayed
+            return
+        self._update_items(result=result, error=error)
+
+    def _update_tags(self, new_selection=True, drop_album_caches=False, serial=None):
         """
         Build a TagDiff object representing the differences between original and new metadata
         for the current selection of files and tracks.
+
+        If serial is given and another update got requested meanwhile, the job
+        is aborted early and returns None.
         """
         self.selection_mutex.lock()
         files = self.files
@@ -756,49 +779,81 @@ class MetadataBox(QtWidgets.QTableWidget):
 
         config = get_config()
         tag_diff = TagDiff(max_length_diff=config.setting['ignore_track_duration_difference_under'])
-        tag_diff.objects = len(files)
 
         top_tags = config.setting['metadatabox_top_tags']
 
-        self._add_files_to_tag_diff(files, tag_diff, config, top_tags)
+        if not self._add_files_to_tag_diff(files, tag_diff, config, top_tags, serial):
+            return None
         self._add_tracks_to_tag_diff(tracks, tag_diff, config)
 
         tag_diff.update_tag_names(config.persist['show_changes_first'], top_tags)
         return tag_diff
 
-    def _add_files_to_tag_diff(self, files, tag_diff, config, top_tags):
+    def _add_files_to_tag_diff(self, files, tag_diff, config, top_tags, serial=None):
         """
         Add file tags and special tags (~length, ~filepath) to tag_diff.
+
+        The contribution of each file is kept in the tag diff aggregator and
+        only recomputed if the metadata of the file changed since.
+
+        Returns False if the update got aborted, because it became stale.
         """
         top_tags_set = set(top_tags)
         settings = config.setting.as_dict()
-        clear_existing_tags = settings['clear_existing_tags']
+        aggregator = self._tag_diff_aggregator
+        context = (
+            settings['clear_existing_tags'],
+            settings['ignore_track_duration_difference_under'],
+            tuple(top_tags),
+        )
+        if self._drop_tag_diff_cache:
+            self._drop_tag_diff_cache = False
+            aggregator.clear()
+        aggregator.retain(files)
         for file in files:
-            new_metadata = file.metadata
-            orig_metadata = file.orig_metadata
-            tags = set(new_metadata) | set(orig_metadata)
+            if self._is_stale(serial):
+                return False
+            stamp = (context, file.metadata.generation, file.orig_metadata.generation)
+            if not aggregator.is_current(file, stamp):
+                aggregator.set(file, stamp, self._file_tag_diff_entries(file, tag_diff, settings, top_tags_set))
+        aggregator.apply(tag_diff)
+
+        # Add filepath tag if only one file
+        if len(files) == 1:
+            file = next(iter(files))
+            if settings['rename_files'] or settings['move_files']:
+                new_filename = file.make_filename(file.filename, file.metadata)
+            else:
+                new_filename = file.filename
+            tag_diff.add('~filepath', old=[file.filename], new=[new_filename], removable=False, readonly=True)
+        return True
 
-            for tag in tags:
-                if tag.startswith("~") or not file.supports_tag(tag):
-                    continue
-                new_values = file.format_specific_metadata(new_metadata, tag, settings)
-                orig_values = file.format_specific_metadata(orig_metadata, tag, settings)
+    @staticmethod
+    def _file_tag_diff_entries(file, tag_diff, settings, top_tags):
+        """
+        Yield the tag diff entries of a single file, including the ~length tag.
+        """
+        clear_existing_tags = settings['clear_existing_tags']
+        new_metadata = file.metadata
+        orig_metadata = file.orig_metadata
+        tags = set(new_metadata) | set(orig_metadata)
 
-                if not clear_existing_tags and not new_values:
-                    new_values = list(orig_values or [""])
+        for tag in tags:
+            if tag.startswith("~") or not file.supports_tag(tag):
+                continue
+            new_values = file.format_specific_metadata(new_metadata, tag, settings)
+            orig_values = file.format_specific_metadata(orig_metadata, tag, settings)
 
-                removed = tag in new_metadata.deleted_tags
-                tag_diff.add(tag, old=orig_values, new=new_values, removed=removed, top_tags=top_tags_set)
+            if not clear_existing_tags and not new_values:
+                new_values = list(orig_values or [""])
 
-            # Always add length tag
-            tag_diff.add('~length', str(orig_metadata.length), str(new_metadata.length), removable=False, readonly=True)
-            # Add filepath tag if only one file
-            if len(files) == 1:
-                if settings['rename_files'] or settings['move_files']:
-                    new_filename = file.make_filename(file.filename, new_metadata)
-                else:
-                    new_filename = file.filename
-                tag_diff.add('~filepath', old=[file.filename], new=[new_filename], removable=False, readonly=True)
+            removed = tag in new_metadata.deleted_tags
+            yield tag_diff.make_entry(tag, old=orig_values, new=new_values, removed=removed, top_tags=top_tags)
+
+        # Always add length tag
+        yield tag_diff.make_entry(
+            '~length', str(orig_metadata.length), str(new_metadata.length), removable=False, readonly=True
+        )
 
     def _add_tracks_to_tag_diff(self, tracks, tag_diff, config):
         """
@@ -61,6 +61,20 @@ class TagStatus:
 
 TagCounterDisplayValue = namedtuple('TagCounterDisplayValue', ('text', 'is_grouped'))
 TagCounterStatus = namedtuple('TagCounterStatus', ('is_grouped', 'count', 'is_different', 'missing'))
+TagDiffEntry = namedtuple('TagDiffEntry', ('tag', 'old', 'new', 'flags'))
+
+
+def _freeze(values):
+    # Tag values are lists, except for '~length', make them usable as dict keys
+    if isinstance(values, list):
+        return tuple(values)
+    return values or None
+
+
+def _thaw(values):
+    if isinstance(values, tuple):
+        return list(values)
+    return values
 
 
 class TagCounter(dict):
@@ -142,6 +156,19 @@ class TagCounter(dict):
                 self[tag] = [""]
         self.counts[tag] += 1
 
+    def add_counts(self, tag, value_counts):
+        """
+        Adds tag information for several objects at once.
+
+        Args:
+            tag: The tag name (string).
+            value_counts: A mapping of (hashable) values to the number of
+                          objects having those values.
+        """
+        for values, count in value_counts.items():
+            self.add(tag, _thaw(values))
+            self.counts[tag] += count - 1
+
     def status(self, tag):
         """
         Returns tag status as a named tuple TagCounterStatus
@@ -281,26 +308,46 @@ class TagDiff:
         if new:
             self.new.add(tag, new)
 
+        self.status[tag] |= self.status_flags(tag, old, new, removable, removed, readonly, top_tags)
+
+    def status_flags(self, tag, old=None, new=None, removable=True, removed=False, readonly=False, top_tags=None):
+        """
+        Returns the TagStatus flags a single object adds for a tag.
+
+        Takes the same arguments as `add`, but does not modify the TagDiff.
+        """
         if not top_tags:
             top_tags = set()
 
         if (old and not new) or removed:
-            self.status[tag] |= TagStatus.REMOVED
+            flags = TagStatus.REMOVED
         elif new and not old:
-            self.status[tag] |= TagStatus.ADDED
+            flags = TagStatus.ADDED
             removable = True
         elif old and new and self.__tag_ne(tag, old, new):
-            self.status[tag] |= TagStatus.CHANGED
+            flags = TagStatus.CHANGED
         elif not (old or new or tag in top_tags):
-            self.status[tag] |= TagStatus.EMPTY
+            flags = TagStatus.EMPTY
         else:
-            self.status[tag] |= TagStatus.UNCHANGED
+            flags = TagStatus.UNCHANGED
 
         if not removable:
-            self.status[tag] |= TagStatus.NOTREMOVABLE
+            flags |= TagStatus.NOTREMOVABLE
 
         if readonly:
-            self.status[tag] |= TagStatus.READONLY
+            flags |= TagStatus.READONLY
+
+        return flags
+
+    def make_entry(self, tag, old=None, new=None, removable=True, removed=False, readonly=False, top_tags=None):
+        """
+        Returns the contribution of a single object for a tag as an entry
+        suitable for `TagDiffAggregator`.
+
+        Takes the same arguments as `add`.
+        """
+        flags = self.status_flags(tag, old, new, removable, removed, readonly, top_tags)
+        return TagDiffEntry(tag, _freeze(old), _freeze(new), flags)
 
     def tag_status(self, tag):
         """
@@ -388,3 +435,91 @@ class TagDiff:
             )
 
         return f.getvalue()
+
+
+class TagDiffAggregator:
+    """
+    Maintains the tag differences of a changing set of objects.
+
+    Each object contributes a sequence of `TagDiffEntry` tuples (see
+    `TagDiff.make_entry`), which are stored together with a stamp
+    identifying the state of the object they were computed from. The counts
+    of all contributions are kept aggregated, so objects can be added,
+    replaced and removed without recomputing the contributions of all other
+    objects. `apply` then fills a `TagDiff` from the aggregated counts in
+    time proportional to the number of distinct tag values.
+
+    The aggregator is not thread safe, it is meant to be used from a single
+    worker thread.
+    """
+
+    __slots__ = ('_contributions', '_old', '_new', '_status')
+
+    def __init__(self):
+        self._contributions = {}
+        self._old = defaultdict(Counter)
+        self._new = defaultdict(Counter)
+        self._status = defaultdict(Counter)
+
+    def __len__(self):
+        return len(self._contributions)
+
+    def __contains__(self, key):
+        return key in self._contributions
+
+    def is_current(self, key, stamp):
+        """Returns True if the contribution stored for key was made with stamp."""
+        contribution = self._contributions.get(key)
+        return contribution is not None and contribution[0] == stamp
+
+    def set(self, key, stamp, entries):
+        """Stores the entries as contribution of key, replacing a previous one."""
+        self.remove(key)
+        entries = tuple(entries)
+        self._contributions[key] = (stamp, entries)
+        self._count(entries, 1)
+
+    def remove(self, key):
+        """Removes the contribution of key, if any."""
+        contribution = self._contributions.pop(key, None)
+        if contribution is not None:
+            self._count(contribution[1], -1)
+
+    def retain(self, keys):
+        """Removes the contributions of all objects not in keys."""
+        for key in [key for key in self._contributions if key not in keys]:
+            self.remove(key)
+
+    def clear(self):
+        self._contributions.clear()
+        self._old.clear()
+        self._new.clear()
+        self._status.clear()
+
+    def _count(self, entries, delta):
+        for tag, old, new, flags in entries:
+            if old:
+                self._update_counter(self._old, tag, old, delta)
+            if new:
+                self._update_counter(self._new, tag, new, delta)
+            self._update_counter(self._status, tag, flags, delta)
+
+    @staticmethod
+    def _update_counter(counters, tag, value, delta):
+        counter = counters[tag]
+        counter[value] += delta
+        if counter[value] <= 0:
+            del counter[value]
+            if not counter:
+                del counters[tag]
+
+    def apply(self, tag_diff):
+        """Adds the aggregated contributions of all objects to tag_diff."""
+        tag_diff.objects += len(self._contributions)
+        for tag, value_counts in self._old.items():
+            tag_diff.old.add_counts(tag, value_counts)
+        for tag, value_counts in self._new.items():
+            tag_diff.new.add_counts(tag, value_counts)
+        for tag, flag_counts in self._status.items():
+            for flags in flag_counts:
+                tag_diff.status[tag] |= flags
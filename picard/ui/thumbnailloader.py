@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Decoding of cover art images for display.
+
+Reading and decoding large scans takes long enough to make the user interface
+stutter when changing the selection. Images are decoded and scaled down on a
+worker thread, the resulting pixmaps are kept in a bounded cache. Widgets show
+a placeholder and get notified once the pixmap is available.
+"""
+
+from functools import partial
+
+from PyQt6 import (
+    QtCore,
+    QtGui,
+)
+
+from picard import log
+from picard.coverart.image import CoverArtImageIOError
+from picard.util import thread
+from picard.util.lrucache import LRUCache
+
+
+# Maximum number of decoded pixmaps to keep
+THUMBNAIL_CACHE_SIZE = 100
+
+
+def decode_image(image, size):
+    """Read and decode the CoverArtImage image, scaled down to fit into a
+    square of size pixels. Returns a QImage or None on failure.
+
+    QImage can be used outside the GUI thread, unlike QPixmap.
+    """
+    try:
+        data = image.data
+    except CoverArtImageIOError as e:
+        log.warning("Failed reading cover art image: %s", e)
+        return None
+    qimage = QtGui.QImage()
+    if not data or not qimage.loadFromData(data):
+        return None
+    if qimage.width() > size or qimage.height() > size:
+        qimage = qimage.scaled(
+            size,
+            size,
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+    return qimage
+
+
+class ThumbnailLoader(QtCore.QObject):
+    # Emitted with the cache key once an image has been decoded
+    decoded = QtCore.pyqtSignal(object)
+
+    def __init__(self, max_size=THUMBNAIL_CACHE_SIZE, parent=None):
+        super().__init__(parent=parent)
+        self._cache = LRUCache(max_size)
+        self._pending = set()
+
+    @staticmethod
+    def cache_key(image, size):
+        if image.datahash is None:
+            return None
+        return (image.datahash.hash, size)
+
+    def load(self, image, size):
+        """Return the pixmap of image scaled down to size.
+
+        A null pixmap is returned for images which can't be decoded. If the
+        image was not decoded yet None is returned, decoding starts on a worker
+        thread and `decoded` gets emitted once the pixmap is available.
+        """
+        key = self.cache_key(image, size)
+        if key is None:
+            return QtGui.QPixmap()
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key not in self._pending:
+            self._pending.add(key)
+            thread.run_task(partial(decode_image, image, size), partial(self._decoded, key), priority=1)
+        return None
+
+    def _decoded(self, key, result=None, error=None):
+        self._pending.discard(key)
+        if error is None and result is not None:
+            pixmap = QtGui.QPixmap.fromImage(result)
+        else:
+            pixmap = QtGui.QPixmap()
+        self._cache[key] = pixmap
+        self.decoded.emit(key)
+
+
+thumbnail_loader = ThumbnailLoader()
@@ -50,6 +50,10 @@ except ImportError:
         from chardet import detect  # type: ignore[unresolved-import]
     except ImportError:
         detect = None
+try:
+    import orjson  # type: ignore[unresolved-import]
+except ImportError:
+    orjson = None
 from collections import (
     defaultdict,
     namedtuple,
@@ -60,7 +64,10 @@ from datetime import (
     date,
     datetime,
 )
-from itertools import chain
+from itertools import (
+    chain,
+    count,
+)
 import json
 import ntpath
 from operator import attrgetter
@@ -115,6 +122,8 @@ WIN_LONGPATH_PREFIX_UNC = '\\\\?\\UNC\\'
 class ReadWriteLockContext:
     """Context for releasing a locked QReadWriteLock"""
 
+    __slots__ = ('__lock',)
+
     def __init__(self):
         self.__lock = QtCore.QReadWriteLock()
 
@@ -139,6 +148,19 @@ class ReadWriteLockContext:
         return self._entered > 0
 
 
+_generations = count(1)
+
+
+def next_generation():
+    """Returns a new generation number, increasing over all callers.
+
+    Mutable objects take a new generation number on every change. A value
+    cached for an object stays valid as long as the generation it was
+    computed for is unchanged.
+    """
+    return next(_generations)
+
+
 def process_events_iter(iterable, interval=0.1):
     """
     Creates an iterator over iterable that calls QCoreApplication.processEvents()
@@ -860,28 +882,13 @@ def union_sorted_lists(list1, list2):
     return union
 
 
-def __convert_to_string(obj):
-    """Appropriately converts the input `obj` to a string.
-
-    Args:
-        obj (QByteArray, bytes, bytearray, ...): The input object
-
-    Returns:
-        string: The appropriately decoded string
-
-    """
-    if isinstance(obj, QtCore.QByteArray):
-        return bytes(obj).decode()
-    elif isinstance(obj, (bytes, bytearray)):
-        return obj.decode()
-    else:
-        return str(obj)
-
-
 def load_json(data):
     """Deserializes a string or bytes like json response and converts
     it to a python object.
 
+    Bytes are parsed directly, without decoding them to a string first.
+    If the optional orjson module is available it is used for parsing.
+
     Args:
         data (QByteArray, bytes, bytearray, ...): The json response
 
@@ -889,7 +896,18 @@ def load_json(data):
         dict: Response data as a python dict
 
     """
-    return json.loads(__convert_to_string(data))
+    if isinstance(data, QtCore.QByteArray):
+        data = data.data()
+    elif not isinstance(data, (str, bytes, bytearray)):
+        data = str(data)
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module, e.g. it does not
+            # support integers exceeding 64 bit. Fall back to json.
+            pass
+    return json.loads(data)
 
 
 def parse_json(reply):
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Shared cache of directory listings.
+
+Listing directories can be slow, especially on network shares. The listings
+of the directories scanned when adding files are kept, so that later lookups
+of the same directories, like searching for local cover art, don't need to
+access the file system again. Listings get invalidated when Picard changes
+the content of a directory.
+"""
+
+from collections import namedtuple
+import os
+from threading import Lock
+
+from picard import log
+
+
+DirectoryListing = namedtuple('DirectoryListing', ['files', 'dirs'])
+
+
+class DirectoryListings:
+    def __init__(self):
+        self._listings = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._listings)
+
+    def __contains__(self, path):
+        with self._lock:
+            return os.path.normpath(path) in self._listings
+
+    def set(self, path, files, dirs):
+        """Store the listing of path, files and dirs being lists of names.
+
+        dirs must not include symbolic links to directories, walking the
+        listings does not follow them.
+        """
+        listing = DirectoryListing(tuple(files), tuple(dirs))
+        with self._lock:
+            self._listings[os.path.normpath(path)] = listing
+        return listing
+
+    def set_from_entries(self, path, entries):
+        """Store the listing of path from a list of `os.DirEntry`."""
+        files = []
+        dirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.name)
+                elif not entry.is_dir():
+                    files.append(entry.name)
+            except OSError:
+                continue
+        return self.set(path, files, dirs)
+
+    def get(self, path):
+        """Return the listing of path, reading it if it is not cached."""
+        path = os.path.normpath(path)
+        with self._lock:
+            listing = self._listings.get(path)
+        if listing is not None:
+            return listing
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            log.debug("Failed listing directory %r: %s", path, e)
+            return DirectoryListing((), ())
+        return self.set_from_entries(path, entries)
+
+    def walk(self, top):
+        """Walk the directory tree below top, like `os.walk` but using the cached listings."""
+        top = os.path.normpath(top)
+        listing = self.get(top)
+        yield top, listing.dirs, listing.files
+        for name in listing.dirs:
+            yield from self.walk(os.path.join(top, name))
+
+    def invalidate(self, path, parents=False, recursive=False):
+        """Forget the listing of path, it gets read again on next access.
+
+        If parents is set the listings of all parent directories are
+        forgotten as well, if recursive is set all listings below path.
+        """
+        path = os.path.normpath(path)
+        with self._lock:
+            self._listings.pop(path, None)
+            if parents:
+                head, tail = os.path.split(path)
+                while tail:
+                    self._listings.pop(head, None)
+                    head, tail = os.path.split(head)
+            if recursive:
+                prefix = os.path.join(path, '')
+                for key in [key for key in self._listings if key.startswith(prefix)]:
+                    del self._listings[key]
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+
+directory_listings = DirectoryListings()
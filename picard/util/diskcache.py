@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Size bounded disk cache with least recently used eviction."""
+
+from collections import OrderedDict
+import os
+import tempfile
+from threading import Lock
+
+from picard import log
+from picard.util import bytes2human
+
+
+class DiskCache:
+    """Size bounded cache of binary data stored in a directory.
+
+    Entries get evicted in least recently used order once the total size
+    exceeds max_size. The access order survives restarts, as the modification
+    time of the cache files gets updated on every hit.
+    """
+
+    def __init__(self, directory, max_size, name='disk'):
+        self.directory = directory
+        self.name = name
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._size = 0
+        self._lock = Lock()
+
+    @property
+    def size(self):
+        with self._lock:
+            self._load_index()
+            return self._size
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def _load_index(self):
+        if self._entries is not None:
+            return
+        self._entries = OrderedDict()
+        self._size = 0
+        try:
+            with os.scandir(self.directory) as it:
+                files = [(entry.stat().st_mtime, entry.name, entry.stat().st_size) for entry in it if entry.is_file()]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            log.warning("Failed reading %s cache %r: %s", self.name, self.directory, e)
+            return
+        for _mtime, name, size in sorted(files):
+            if name.startswith('.'):
+                # Temporary file of an entry being written
+                continue
+            self._entries[name] = size
+            self._size += size
+        log.debug(
+            "%s cache %r: %d entries, %s",
+            self.name,
+            self.directory,
+            len(self._entries),
+            bytes2human.decimal(self._size, l10n=False),
+        )
+
+    def _remove_file(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.warning("Failed removing %s cache entry %s: %s", self.name, key, e)
+
+    def _forget(self, key):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    def get(self, key):
+        """Return the cached data for key or None if not cached."""
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError as e:
+            log.debug("Failed reading %s cache entry %s: %s", self.name, key, e)
+            with self._lock:
+                self._forget(key)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store data for key and evict old entries if the cache is too large."""
+        if len(data) > self.max_size:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix='.', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            log.warning("Failed writing %s cache entry %s: %s", self.name, key, e)
+            return
+        with self._lock:
+            self._load_index()
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._size += len(data)
+            while self._size > self.max_size:
+                old_key, size = self._entries.popitem(last=False)
+                self._size -= size
+                self._remove_file(old_key)
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            for key in self._entries:
+                self._remove_file(key)
+            self._entries.clear()
+            self._size = 0
+
+    def log_statistics(self):
+        log.debug(
+            "%s cache: %d hits, %d misses (%.1f%% hit rate)",
+            self.name,
+            self.hits,
+            self.misses,
+            100 * self.hit_rate,
+        )
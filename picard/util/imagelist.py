@@ -24,6 +24,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from collections import Counter
 from collections.abc import (
     Iterable,
     MutableSequence,
@@ -31,17 +32,46 @@ from collections.abc import (
 from typing import TYPE_CHECKING
 
 from picard.config import get_config
+from picard.util import next_generation
 
 
 if TYPE_CHECKING:
     from picard.coverart import CoverArtImage
 
 
+def _types_support(image):
+    """Returns how image compares its types, see `CoverArtImage.__eq__`."""
+    if not image.support_types:
+        return 0
+    if not image.support_multi_types:
+        return 1
+    return 2
+
+
+def _fingerprint_key(image, types_support):
+    """Returns a key which is equal for images comparing equal, as long as
+    the images have the same types support."""
+    try:
+        if types_support == 2:
+            return (image.datahash.hash, tuple(image.types))
+        if types_support == 1:
+            return (image.datahash.hash, image.maintype)
+        return image.datahash.hash
+    except AttributeError:
+        # Image without data
+        return image
+
+
 class ImageList(MutableSequence['CoverArtImage']):
     def __init__(self, iterable: Iterable['CoverArtImage'] | None = None):
         self._images: list['CoverArtImage'] = list(iterable or ())
+        # True if _images might be shared with a copy of this list
+        self._shared = False
         self._hash_dict = {}
         self._dirty = True
+        # (generation, fingerprint) of the last computed fingerprint
+        self._fingerprint = None
+        self.generation = next_generation()
 
     def __len__(self):
         return len(self._images)
@@ -51,30 +81,74 @@ class ImageList(MutableSequence['CoverArtImage']):
 
     def __setitem__(self, index, value):
         if self._images[index] != value:
+            self._unshare()
             self._images[index] = value
-            self._dirty = True
+            self._changed()
 
     def __delitem__(self, index):
+        self._unshare()
         del self._images[index]
-        self._dirty = True
+        self._changed()
 
     def insert(self, index, value: 'CoverArtImage'):
+        self._unshare()
         self._images.insert(index, value)
+        self._changed()
+
+    def _unshare(self):
+        # Must be called before modifying _images in place
+        if self._shared:
+            self._images = list(self._images)
+            self._shared = False
+
+    def _changed(self):
         self._dirty = True
+        self.generation = next_generation()
 
     def __repr__(self):
         return '%s(%r)' % (self.__class__.__name__, self._images)
 
+    def fingerprint(self):
+        """Returns a hashable value identifying the images and their types,
+        independent of the order of the images.
+
+        The fingerprint is a tuple of the types support of the images and the
+        image keys. It is cached until the list gets modified.
+        """
+        if self._fingerprint is None or self._fingerprint[0] != self.generation:
+            types_support = frozenset(_types_support(image) for image in self._images)
+            keys = Counter()
+            for image in self._images:
+                keys[_fingerprint_key(image, _types_support(image))] += 1
+            self._fingerprint = (self.generation, (types_support, frozenset(keys.items())))
+        return self._fingerprint[1]
+
     def _sorted(self):
         return sorted(self, key=lambda image: image.normalized_types())
 
     def __eq__(self, other) -> bool:
+        if not isinstance(other, ImageList):
+            return NotImplemented
+        if self is other:
+            return True
         if len(self) != len(other):
             return False
+        types_support, keys = self.fingerprint()
+        other_types_support, other_keys = other.fingerprint()
+        if len(types_support) <= 1 and types_support == other_types_support:
+            return keys == other_keys
+        # Images with different types support compare only part of their
+        # types, compare them one by one.
         return self._sorted() == other._sorted()
 
     def copy(self):
-        return self.__class__(self._images)
+        """Returns a copy, which shares the images with this list until either gets modified."""
+        copy = self.__class__()
+        copy._images = self._images
+        copy._shared = self._shared = True
+        if self._fingerprint is not None and self._fingerprint[0] == self.generation:
+            copy._fingerprint = (copy.generation, self._fingerprint[1])
+        return copy
 
     def get_front_image(self) -> 'CoverArtImage | None':
         for img in self:
@@ -103,7 +177,8 @@ class ImageList(MutableSequence['CoverArtImage']):
 
     def strip_front_images(self):
         self._images = [image for image in self._images if not image.is_front_image()]
-        self._dirty = True
+        self._shared = False
+        self._changed()
 
     def hash_dict(self):
         if self._dirty:
@@ -121,3 +196,134 @@ class ImageList(MutableSequence['CoverArtImage']):
                     continue
             types_dict[image_types] = image
         return types_dict
+
+
+class ImageMultiset:
+    """Reference counted multiset of the images of several sources.
+
+    Each source (e.g. a child item) contributes the images of an `ImageList`.
+    Images are identified by their data hash and counted once per source
+    containing them. Adding, replacing or removing a source only requires
+    work proportional to the number of images of that source.
+    """
+
+    __slots__ = ('_sources', '_counts', '_images', '_histogram', '_sources_with_images', '_result')
+
+    def __init__(self):
+        # source -> (generation of the source ImageList, hashes)
+        self._sources = {}
+        # hash -> number of sources containing the image
+        self._counts = {}
+        # hash -> image
+        self._images = {}
+        # reference count -> number of hashes with that reference count
+        self._histogram = Counter()
+        self._sources_with_images = 0
+        # (ImageList, generation) last returned by to_imagelist()
+        self._result = None
+
+    def __len__(self):
+        return len(self._images)
+
+    def __contains__(self, source):
+        return source in self._sources
+
+    def sources(self):
+        return self._sources.keys()
+
+    def hashes(self):
+        return self._images.keys()
+
+    @property
+    def has_common_images(self):
+        """True if all sources having images have the same images."""
+        return self._histogram[self._sources_with_images] == len(self._counts)
+
+    def add(self, source, images):
+        """Adds or replaces the images of source.
+
+        Returns True if the set of images changed.
+        """
+        previous = self._sources.get(source)
+        if previous is not None and previous[0] == images.generation:
+            return False
+        hash_dict = images.hash_dict()
+        if previous is not None and previous[1] == hash_dict.keys():
+            self._sources[source] = (images.generation, previous[1])
+            return False
+        changed = self.discard(source)
+        for datahash, image in hash_dict.items():
+            if self._incref(datahash):
+                self._images[datahash] = image
+                changed = True
+        self._sources[source] = (images.generation, frozenset(hash_dict))
+        if hash_dict:
+            self._sources_with_images += 1
+        return changed
+
+    def discard(self, source):
+        """Removes the images of source.
+
+        Returns True if the set of images changed.
+        """
+        previous = self._sources.pop(source, None)
+        if previous is None:
+            return False
+        changed = False
+        for datahash in previous[1]:
+            if self._decref(datahash):
+                del self._images[datahash]
+                changed = True
+        if previous[1]:
+            self._sources_with_images -= 1
+        return changed
+
+    def retain(self, sources):
+        """Removes all sources not in sources.
+
+        Returns True if the set of images changed.
+        """
+        changed = False
+        for source in [source for source in self._sources if source not in sources]:
+            changed |= self.discard(source)
+        return changed
+
+    def clear(self):
+        self._sources.clear()
+        self._counts.clear()
+        self._images.clear()
+        self._histogram.clear()
+        self._sources_with_images = 0
+        self._result = None
+
+    def _incref(self, datahash):
+        count = self._counts.get(datahash, 0)
+        if count:
+            self._histogram[count] -= 1
+        self._counts[datahash] = count + 1
+        self._histogram[count + 1] += 1
+        return count == 0
+
+    def _decref(self, datahash):
+        count = self._counts[datahash]
+        self._histogram[count] -= 1
+        if count == 1:
+            del self._counts[datahash]
+            return True
+        self._counts[datahash] = count - 1
+        self._histogram[count - 1] += 1
+        return False
+
+    def to_imagelist(self):
+        """Returns a new ImageList with all images."""
+        images = ImageList(self._images.values())
+        self._result = (images, images.generation)
+        return images
+
+    def adopt(self, images):
+        """Uses images, which has the same images as this multiset, as result instead of a new list."""
+        self._result = (images, images.generation)
+
+    def is_result(self, images):
+        """True if images is the unmodified list last returned by `to_imagelist`."""
+        return self._result is not None and self._result[0] is images and images.generation == self._result[1]
@@ -20,27 +20,39 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
-from pathlib import Path
+from functools import partial
+import os
+from threading import Lock
 
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QTimer,
+)
 
 from picard import log
+from picard.util import thread
 
 
 TOUCH_FILES_DELAY_SECONDS = 4 * 3600
+# Number of files touched between checks for Picard shutting down
+TOUCH_FILES_CHUNK_SIZE = 1000
 
 _touch_timer = None
 _files_to_touch = set()
+_files_lock = Lock()
+_touching = False
 
 
 def register_file(filepath):
     if _touch_timer and _touch_timer.isActive():
-        _files_to_touch.add(filepath)
+        with _files_lock:
+            _files_to_touch.add(filepath)
 
 
 def unregister_file(filepath):
     if _touch_timer and _touch_timer.isActive():
-        _files_to_touch.discard(filepath)
+        with _files_lock:
+            _files_to_touch.discard(filepath)
 
 
 def enable_timer():
@@ -52,13 +64,51 @@ def enable_timer():
 
 
 def _touch_files():
-    log.debug("Touching %i files", len(_files_to_touch))
-    for filepath in _files_to_touch.copy():
-        path = Path(filepath)
-        if path.exists():
+    """Touch the registered files on a worker thread.
+
+    Only a snapshot of the registered files is taken on the main thread, with
+    many cover art images touching them takes a while.
+    """
+    global _touching
+    if _touching:
+        log.debug("Files are still being touched, skipping")
+        return
+    with _files_lock:
+        files = list(_files_to_touch)
+    log.debug("Touching %i files", len(files))
+    _touching = True
+    thread.run_task(partial(touch_files, files), _touch_files_finished)
+
+
+def _touch_files_finished(result=None, error=None):
+    global _touching
+    _touching = False
+    if error is None:
+        log.debug("Touched %i files", result)
+
+
+def touch_files(files, chunk_size=TOUCH_FILES_CHUNK_SIZE):
+    """Update access and modification times of files, in chunks.
+
+    Files which don't exist anymore get unregistered. Returns the number of
+    touched files.
+    """
+    tagger = QCoreApplication.instance()
+    touched = 0
+    for start in range(0, len(files), chunk_size):
+        if getattr(tagger, 'stopping', False):
+            break
+        missing = []
+        for filepath in files[start : start + chunk_size]:
             try:
-                path.touch()
+                # Unlike Path.touch() this never recreates removed files
+                os.utime(filepath)
+                touched += 1
+            except FileNotFoundError:
+                missing.append(filepath)
             except OSError:
                 log.error("error touching file `%s`", filepath, exc_info=True)
-        else:
-            unregister_file(filepath)
+        if missing:
+            with _files_lock:
+                _files_to_touch.difference_update(missing)
+    return touched
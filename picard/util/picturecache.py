@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Cache of cover art images encoded for embedding into tags.
+
+When saving an album usually the same images get embedded into all of its
+files. The image data is read from the temporary files and encoded for the
+tag format only once, the results are shared by the save threads while files
+are being saved. The cache gets cleared once no file is being saved anymore.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+
+# Maximum size in bytes of the cached encoded images
+ENCODED_PICTURE_CACHE_SIZE = 64 * 1000 * 1000
+
+
+class EncodedPictureCache:
+    def __init__(self, max_size=ENCODED_PICTURE_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._size = 0
+        # Locks of the entries being encoded
+        self._pending = {}
+        self._saving = 0
+        self._lock = Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def start_saving(self):
+        """Called before a file gets saved."""
+        with self._lock:
+            self._saving += 1
+
+    def finish_saving(self):
+        """Called after a file got saved, clears the cache after the last one."""
+        with self._lock:
+            self._saving = max(0, self._saving - 1)
+            if not self._saving:
+                self._entries.clear()
+                self._size = 0
+
+    def get(self, image, key, encode):
+        """Return the cached value for key of the CoverArtImage image,
+        encode() gets called to create it.
+
+        The value of a key gets only created once, even if several threads
+        request it at the same time. Values are only kept while files are
+        being saved.
+        """
+        if image.datahash is None:
+            return encode()
+        key = (image.datahash.hash, key)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            key_lock = self._pending.setdefault(key, Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    return self._entries[key]
+            try:
+                value = encode()
+                with self._lock:
+                    if self._saving and len(value) <= self.max_size:
+                        self._entries[key] = value
+                        self._size += len(value)
+                        while self._size > self.max_size:
+                            _key, old_value = self._entries.popitem(last=False)
+                            self._size -= len(old_value)
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+            return value
+
+    def data(self, image):
+        """Return the data of the CoverArtImage image."""
+        return self.get(image, 'data', lambda: image.data)
+
+
+encoded_pictures = EncodedPictureCache()
@@ -64,7 +64,9 @@ from picard.oauth import OAuthManager
 from picard.util import (
     bytes2human,
     encoded_queryargs,
+    load_json,
     parse_json,
+    thread,
 )
 from picard.util.xml import parse_xml
 from picard.webservice import ratecontrol
@@ -73,6 +75,9 @@ from picard.webservice.utils import port_from_qurl
 
 COUNT_REQUESTS_DELAY_MS = 250
 
+# Responses of at least this size get parsed on a worker thread
+ASYNC_PARSE_MIN_BYTES = 128 * 1024
+
 TEMP_ERRORS_RETRIES = 5
 USER_AGENT_STRING = '%s-%s/%s (%s;%s-%s)' % (
     PICARD_ORG_NAME,
@@ -87,7 +92,7 @@ CLIENT_STRING = '%s %s-%s' % (PICARD_ORG_NAME, PICARD_APP_NAME, PICARD_VERSION_S
 
 DEFAULT_RESPONSE_PARSER_TYPE = "json"
 
-Parser = namedtuple('Parser', 'mimetype parser')
+Parser = namedtuple('Parser', 'mimetype parser data_parser', defaults=(None,))
 
 
 class UnknownResponseParserError(Exception):
@@ -108,6 +113,7 @@ class WSRequest(QNetworkRequest):
 
     response_mimetype = None
     response_parser = None
+    response_data_parser = None
 
     def __init__(
         self,
@@ -125,6 +131,7 @@ class WSRequest(QNetworkRequest):
         url=None,
         queryargs=None,
         unencoded_queryargs=None,
+        headers=None,
     ):
         """
         Args:
@@ -146,6 +153,7 @@ class WSRequest(QNetworkRequest):
             url: URL passed as a string or as a QUrl to use for this request
             queryargs: Encoded query arguments, a dictionary mapping field names to values
             unencoded_queryargs: Unencoded query arguments, a dictionary mapping field names to values
+            headers: Additional request headers, a dictionary mapping header names to values
         """
         # mandatory parameters
         self.method = method
@@ -188,6 +196,7 @@ class WSRequest(QNetworkRequest):
         self.refresh = refresh
         self.priority = priority
         self.important = important
+        self.headers = headers
 
         # set headers and attributes
         self.access_token = None  # call _update_authorization_header
@@ -201,6 +210,10 @@ class WSRequest(QNetworkRequest):
 
         self.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, USER_AGENT_STRING)
 
+        if self.headers:
+            for name, value in self.headers.items():
+                self.setRawHeader(name.encode('utf-8'), value.encode('utf-8'))
+
         if self.mblogin or self._high_prio_no_cache:
             self.setPriority(QNetworkRequest.Priority.HighPriority)
             self.setAttribute(
@@ -213,6 +226,7 @@ class WSRequest(QNetworkRequest):
             try:
                 self.response_mimetype = WebService.get_response_mimetype(self.parse_response_type)
                 self.response_parser = WebService.get_response_parser(self.parse_response_type)
+                self.response_data_parser = WebService.get_response_data_parser(self.parse_response_type)
             except UnknownResponseParserError as e:
                 log.error(e.args[0])
             else:
@@ -508,6 +522,7 @@ class WebService(QtCore.QObject):
                 mblogin=request.mblogin,
                 cacheloadcontrol=request.attribute(QNetworkRequest.Attribute.CacheLoadControlAttribute),
                 refresh=request.refresh,
+                headers=request.headers,
             )
 
             ratecontrol.copy_minimal_delay(
@@ -521,6 +536,13 @@ class WebService(QtCore.QObject):
             request.handler(reply.readAll(), reply, error)
 
     def _handle_reply(self, reply, request):
+        """Handle the finished `reply` for `request`.
+
+        Returns True if calling the request handler was deferred until the
+        response got parsed on a worker thread. The reply must then not be
+        released before the handler ran.
+        """
+        deferred = False
         hostkey = request.get_host_key()
         ratecontrol.decrement_requests(hostkey)
 
@@ -538,7 +560,7 @@ class WebService(QtCore.QObject):
         # Silently ignore canceled operations (user-initiated abort)
         if error == QNetworkReply.NetworkError.OperationCanceledError:
             log.debug("Request canceled for %s", self.display_url(reply.request().url()))
-            return
+            return deferred
 
         handler = request.handler
         response_code = self.http_response_code(reply)
@@ -591,6 +613,9 @@ class WebService(QtCore.QObject):
                 # Redirect if found and not infinite
                 if redirect:
                     self._handle_redirect(reply, request, redirect)
+                elif request.response_data_parser and reply.bytesAvailable() >= ASYNC_PARSE_MIN_BYTES:
+                    self._parse_reply_async(reply, request)
+                    deferred = True
                 elif request.response_parser:
                     try:
                         document = request.response_parser(reply)
@@ -607,6 +632,40 @@ class WebService(QtCore.QObject):
                     handler(bytes(reply.readAll()), reply, error)
 
         ratecontrol.adjust(hostkey, slow_down)
+        return deferred
+
+    def _parse_reply_async(self, reply, request):
+        # The reply can only be read on the main thread, but the potentially
+        # expensive parsing of large documents is done on a worker thread.
+        data = reply.readAll().data()
+        thread.run_task(
+            partial(request.response_data_parser, data),
+            partial(self._async_parse_finished, reply, request, data),
+            traceback=False,
+        )
+
+    def _async_parse_finished(self, reply, request, data, result=None, error=None):
+        try:
+            display_reply_url = self.display_url(reply.request().url())
+            if error:
+                log.error("Unable to parse the response for %s -> %s", display_reply_url, error)
+                document = data
+            else:
+                document = result
+                if DebugOpt.WS_REPLIES.enabled:
+                    log.debug("Response received: %s", document)
+            request.handler(document, reply, error)
+        finally:
+            self._release_reply(reply)
+
+    @staticmethod
+    def _release_reply(reply):
+        try:
+            reply.close()
+            reply.deleteLater()
+        except RuntimeError:
+            # Qt object may already be deleted
+            pass
 
     def _process_reply(self, reply):
         try:
@@ -615,15 +674,12 @@ class WebService(QtCore.QObject):
             display_reply_url = self.display_url(reply.request().url())
             log.error("Request not found for %s", display_reply_url)
             return
+        deferred = False
         try:
-            self._handle_reply(reply, request)
+            deferred = self._handle_reply(reply, request)
         finally:
-            try:
-                reply.close()
-                reply.deleteLater()
-            except RuntimeError:
-                # Qt object may already be deleted
-                pass
+            if not deferred:
+                self._release_reply(reply)
 
     def get_url(self, **kwargs):
         kwargs['method'] = 'GET'
@@ -726,8 +782,18 @@ class WebService(QtCore.QObject):
             self._timer_count_pending_requests.start(0)
 
     @classmethod
-    def add_parser(cls, response_type, mimetype, parser):
-        cls.PARSERS[response_type] = Parser(mimetype=mimetype, parser=parser)
+    def add_parser(cls, response_type, mimetype, parser, data_parser=None):
+        """Register a parser for a response type.
+
+        Args:
+            response_type: Name of the response type, e.g. 'json'
+            mimetype: The mimetype to accept for this response type
+            parser: Function parsing a QNetworkReply into a document
+            data_parser: Optional thread-safe function parsing the raw response
+              bytes into a document. If given, large responses are parsed on
+              a worker thread.
+        """
+        cls.PARSERS[response_type] = Parser(mimetype=mimetype, parser=parser, data_parser=data_parser)
 
     @classmethod
     def get_response_mimetype(cls, response_type):
@@ -743,6 +809,13 @@ class WebService(QtCore.QObject):
         else:
             raise UnknownResponseParserError(response_type)
 
+    @classmethod
+    def get_response_data_parser(cls, response_type):
+        if response_type in cls.PARSERS:
+            return cls.PARSERS[response_type].data_parser
+        else:
+            raise UnknownResponseParserError(response_type)
+
 
 WebService.add_parser('xml', 'application/xml', parse_xml)
-WebService.add_parser('json', 'application/json', parse_json)
+WebService.add_parser('json', 'application/json', parse_json, data_parser=load_json)
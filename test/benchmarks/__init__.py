@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+"""Benchmarks for performance critical code paths.
+
+The benchmarks are skipped by default. Run them with::
+
+    PICARD_RUN_BENCHMARKS=1 pytest -s test/benchmarks
+"""
+
+import os
+import time
+import tracemalloc
+import unittest
+
+
+RUN_BENCHMARKS = bool(os.environ.get('PICARD_RUN_BENCHMARKS'))
+
+benchmark = unittest.skipUnless(RUN_BENCHMARKS, "set PICARD_RUN_BENCHMARKS=1 to run benchmarks")
+
+
+def measure(label, func, repeat=3):
+    """Run `func` `repeat` times and print the best wall clock time.
+
+    Returns the best time in seconds.
+    """
+    best = None
+    for _i in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    print("%s: %.2f ms" % (label, best * 1000))
+    return best
+
+
+def measure_memory(label, func):
+    """Run `func` and print the memory it allocated and still holds.
+
+    Returns a tuple of the result of `func` and the held memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print("%s: %.1f KiB held, %.1f KiB peak" % (label, current / 1024, peak / 1024))
+    return result, current
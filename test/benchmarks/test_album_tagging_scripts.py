@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+from test.benchmarks import (
+    benchmark,
+    measure,
+)
+from test.picardtestcase import PicardTestCase
+
+from picard.album import (
+    Album,
+    _run_tagging_scripts,
+)
+from picard.metadata import Metadata
+from picard.script import TaggingScriptSetting
+from picard.track import Track
+
+
+TRACK_COUNT = 500
+
+SCRIPT = """
+$set(title,$title(%title%))
+$if($in(%artist%,feat.),$set(artist,$rreplace(%artist%,\\s+feat\\..*,)))
+$set(comment,$num(%tracknumber%,3) - $upper(%artist%) - $lower(%album%))
+$set(_sortkey,$swapprefix(%artist%,The,A,An))
+$noop($lenmulti(%performer%))
+$set(performer,$map(%performer%,$upper(%_loop_value%)))
+"""
+
+
+@benchmark
+class TaggingScriptsBenchmark(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.album = Album('bench')
+        self.scripts = [TaggingScriptSetting(pos=0, name='bench', enabled=True, content=SCRIPT)]
+
+    def _make_tracks(self):
+        tracks = []
+        for i in range(TRACK_COUNT):
+            track = Track(f'track-{i}', self.album)
+            track.metadata['title'] = f'the title of track number {i}'
+            track.metadata['artist'] = f'The Artist {i % 7} feat. Guest {i % 3}'
+            track.metadata['album'] = 'A Synthetic Box Set'
+            track.metadata['tracknumber'] = str(i + 1)
+            track.metadata['performer'] = [f'performer {n}' for n in range(5)]
+            tracks.append(track)
+        return tracks
+
+    def test_synthetic_release(self):
+        print()
+        measure(
+            "%d tracks" % TRACK_COUNT,
+            lambda: _run_tagging_scripts(self.scripts, self._make_tracks(), Metadata()),
+        )
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+import logging
+import threading
+from unittest.mock import patch
+
+from PyQt6.QtCore import (
+    QThread,
+    QThreadPool,
+)
+
+from test.benchmarks import (
+    benchmark,
+    measure,
+)
+from test.picardtestcase import PicardTestCase
+from test.test_coverart_processing import (
+    DEFAULT_PROCESSING_SETTINGS,
+    create_fake_image,
+    mock_to_main,
+)
+
+from picard import log
+from picard.album import Album
+from picard.coverart.image import CoverArtImage
+from picard.coverart.processing import CoverArtImageProcessing
+
+
+IMAGE_COUNT = 500
+
+
+class ImageProcessingBenchmark(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        # Per image debug logging would dominate the measurement
+        log.set_verbosity(logging.WARNING)
+        self.set_config_values(DEFAULT_PROCESSING_SETTINGS)
+        self.image = create_fake_image(1200, 1200, 'jpg')
+
+    def _process_all(self, thread_count):
+        thread_pool = QThreadPool()
+        thread_pool.setMaxThreadCount(thread_count)
+        self.tagger.image_processing_thread_pool = thread_pool
+        image_processing = CoverArtImageProcessing(Album(None))
+        lock = threading.Lock()
+        finished = []
+        all_finished = threading.Event()
+
+        def callback(coverartimage, error):
+            with lock:
+                finished.append(error)
+                if len(finished) == IMAGE_COUNT:
+                    all_finished.set()
+
+        data, info = self.image
+        with patch('picard.util.thread.to_main', mock_to_main):
+            for _i in range(IMAGE_COUNT):
+                image_processing.run_image_processors(CoverArtImage(), data, info, callback)
+            self.assertTrue(all_finished.wait(300))
+        thread_pool.waitForDone()
+        self.assertEqual([None] * IMAGE_COUNT, finished)
+
+    @benchmark
+    def test_single_thread(self):
+        elapsed = measure("Processing %d images with 1 thread" % IMAGE_COUNT, lambda: self._process_all(1), repeat=1)
+        print("%.1f images/s" % (IMAGE_COUNT / elapsed))
+
+    @benchmark
+    def test_thread_pool(self):
+        thread_count = max(2, QThread.idealThreadCount())
+        elapsed = measure(
+            "Processing %d images with %d threads" % (IMAGE_COUNT, thread_count),
+            lambda: self._process_all(thread_count),
+            repeat=1,
+        )
+        print("%.1f images/s" % (IMAGE_COUNT / elapsed))
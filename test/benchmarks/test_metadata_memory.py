@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+
+from test.benchmarks import (
+    benchmark,
+    measure_memory,
+)
+from test.picardtestcase import PicardTestCase
+
+from picard.file import File
+from picard.metadata import Metadata
+
+
+TRACK_COUNT = 1000
+MEDIUM_COUNT = 10
+
+
+def _release_metadata():
+    metadata = Metadata()
+    metadata['album'] = 'A Synthetic Box Set'
+    metadata['albumartist'] = 'The Album Artist'
+    metadata['albumartistsort'] = 'Album Artist, The'
+    metadata['musicbrainz_albumid'] = '89ad4ac3-39f7-470e-963a-56509c546377'
+    metadata['musicbrainz_albumartistid'] = '5b11f4ce-a62d-471e-81fc-a69a8278c7da'
+    metadata['musicbrainz_releasegroupid'] = 'f5f4ea4f-3b58-48d7-bb0c-8ccb4a0a3e7b'
+    metadata['releasetype'] = ['album', 'compilation']
+    metadata['releasestatus'] = 'official'
+    metadata['releasecountry'] = 'XW'
+    metadata['date'] = '2024-01-01'
+    metadata['originaldate'] = '1999-05-05'
+    metadata['label'] = ['Label One', 'Label Two']
+    metadata['catalognumber'] = ['CAT-001', 'CAT-002']
+    metadata['barcode'] = '0123456789012'
+    metadata['script'] = 'Latn'
+    metadata['language'] = 'eng'
+    metadata['totaldiscs'] = str(MEDIUM_COUNT)
+    return metadata
+
+
+def _load_release():
+    # Mimics the copies done by Album._load_tracks and Album._finalize_loading
+    album_metadata = _release_metadata()
+    tracks = []
+    per_medium = TRACK_COUNT // MEDIUM_COUNT
+    for medium_number in range(1, MEDIUM_COUNT + 1):
+        medium_metadata = Metadata()
+        medium_metadata.copy(album_metadata)
+        medium_metadata['discnumber'] = str(medium_number)
+        medium_metadata['totaltracks'] = str(per_medium)
+        medium_metadata['media'] = 'CD'
+        for track_number in range(1, per_medium + 1):
+            track_metadata = Metadata()
+            track_metadata.copy(medium_metadata)
+            track_metadata['title'] = 'Title %d-%d' % (medium_number, track_number)
+            track_metadata['artist'] = 'Artist %d' % (track_number % 13)
+            track_metadata['tracknumber'] = str(track_number)
+            track_metadata['musicbrainz_recordingid'] = '%032d' % (medium_number * 1000 + track_number)
+            orig_metadata = Metadata()
+            orig_metadata.copy(track_metadata)
+            tracks.append((track_metadata, orig_metadata))
+    return tracks
+
+
+def _match_files(tracks):
+    # Mimics loading files and Track.update_file_metadata
+    files = []
+    for i, (track_metadata, orig_metadata) in enumerate(tracks):
+        file = File('/music/%04d.flac' % i)
+        file.orig_metadata['title'] = 'old title %d' % i
+        file.orig_metadata['artist'] = 'old artist'
+        file.orig_metadata['album'] = 'old album'
+        file.orig_metadata['~format'] = 'FLAC'
+        file.orig_metadata['~bitrate'] = '1000'
+        file.metadata.copy(file.orig_metadata)
+        metadata = Metadata(file.metadata)
+        metadata.update(orig_metadata)
+        metadata.update(track_metadata.diff(orig_metadata))
+        file.copy_metadata(metadata)
+        files.append(file)
+    return files
+
+
+@benchmark
+class MetadataMemoryBenchmark(PicardTestCase):
+    def test_release_matched_to_files(self):
+        print()
+        tracks, tracks_size = measure_memory("Load %d tracks" % TRACK_COUNT, _load_release)
+        files, files_size = measure_memory("Match %d files" % TRACK_COUNT, lambda: _match_files(tracks))
+        print(
+            "%.0f bytes per track, %.0f bytes per matched file" % (tracks_size / TRACK_COUNT, files_size / TRACK_COUNT)
+        )
+        self.assertEqual(TRACK_COUNT, len(files))
+
+    def test_loaded_files(self):
+        print()
+
+        def load_files():
+            files = []
+            for i in range(TRACK_COUNT):
+                file = File('/music/%04d.flac' % i)
+                for tag in ('title', 'artist', 'album', 'albumartist', 'date', 'tracknumber', 'genre'):
+                    # Tag names read from files are not interned
+                    file.orig_metadata[''.join(list(tag))] = '%s %d' % (tag, i)
+                file.orig_metadata.length = 180000 + i
+                file.metadata.copy(file.orig_metadata)
+                files.append(file)
+            return files
+
+        files, size = measure_memory("Load %d files" % TRACK_COUNT, load_files)
+        print("%.0f bytes per loaded file" % (size / TRACK_COUNT))
+        self.assertEqual(TRACK_COUNT, len(files))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+import os
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from test.benchmarks import (
+    benchmark,
+    measure,
+)
+from test.picardtestcase import PicardTestCase
+
+from picard.util import periodictouch
+
+
+FILE_COUNT = 50000
+
+
+class PeriodicTouchBenchmark(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = self.mktmpdir()
+        patcher = patch.object(periodictouch, '_touch_timer', MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(periodictouch, '_files_to_touch', set())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.files = []
+        for i in range(FILE_COUNT):
+            filepath = os.path.join(directory, 'picard%06d.jpg' % i)
+            with open(filepath, 'wb'):
+                pass
+            periodictouch.register_file(filepath)
+            self.files.append(filepath)
+
+    @benchmark
+    def test_timer_tick(self):
+        # Time spent on the main thread, the files get touched by the worker
+        with patch('picard.util.periodictouch.thread.run_task') as run_task:
+
+            def tick():
+                periodictouch._touching = False
+                periodictouch._touch_files()
+
+            elapsed = measure("Timer tick with %d registered files" % FILE_COUNT, tick)
+        self.assertEqual(FILE_COUNT, len(run_task.call_args.args[0].args[0]))
+        self.assertLess(elapsed, 0.1)
+
+    @benchmark
+    def test_touch_files(self):
+        elapsed = measure(
+            "Touching %d files on the worker" % FILE_COUNT,
+            lambda: periodictouch.touch_files(self.files),
+            repeat=1,
+        )
+        self.assertLess(elapsed, 10)
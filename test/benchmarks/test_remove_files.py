@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+from unittest.mock import MagicMock
+
+from test.benchmarks import (
+    benchmark,
+    measure,
+)
+from test.picardtestcase import PicardTestCase
+
+from picard.acoustid.manager import AcoustIDManager
+from picard.cluster import UnclusteredFiles
+from picard.file import File
+from picard.tagger import Tagger
+
+
+FILE_COUNT = 20000
+
+
+class RemoveFilesBenchmark(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tagger.acoustidmanager = AcoustIDManager(MagicMock())
+        self.tagger._acoustid = MagicMock()
+        self.tagger.window = MagicMock()
+
+    def _create_session(self):
+        # A session with all files unclustered
+        cluster = UnclusteredFiles()
+        ui_item = MagicMock()
+        cluster.ui_item = ui_item
+        files = []
+        for i in range(FILE_COUNT):
+            file = File('/music/file%06d.flac' % i)
+            file.parent_item = cluster
+            file.metadata_images_changed.connect(cluster.update_metadata_images)
+            self.tagger.files[file.filename] = file
+            files.append(file)
+        cluster.files.extend(files)
+        return cluster, ui_item, files
+
+    @benchmark
+    def test_remove_all(self):
+        cluster, ui_item, files = self._create_session()
+        elapsed = measure("Removing %d files" % FILE_COUNT, lambda: Tagger.remove_files(self.tagger, files), repeat=1)
+        self.assertEqual({}, self.tagger.files)
+        self.assertEqual(0, len(cluster.files))
+        ui_item.remove_files.assert_called_once()
+        self.assertLess(elapsed, 2)
+
+    @benchmark
+    def test_remove_half(self):
+        cluster, ui_item, files = self._create_session()
+        removed = files[::2]
+        elapsed = measure(
+            "Removing %d of %d files" % (len(removed), FILE_COUNT),
+            lambda: Tagger.remove_files(self.tagger, removed),
+            repeat=1,
+        )
+        self.assertEqual(FILE_COUNT - len(removed), len(cluster.files))
+        self.assertLess(elapsed, 2)
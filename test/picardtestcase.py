@@ -65,6 +65,7 @@ class FakeTagger(QtCore.QObject):
         self.stopping = False
         self.thread_pool = FakeThreadPool()
         self.priority_thread_pool = FakeThreadPool()
+        self.image_processing_thread_pool = FakeThreadPool()
         self.window = MagicMock()
         self.webservice = MagicMock()
 
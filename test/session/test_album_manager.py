@@ -21,7 +21,10 @@
 """Tests for AlbumManager."""
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import (
+    Mock,
+    patch,
+)
 
 from picard.album import Album
 from picard.session.session_data import (
@@ -136,19 +139,14 @@ def test_album_manager_preload_from_cache_and_refresh_network() -> None:
     # Simulate tagger.albums empty, force branch that creates new Album via internal logic.
     tagger.albums = {}
 
-    # Ensure run_when_loaded callback executes synchronously for test
-    def run_immediately(cb):
-        cb()
-
-    Album.run_when_loaded = Mock(side_effect=run_immediately)
-
-    manager.preload_from_cache(mb_cache, grouped)
+    with patch.object(AlbumManager, '_build_from_cache', return_value=Mock(spec=Album)) as build:
+        manager.preload_from_cache(mb_cache, grouped)
 
-    assert 'album-1' in manager.loaded_albums
-    # album.load() should have been called if network not suppressed
-    manager.loaded_albums['album-1']
-    # Some Album methods are internal; for this test ensure attribute exists and is callable
-    # We cannot assert exact call since Album is constructed internally; just ensure no crash and album present.
+    album = build.return_value
+    assert manager.loaded_albums['album-1'] is album
+    # The network refresh waits for the album built from the cache
+    album.run_when_loaded.assert_any_call(album.load, run_on_error=True)
+    album.load.assert_not_called()
 
 
 def test_album_manager_load_album_with_strategy_suppressed_no_cache() -> None:
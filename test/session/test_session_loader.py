@@ -173,7 +173,7 @@ def test_session_loader_requests_allowed(tmp_path: Path, mock_single_shot, cfg_o
 
     album_mock = Mock()
     album_mock.unmatched_files = Mock()
-    album_mock.run_when_loaded = Mock(side_effect=lambda cb: cb())
+    album_mock.run_when_loaded = Mock(side_effect=lambda cb, **kwargs: cb())
     tagger.load_album.return_value = album_mock
 
     loader.load_from_path(path)
@@ -214,7 +214,7 @@ def test_session_loader_cached_album_refresh_allowed(tmp_path: Path, mock_single
     tagger = Mock()
     album_mock = Mock()
     album_mock.unmatched_files = Mock()
-    album_mock.run_when_loaded = Mock(side_effect=lambda cb: cb())
+    album_mock.run_when_loaded = Mock(side_effect=lambda cb, **kwargs: cb())
     tagger.albums = {"album-123": album_mock}
 
     loader = SessionLoader(tagger)
@@ -243,7 +243,7 @@ def test_session_loader_cached_album_no_refresh_when_suppressed(tmp_path: Path,
     tagger = Mock()
     album_mock = Mock()
     album_mock.unmatched_files = Mock()
-    album_mock.run_when_loaded = Mock(side_effect=lambda cb: cb())
+    album_mock.run_when_loaded = Mock(side_effect=lambda cb, **kwargs: cb())
     tagger.albums = {"album-123": album_mock}
 
     loader = SessionLoader(tagger)
@@ -295,7 +295,7 @@ def test_session_loader_request_suppression_matrix_unmatched(
 
     album_mock = Mock()
     album_mock.unmatched_files = Mock()
-    album_mock.run_when_loaded = Mock(side_effect=lambda cb: cb())
+    album_mock.run_when_loaded = Mock(side_effect=lambda cb, **kwargs: cb())
     tagger.load_album.return_value = album_mock
 
     loader.load_from_path(path)
@@ -323,7 +323,7 @@ def test_session_loader_request_suppression_matrix_cached(
     tagger = Mock()
     album_mock = Mock()
     album_mock.unmatched_files = Mock()
-    album_mock.run_when_loaded = Mock(side_effect=lambda cb: cb())
+    album_mock.run_when_loaded = Mock(side_effect=lambda cb, **kwargs: cb())
     tagger.albums = {"album-xyz": album_mock}
 
     loader = SessionLoader(tagger)
@@ -109,6 +109,15 @@ class AcoustIDManagerTest(PicardTestCase):
         self.acoustidmanager.remove(file)
         self.tagger.window.enable_action.assert_called_with(MainAction.SUBMIT_ACOUSTID, False)
 
+    def test_suspend_check(self):
+        files = self._add_unsubmitted_files(3)
+        self.tagger.window.enable_action.reset_mock()
+        with self.acoustidmanager.suspend_check:
+            for file in files:
+                self.acoustidmanager.remove(file)
+            self.tagger.window.enable_action.assert_not_called()
+        self.tagger.window.enable_action.assert_called_once_with(MainAction.SUBMIT_ACOUSTID, False)
+
     def test_is_submitted(self):
         file = dummy_file(0)
         self.assertTrue(self.acoustidmanager.is_submitted(file))
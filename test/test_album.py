@@ -17,15 +17,25 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import Mock
+from unittest.mock import (
+    Mock,
+    patch,
+)
 
-from test.picardtestcase import PicardTestCase
+from test.picardtestcase import (
+    PicardTestCase,
+    load_test_json,
+)
 
 from picard.album import (
     Album,
     AlbumStatus,
+    _run_tagging_scripts,
 )
+from picard.album_requests import TaskType
 from picard.file import File
+from picard.metadata import Metadata
+from picard.script import TaggingScriptSetting
 from picard.track import Track
 
 
@@ -61,7 +71,10 @@ class TrackTest(PicardTestCase):
         self.album.update_metadata_images_from_children()
         self.assertEqual(self.album.column('title'), 'Foo‎ (0/2; 1 image)')
         file1 = File('somefile.opus')
+        track2.album = self.album
         track2.files.append(file1)
+        file1.parent_item = track2
+        self.album.add_file(track2, file1, new_album=False)
         self.assertEqual(self.album.column('title'), 'Foo‎ (1/2; 1*; 1 image)')
         file1.state = File.State.NORMAL
         self.assertEqual(self.album.column('title'), 'Foo‎ (1/2; 1 image)')
@@ -95,3 +108,376 @@ class TrackTest(PicardTestCase):
         self.album.metadata.images.append(image)
         self.assertEqual(self.album.column('covercount'), '1')
         self.assertEqual(self.album.column('coverdimensions'), '100x100')
+
+
+class AlbumCountersTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                'completeness_ignore_videos': False,
+                'completeness_ignore_pregap': False,
+                'completeness_ignore_data': False,
+                'completeness_ignore_silence': False,
+            }
+        )
+        self.album = Album('123')
+        self.tracks = [Track('t%d' % i, album=self.album) for i in range(3)]
+        self.album.tracks.extend(self.tracks)
+
+    def _add_file(self, track, filename, state=File.State.NORMAL):
+        file = File(filename)
+        file.state = state
+        file.parent_item = track
+        track.files.append(file)
+        self.album.add_file(track, file, new_album=False)
+        return file
+
+    def _remove_file(self, track, file):
+        track.files.remove(file)
+        self.album.remove_file(track, file, new_album=False)
+
+    def test_matched_tracks(self):
+        self.assertEqual(0, self.album.get_num_matched_tracks())
+        file1 = self._add_file(self.tracks[0], 'a.mp3')
+        self._add_file(self.tracks[0], 'b.mp3')
+        self._add_file(self.tracks[1], 'c.mp3')
+        self.assertEqual(2, self.album.get_num_matched_tracks())
+        self._remove_file(self.tracks[0], file1)
+        self.assertEqual(2, self.album.get_num_matched_tracks())
+        self._remove_file(self.tracks[1], self.tracks[1].files[0])
+        self.assertEqual(1, self.album.get_num_matched_tracks())
+
+    def test_is_complete(self):
+        self.assertFalse(self.album.is_complete())
+        for i, track in enumerate(self.tracks):
+            self._add_file(track, '%d.mp3' % i)
+        self.assertTrue(self.album.is_complete())
+        extra_file = self._add_file(self.tracks[2], 'extra.mp3')
+        self.assertFalse(self.album.is_complete())
+        self._remove_file(self.tracks[2], extra_file)
+        self.assertTrue(self.album.is_complete())
+
+    def test_is_complete_ignored_tracks(self):
+        self.tracks[2].metadata['~video'] = '1'
+        self._add_file(self.tracks[0], 'a.mp3')
+        self._add_file(self.tracks[1], 'b.mp3')
+        self.assertFalse(self.album.is_complete())
+        self.set_config_values({'completeness_ignore_videos': True})
+        self.assertTrue(self.album.is_complete())
+        self._add_file(self.tracks[2], 'c.mp3')
+        self.assertTrue(self.album.is_complete())
+        self.set_config_values({'completeness_ignore_videos': False})
+        self.assertTrue(self.album.is_complete())
+
+    def test_is_complete_tracks_changed(self):
+        for i, track in enumerate(self.tracks):
+            self._add_file(track, '%d.mp3' % i)
+        self.assertTrue(self.album.is_complete())
+        track = Track('t3', album=self.album)
+        self.album.tracks.append(track)
+        self.assertFalse(self.album.is_complete())
+        self._add_file(track, '3.mp3')
+        self.assertTrue(self.album.is_complete())
+        self._remove_file(track, track.files[0])
+        self.album.tracks.remove(track)
+        self.assertTrue(self.album.is_complete())
+
+    def test_is_complete_unmatched_files(self):
+        for i, track in enumerate(self.tracks):
+            self._add_file(track, '%d.mp3' % i)
+        self.album.unmatched_files.files.append(File('unmatched.mp3'))
+        self.assertFalse(self.album.is_complete())
+
+    def test_unsaved_files(self):
+        file1 = self._add_file(self.tracks[0], 'a.mp3', state=File.State.CHANGED)
+        file2 = self._add_file(self.tracks[1], 'b.mp3')
+        self.assertTrue(self.album.is_modified())
+        self.assertEqual(1, self.album.get_num_unsaved_files())
+        file2.state = File.State.CHANGED
+        self.assertEqual(2, self.album.get_num_unsaved_files())
+        file1.state = File.State.NORMAL
+        file2.state = File.State.NORMAL
+        self.assertEqual(0, self.album.get_num_unsaved_files())
+        self.assertFalse(self.album.is_modified())
+        file1.state = File.State.CHANGED
+        self._remove_file(self.tracks[0], file1)
+        self.assertEqual(0, self.album.get_num_unsaved_files())
+        file1.state = File.State.NORMAL
+        file1.state = File.State.CHANGED
+        self.assertEqual(0, self.album.get_num_unsaved_files())
+
+
+def mock_to_main(func, *args, **kwargs):
+    func(*args, **kwargs)
+
+
+class AlbumDetachFilesTest(PicardTestCase):
+    def test_detach_files(self):
+        album = Album('123')
+        tracks = [Track('t%d' % i, album=album) for i in range(2)]
+        album.tracks.extend(tracks)
+        files = []
+        for i, track in enumerate(tracks):
+            file = File('test%d.flac' % i)
+            track.files.append(file)
+            file.metadata_images_changed.connect(track.update_metadata_images)
+            files.append(file)
+        unmatched = File('unmatched.flac')
+        album.unmatched_files.files.append(unmatched)
+        unmatched.metadata_images_changed.connect(album.unmatched_files.update_metadata_images)
+        with patch('picard.track.run_file_post_removal_from_track_processors') as processors:
+            album.detach_files()
+        self.assertEqual([], list(album.iterfiles()))
+        self.assertEqual(2, processors.call_count)
+        processors.assert_called_with(tracks[1], files[1])
+
+
+class AlbumAfterLoadCallbacksTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.album = Album('123')
+        self.calls = []
+
+    def _callback(self, name, reload=False):
+        def func():
+            self.calls.append(name)
+            if reload:
+                self.album.loaded = False
+
+        return func
+
+    def test_callbacks_run_once_loaded(self):
+        self.album.run_when_loaded(self._callback('a'))
+        self.album.run_when_loaded(self._callback('b'))
+        self.assertEqual([], self.calls)
+        self.album.loaded = True
+        self.album._run_after_load_callbacks()
+        self.assertEqual(['a', 'b'], self.calls)
+        self.assertEqual([], self.album._after_load_callbacks)
+
+    def test_callbacks_wait_for_reload(self):
+        self.album.run_when_loaded(self._callback('reload', reload=True))
+        self.album.run_when_loaded(self._callback('b'))
+        self.album.loaded = True
+        self.album._run_after_load_callbacks()
+        self.assertEqual(['reload'], self.calls)
+        self.assertEqual(1, len(self.album._after_load_callbacks))
+        self.album.loaded = True
+        self.album._run_after_load_callbacks()
+        self.assertEqual(['reload', 'b'], self.calls)
+
+    def test_callbacks_on_error(self):
+        self.album.run_when_loaded(self._callback('a'))
+        self.album.run_when_loaded(self._callback('b'), run_on_error=True)
+        self.album.loaded = True
+        self.album._run_after_load_callbacks(error=True)
+        self.assertEqual(['b'], self.calls)
+        self.album._run_after_load_callbacks()
+        self.assertEqual(['b', 'a'], self.calls)
+
+
+class AlbumLoadTracksTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                'convert_punctuation': False,
+                'enable_ratings': False,
+                'release_ars': True,
+                'standardize_artists': False,
+                'standardize_instruments': True,
+                'standardize_releases': False,
+                'standardize_tracks': False,
+                'standardize_vocals': True,
+                'track_ars': False,
+                'translate_album_titles': False,
+                'translate_artist_names': False,
+                'translate_track_titles': False,
+                'use_genres': False,
+                'va_name': "Various Artists",
+                'preferred_release_countries': [],
+                'preferred_release_formats': [],
+            },
+            persist={'oauth_username': ''},
+        )
+        self.release_node = load_test_json('release.json')
+        # The test data only has artist credits on release level
+        for medium_node in self.release_node['media']:
+            for track_node in medium_node['tracks']:
+                track_node['artist-credit'] = self.release_node['artist-credit']
+                track_node['recording']['artist-credit'] = self.release_node['artist-credit']
+        self.album = Album(self.release_node['id'])
+        self.album._new_metadata = Metadata()
+        self.album._new_tracks = []
+        self.album._parse_release(self.release_node)
+
+    def test_load_tracks_detached(self):
+        result = self.album._load_tracks()
+        self.assertEqual(10, len(result))
+        self.assertEqual([], self.album._new_tracks)
+        self.assertFalse(self.album._tracks_loaded)
+        track, track_node = result[0]
+        self.assertIs(self.album, track.album)
+        self.assertEqual(track_node['recording']['id'], track.id)
+        self.assertEqual('10', track.metadata['~totalalbumtracks'])
+
+    def test_load_tracks_finished_attaches_tracks(self):
+        self.album._finalize_loading_album = Mock()
+        with patch('picard.util.thread.to_main', mock_to_main):
+            self.album._finalize_loading(error=False)
+        self.assertTrue(self.album._tracks_loaded)
+        self.assertEqual(10, len(self.album._new_tracks))
+        self.assertNotIn('load_tracks', self.album.get_pending_tasks())
+        self.album._finalize_loading_album.assert_called_once()
+
+    def test_load_tracks_finished_after_cancel(self):
+        self.album._finalize_loading_album = Mock()
+        self.album.add_task('load_tracks', TaskType.CRITICAL, 'test')
+        result = self.album._load_tracks()
+        self.album.cancel_tasks()
+        self.album._load_tracks_finished(result=result)
+        self.assertFalse(self.album._tracks_loaded)
+        self.assertEqual([], self.album._new_tracks)
+        self.album._finalize_loading_album.assert_not_called()
+
+
+class AlbumTaggingScriptsTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                'enable_tagger_scripts': True,
+                'list_of_scripts': [
+                    (0, 'first', True, '$set(title,$upper(%title%))'),
+                    (1, 'second', True, '$set(comment,%title% %_n%)$set(_n,)'),
+                ],
+            }
+        )
+        self.album = Album('123')
+        self.album._new_metadata = Metadata({'album': 'foo'})
+        self.album._new_tracks = []
+        for i in range(10):
+            track = Track(f't{i}', self.album)
+            track.metadata['title'] = f'title {i}'
+            track.metadata['~n'] = str(i)
+            self.album._new_tracks.append(track)
+        self.album.match_files = Mock()
+        self.ui_item = Mock()
+        self.ui_item.isSelected.return_value = False
+        self.ui_item.treeWidget.return_value = None
+        self.album.ui_item = self.ui_item
+
+    def test_run_tagging_scripts(self):
+        scripts = [TaggingScriptSetting(pos=0, name='test', enabled=True, content='$set(foo, bar )')]
+        tracks = self.album._new_tracks[:2]
+        album_metadata = self.album._new_metadata
+        _run_tagging_scripts(scripts, tracks, album_metadata)
+        for track in tracks:
+            self.assertEqual('bar', track.metadata['foo'])
+            self.assertEqual('bar', track.scripted_metadata['foo'])
+        self.assertEqual('bar', album_metadata['foo'])
+
+    def test_run_tagging_scripts_order(self):
+        scripts = [
+            TaggingScriptSetting(pos=0, name='first', enabled=True, content='first'),
+            TaggingScriptSetting(pos=1, name='second', enabled=True, content='second'),
+        ]
+        tracks = self.album._new_tracks[:2]
+        album_metadata = self.album._new_metadata
+        calls = []
+
+        def record(parser, script, metadata):
+            calls.append((script, 'album' if metadata is album_metadata else 'track'))
+
+        with patch('picard.album.ScriptParser.eval', autospec=True, side_effect=record):
+            _run_tagging_scripts(scripts, tracks, album_metadata)
+        # Each script runs on the tracks and then on the album
+        expected = [
+            ('first', 'track'),
+            ('first', 'track'),
+            ('first', 'album'),
+            ('second', 'track'),
+            ('second', 'track'),
+            ('second', 'album'),
+        ]
+        self.assertEqual(expected, calls)
+
+    def test_finalize_loading_album(self):
+        tracks = list(self.album._new_tracks)
+        with patch('picard.util.thread.to_main', mock_to_main):
+            self.album._finalize_loading_album()
+        self.assertTrue(self.album.loaded)
+        self.assertEqual(tracks, self.album.tracks)
+        self.assertNotIn('tagger_scripts', self.album.get_pending_tasks())
+        for i, track in enumerate(self.album.tracks):
+            self.assertEqual(f'TITLE {i}', track.metadata['title'])
+            self.assertEqual(f'TITLE {i} {i}', track.metadata['comment'])
+            self.assertEqual(f'title {i}', track.orig_metadata['title'])
+        self.assertEqual('foo', self.album.metadata['album'])
+        self.assertNotIn('comment', self.album.metadata)
+
+    def test_finalize_loading_album_cancelled(self):
+        self.tagger.thread_pool = Mock()
+        self.album._finalize_loading_album()
+        self.assertEqual(1, self.tagger.thread_pool.start.call_count)
+        self.album.cancel_tasks()
+        self.album._tagging_scripts_finished()
+        self.assertFalse(self.album.loaded)
+
+
+class AlbumRecordingRelationshipsTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tagger.mb_api = Mock()
+        self.album = Album('123')
+        self.album._release_node = {'media': []}
+        self.album._finalize_loading = Mock()
+        self.album._run_album_metadata_processors = Mock()
+
+    def _requested_offsets(self):
+        return [c.kwargs['offset'] for c in self.tagger.mb_api.browse_recordings.call_args_list]
+
+    @staticmethod
+    def _page(offset, count, ids):
+        return {
+            'recording-offset': offset,
+            'recording-count': count,
+            'recordings': [{'id': i, 'relations': []} for i in ids],
+        }
+
+    def test_pages_requested_concurrently(self):
+        self.album._request_recording_relationships()
+        self.assertEqual([0], self._requested_offsets())
+        self.album._recordings_request_finished(self._page(0, 250, ['a']), None, None, offset=0)
+        self.assertEqual([0, 100, 200], self._requested_offsets())
+        self.album._finalize_loading.assert_not_called()
+        self.album._recordings_request_finished(self._page(200, 250, ['c']), None, None, offset=200)
+        self.album._finalize_loading.assert_not_called()
+        self.album._recordings_request_finished(self._page(100, 250, ['b']), None, None, offset=100)
+        self.album._run_album_metadata_processors.assert_called_once()
+        self.album._finalize_loading.assert_called_once_with(False)
+        self.assertFalse(self.album.get_pending_tasks())
+
+    def test_single_page(self):
+        self.album._request_recording_relationships()
+        self.album._recordings_request_finished(self._page(0, 100, ['a']), None, None, offset=0)
+        self.assertEqual([0], self._requested_offsets())
+        self.album._finalize_loading.assert_called_once_with(False)
+
+    def test_page_error(self):
+        http = Mock()
+        http.errorString.return_value = 'failed'
+        self.album._request_recording_relationships()
+        self.album._recordings_request_finished(self._page(0, 250, ['a']), None, None, offset=0)
+        self.album._recordings_request_finished({}, http, True, offset=100)
+        self.album._finalize_loading.assert_called_once_with(True)
+        self.assertEqual(['failed'], self.album.errors)
+        self.assertIn('recording_rels_200', self.album.get_pending_tasks())
+
+    def test_cancelled(self):
+        self.album._request_recording_relationships()
+        self.album.cancel_tasks()
+        self.album._recordings_request_finished(self._page(0, 250, ['a']), None, None, offset=0)
+        self.assertEqual([0], self._requested_offsets())
+        self.album._finalize_loading.assert_not_called()
@@ -19,7 +19,10 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
-from unittest.mock import Mock
+from unittest.mock import (
+    MagicMock,
+    Mock,
+)
 
 from test.picardtestcase import PicardTestCase
 
@@ -53,6 +56,30 @@ class ClusterTest(PicardTestCase):
         self.assertEqual(0, len(self.cluster))
         self.assertTrue(self.cluster)
 
+    def test_remove_files(self):
+        self.cluster.ui_item = ui_item = MagicMock()
+        files = [File('test%d.flac' % i) for i in range(5)]
+        self.cluster.files.extend(files)
+        for file in files:
+            file.metadata_images_changed.connect(self.cluster.update_metadata_images)
+        self.cluster.remove_files([files[3], files[1], files[3]])
+        self.assertEqual([files[0], files[2], files[4]], list(self.cluster.files))
+        self.assertEqual('3', self.cluster.metadata['totaltracks'])
+        ui_item.remove_files.assert_called_once_with([files[3], files[1]])
+        self.tagger.window.set_processing.assert_called_with(False)
+
+    def test_remove_all_files(self):
+        self.tagger.remove_cluster = Mock()
+        self.cluster.ui_item = ui_item = MagicMock()
+        files = [File('test%d.flac' % i) for i in range(3)]
+        self.cluster.files.extend(files)
+        for file in files:
+            file.metadata_images_changed.connect(self.cluster.update_metadata_images)
+        self.cluster.remove_files(files)
+        self.assertEqual([], list(self.cluster.files))
+        ui_item.remove_files.assert_called_once_with(files)
+        self.tagger.remove_cluster.assert_called_once_with(self.cluster)
+
     def test_column(self):
         self.cluster.metadata['test'] = 'foo'
         self.assertEqual(self.cluster.column('test'), 'foo')
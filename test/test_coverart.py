@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+from collections import namedtuple
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from PyQt6.QtCore import (
+    QBuffer,
+    QByteArray,
+)
+from PyQt6.QtGui import QImage
+
+from test.picardtestcase import PicardTestCase
+from test.test_coverart_downloadcache import patch_run_task
+from test.test_coverart_processing import mock_to_main
+
+from picard.album import Album
+from picard.coverart import CoverArt
+from picard.coverart.downloadcache import DownloadedImageCache
+from picard.coverart.downloadslots import DownloadSlots
+from picard.coverart.image import CoverArtImage
+from picard.coverart.providers.provider import CoverArtProvider
+from picard.metadata import Metadata
+from picard.webservice import ratecontrol
+
+
+HOSTKEY = ('images.example.com', 443)
+
+FakeProviderTuple = namedtuple('FakeProviderTuple', 'name enabled cls')
+
+
+def create_image_data():
+    buffer = QBuffer()
+    image = QImage(64, 64, QImage.Format.Format_RGB32)
+    for x in range(64):
+        for y in range(64):
+            image.setPixel(x, y, (x * 7919 + y * 104729) & 0xFFFFFF)
+    image.save(buffer, 'png')
+    return buffer.data().data()
+
+
+def fake_provider(images):
+    class FakeProvider(CoverArtProvider):
+        NAME = 'fake'
+
+        def enabled(self):
+            return True
+
+        def queue_images(self):
+            for image in images:
+                self.queue_put(image)
+            return CoverArtProvider.QueueState.FINISHED
+
+    return FakeProviderTuple(name='fake', enabled=True, cls=FakeProvider)
+
+
+def typed_image(name, types=('medium',)):
+    return CoverArtImage(f'https://images.example.com/{name}.png', types=list(types), support_types=True)
+
+
+class CoverArtQueueTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                'save_images_to_tags': True,
+                'save_images_to_files': False,
+                'embed_only_one_front_image': False,
+                'cover_max_concurrent_downloads': 3,
+                'filter_cover_by_size': False,
+                'dont_replace_with_smaller_cover': False,
+                'dont_replace_cover_of_types': False,
+                'enabled_plugins': [],
+            }
+        )
+        self.window = ratecontrol.CONGESTION_WINDOW_SIZE[HOSTKEY]
+        ratecontrol.CONGESTION_WINDOW_SIZE[HOSTKEY] = 10.0
+        self.addCleanup(ratecontrol.CONGESTION_WINDOW_SIZE.__setitem__, HOSTKEY, self.window)
+        self.download_slots = DownloadSlots()
+        patcher = patch('picard.coverart.download_slots', self.download_slots)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('picard.util.thread.to_main', mock_to_main)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.downloads = {}
+        self.requested = []
+        self.tagger.webservice.download_url = self._download_url
+        self.album = Album('album')
+        self.tagger.albums = {'album': self.album}
+        self.data = create_image_data()
+        self.processed = []
+
+    def _download_url(self, url, handler, priority, **kwargs):
+        self.downloads[url.fileName()] = handler
+        self.requested.append(url.fileName())
+        return MagicMock()
+
+    def _finish_download(self, name):
+        handler = self.downloads.pop(name)
+        http = MagicMock()
+        http.rawHeader.return_value = QByteArray()
+        handler(self.data, http, None)
+
+    def _retrieve(self, *providers):
+        coverart = CoverArt(self.album, Metadata(), {})
+
+        def process_image_data(image, data, image_info):
+            self.processed.append(image.url.fileName())
+            coverart._finish_process_image_data(image, None)
+
+        def set_metadata(image):
+            if not coverart.front_image_found:
+                coverart.front_image_found = image.is_front_image()
+
+        coverart._process_image_data = process_image_data
+        coverart._set_metadata = set_metadata
+        with patch('picard.coverart.cover_art_providers', return_value=iter(providers)):
+            coverart.retrieve()
+        return coverart
+
+    def test_concurrent_downloads(self):
+        images = [typed_image(str(i)) for i in range(5)]
+        self._retrieve(fake_provider(images))
+        self.assertEqual({'0.png', '1.png', '2.png'}, set(self.downloads))
+        self.assertEqual(3, self.download_slots.active(HOSTKEY))
+        self._finish_download('1.png')
+        self.assertEqual({'0.png', '2.png', '3.png'}, set(self.downloads))
+
+    def test_processing_in_queue_order(self):
+        images = [typed_image(str(i)) for i in range(4)]
+        coverart = self._retrieve(fake_provider(images))
+        self._finish_download('2.png')
+        self._finish_download('1.png')
+        self.assertEqual([], self.processed)
+        self._finish_download('0.png')
+        self.assertEqual(['0.png', '1.png', '2.png'], self.processed)
+        self._finish_download('3.png')
+        self.assertEqual(['0.png', '1.png', '2.png', '3.png'], self.processed)
+        self.assertFalse(coverart._active)
+        self.assertEqual(0, self.download_slots.active(HOSTKEY))
+
+    def test_limited_by_congestion_window(self):
+        ratecontrol.CONGESTION_WINDOW_SIZE[HOSTKEY] = 1.0
+        self._retrieve(fake_provider([typed_image('0'), typed_image('1')]))
+        self.assertEqual({'0.png'}, set(self.downloads))
+
+    def test_typeless_image_after_front_image(self):
+        front = typed_image('front', types=('front',))
+        typeless = CoverArtImage('https://images.example.com/typeless.png')
+        self._retrieve(fake_provider([front, typeless]))
+        # Whether the type-less image is needed depends on the front image
+        self.assertEqual({'front.png'}, set(self.downloads))
+        self._finish_download('front.png')
+        self.assertEqual({}, self.downloads)
+        self.assertEqual(['front.png'], self.processed)
+
+    def test_typeless_image_without_front_image(self):
+        typeless = CoverArtImage('https://images.example.com/typeless.png')
+        self._retrieve(fake_provider([typed_image('back', types=('back',)), typeless]))
+        self._finish_download('back.png')
+        self._finish_download('typeless.png')
+        self.assertEqual(['back.png', 'typeless.png'], self.processed)
+
+    def test_only_one_front_image(self):
+        self.set_config_values({'embed_only_one_front_image': True})
+        images = [typed_image('front', types=('front',)), typed_image('back', types=('back',))]
+        coverart = self._retrieve(fake_provider(images))
+        self.assertEqual({'front.png'}, set(self.downloads))
+        self._finish_download('front.png')
+        self.assertEqual({}, self.downloads)
+        self.assertEqual(['front.png'], self.processed)
+        self.assertFalse(coverart._active)
+
+    def test_next_provider_after_processing(self):
+        first = [typed_image('0'), typed_image('1')]
+        second = [typed_image('2')]
+        self._retrieve(fake_provider(first), fake_provider(second))
+        self.assertEqual({'0.png', '1.png'}, set(self.downloads))
+        self._finish_download('0.png')
+        self.assertNotIn('2.png', self.downloads)
+        self._finish_download('1.png')
+        self.assertEqual({'2.png'}, set(self.downloads))
+
+    def test_slots_shared_between_albums(self):
+        self._retrieve(fake_provider([typed_image(str(i)) for i in range(3)]))
+        other_album = Album('other')
+        self.tagger.albums['other'] = other_album
+        self.album = other_album
+        self._retrieve(fake_provider([typed_image('other')]))
+        self.assertNotIn('other.png', self.downloads)
+        self._finish_download('0.png')
+        self.assertIn('other.png', self.downloads)
+
+    def _load_other_album(self, album_id):
+        self.album = Album(album_id)
+        self.tagger.albums[album_id] = self.album
+        return self._retrieve(fake_provider([typed_image('0')]))
+
+    def test_downloads_shared_between_albums(self):
+        self.tagger.downloaded_image_cache = DownloadedImageCache(self.mktmpdir())
+        self._retrieve(fake_provider([typed_image('0')]))
+        self._load_other_album('other')
+        self.assertEqual(['0.png'], self.requested)
+        self._finish_download('0.png')
+        self.assertEqual(['0.png', '0.png'], self.processed)
+        self.assertEqual(0, self.download_slots.active(HOSTKEY))
+        # Loading the image again uses the downloaded data
+        coverart = self._load_other_album('third')
+        self.assertEqual(['0.png'], self.requested)
+        self.assertEqual(['0.png', '0.png', '0.png'], self.processed)
+        self.assertFalse(coverart._active)
+
+    def test_download_cache_read_on_worker_thread(self):
+        self.tagger.downloaded_image_cache = DownloadedImageCache(self.mktmpdir())
+        tasks = []
+        with patch_run_task(tasks):
+            self._retrieve(fake_provider([typed_image('0'), typed_image('1')]))
+            # Downloads only start once the cache has been checked
+            self.assertEqual({}, self.downloads)
+            self.assertEqual(0, self.download_slots.active(HOSTKEY))
+            while tasks:
+                func, next_func = tasks.pop(0)
+                next_func(result=func())
+        self.assertEqual({'0.png', '1.png'}, set(self.downloads))
+        self.assertEqual(2, self.download_slots.active(HOSTKEY))
+
+    def test_album_removed(self):
+        coverart = self._retrieve(fake_provider([typed_image('0'), typed_image('1')]))
+        del self.tagger.albums['album']
+        self._finish_download('0.png')
+        self._finish_download('1.png')
+        self.assertEqual([], self.processed)
+        self.assertFalse(coverart._active)
+        self.assertEqual(0, self.download_slots.active(HOSTKEY))
+
+    def test_album_cancelled(self):
+        album = self.album
+        coverart = self._retrieve(fake_provider([typed_image(str(i)) for i in range(5)]))
+        self.assertEqual(3, self.download_slots.active(HOSTKEY))
+        self._load_other_album('other')
+        self.assertNotIn('other.png', self.requested)
+        # The handlers of aborted requests don't get called
+        self.downloads.clear()
+        album.cancel_tasks()
+        self.assertFalse(coverart._active)
+        self.assertEqual(['0.png', '1.png', '2.png', '0.png'], self.requested)
+        self.assertEqual(1, self.download_slots.active(HOSTKEY))
+
+    def test_album_cancelled_shared_download(self):
+        self.tagger.downloaded_image_cache = DownloadedImageCache(self.mktmpdir())
+        album = self.album
+        coverart = self._retrieve(fake_provider([typed_image('0')]))
+        album.cancel_tasks()
+        self.assertFalse(coverart._active)
+        self.assertEqual(0, self.download_slots.active(HOSTKEY))
+        # The shared download is not aborted, its slot is only released once
+        self._finish_download('0.png')
+        self.assertEqual([], self.processed)
+        self.assertEqual(0, self.download_slots.active(HOSTKEY))
+
+
+class DownloadSlotsTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values({'cover_max_concurrent_downloads': 2})
+        self.window = ratecontrol.CONGESTION_WINDOW_SIZE[HOSTKEY]
+        ratecontrol.CONGESTION_WINDOW_SIZE[HOSTKEY] = 10.0
+        self.addCleanup(ratecontrol.CONGESTION_WINDOW_SIZE.__setitem__, HOSTKEY, self.window)
+
+    def test_acquire_release(self):
+        slots = DownloadSlots()
+        self.assertTrue(slots.acquire(HOSTKEY))
+        self.assertTrue(slots.acquire(HOSTKEY))
+        self.assertFalse(slots.acquire(HOSTKEY))
+        self.assertTrue(slots.acquire(('other.example.com', 443)))
+        slots.release(HOSTKEY)
+        self.assertTrue(slots.acquire(HOSTKEY))
+
+    def test_limit(self):
+        slots = DownloadSlots()
+        self.assertEqual(2, slots.limit(HOSTKEY))
+        ratecontrol.CONGESTION_WINDOW_SIZE[HOSTKEY] = 1.5
+        self.assertEqual(1, slots.limit(HOSTKEY))
+        self.set_config_values({'cover_max_concurrent_downloads': 0})
+        self.assertEqual(1, slots.limit(HOSTKEY))
+
+    def test_wait(self):
+        slots = DownloadSlots()
+        callback = MagicMock()
+        slots.acquire(HOSTKEY)
+        slots.wait(HOSTKEY, callback)
+        slots.wait(HOSTKEY, callback)
+        slots.release(HOSTKEY)
+        callback.assert_called_once_with()
+        slots.acquire(HOSTKEY)
+        slots.release(HOSTKEY)
+        callback.assert_called_once_with()
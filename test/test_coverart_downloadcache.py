@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+import time
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from PyQt6.QtCore import (
+    QByteArray,
+    QUrl,
+)
+from PyQt6.QtNetwork import QNetworkRequest
+
+from test.picardtestcase import PicardTestCase
+from test.test_coverart_processing import mock_to_main
+
+from picard.coverart.downloadcache import (
+    CaaIndexCache,
+    DownloadedImageCache,
+    download_key,
+)
+
+
+URL = QUrl('https://coverartarchive.org/release/a3f7e6d4-0bd5-4a5e-8f3c-5e7b2c1d9e8f/12345-500.jpg')
+
+
+def cached_data(cache, url):
+    callback = MagicMock()
+    cache.get(url, callback)
+    callback.assert_called_once()
+    return callback.call_args.args[0]
+
+
+def patch_run_task(tasks):
+    """Collect the tasks to run on worker threads, instead of running them."""
+    return patch('picard.util.thread.run_task', side_effect=lambda func, next_func: tasks.append((func, next_func)))
+
+
+def fake_reply(status=200, etag='', last_modified=''):
+    headers = {b'ETag': etag, b'Last-Modified': last_modified}
+    http = MagicMock()
+    http.rawHeader.side_effect = lambda name: QByteArray(headers.get(name, '').encode('latin-1'))
+    http.attribute.side_effect = lambda attribute: (
+        status if attribute == QNetworkRequest.Attribute.HttpStatusCodeAttribute else None
+    )
+    return http
+
+
+class DownloadKeyTest(PicardTestCase):
+    def test_caa_image_id(self):
+        other_release = QUrl('http://coverartarchive.org/release/e1c9f2d8-57ad-4b3f-a1c4-2b8d9e0f6a7c/12345-500.jpg')
+        self.assertEqual(download_key(URL), download_key(other_release))
+        self.assertNotEqual(download_key(URL), download_key(QUrl('https://coverartarchive.org/release/x/12345.jpg')))
+
+    def test_other_urls(self):
+        url = QUrl('https://images.example.com/a/12345-500.jpg')
+        self.assertNotEqual(download_key(URL), download_key(url))
+        self.assertEqual(download_key(url), download_key(QUrl('http://images.example.com/a/12345-500.jpg')))
+        self.assertNotEqual(download_key(url), download_key(QUrl('https://images.example.com/b/12345-500.jpg')))
+
+
+class DownloadedImageCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch('picard.util.thread.to_main', mock_to_main)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.directory = self.mktmpdir()
+        self.cache = DownloadedImageCache(self.directory, ttl=100)
+        self.webservice = MagicMock()
+        self.handler = MagicMock()
+
+    def _request(self, call=-1):
+        return self.webservice.download_url.call_args_list[call].kwargs
+
+    def _download(self, data=b'image data', http=None, error=None):
+        self.cache.download(self.webservice, URL, self.handler)
+        request = self._request()
+        request['handler'](data, http or fake_reply(etag='"v1"'), error)
+        return request
+
+    def test_not_cached(self):
+        self.assertIsNone(cached_data(self.cache, URL))
+
+    def test_download(self):
+        http = fake_reply(etag='"v1"')
+        self._download(http=http)
+        self.handler.assert_called_once_with(b'image data', http, None)
+        self.assertEqual(b'image data', cached_data(self.cache, URL))
+
+    def test_concurrent_downloads_merged(self):
+        other_handler = MagicMock()
+        self.cache.download(self.webservice, URL, self.handler)
+        self.cache.download(self.webservice, URL, other_handler)
+        self.webservice.download_url.assert_called_once()
+        self._request()['handler'](b'image data', fake_reply(), None)
+        self.handler.assert_called_once()
+        other_handler.assert_called_once()
+
+    def test_error_not_cached(self):
+        self._download(data=b'', error=1)
+        self.handler.assert_called_once()
+        self.assertIsNone(cached_data(self.cache, URL))
+
+    def test_cached_across_sessions(self):
+        self._download()
+        cache = DownloadedImageCache(self.directory, ttl=100)
+        self.assertEqual(b'image data', cached_data(cache, URL))
+
+    def test_expired_entry_revalidated(self):
+        self._download()
+        cache = DownloadedImageCache(self.directory, ttl=100)
+        with patch('time.time', return_value=time.time() + 200):
+            self.assertIsNone(cached_data(cache, URL))
+            cache.download(self.webservice, URL, self.handler)
+        request = self._request()
+        self.assertEqual({'If-None-Match': '"v1"'}, request['headers'])
+        http = fake_reply(status=304)
+        request['handler'](b'', http, None)
+        self.handler.assert_called_with(b'image data', http, None)
+        self.assertEqual(b'image data', cached_data(cache, URL))
+
+    def test_expired_entry_changed(self):
+        self._download()
+        cache = DownloadedImageCache(self.directory, ttl=100)
+        with patch('time.time', return_value=time.time() + 200):
+            cache.download(self.webservice, URL, self.handler)
+        self._request()['handler'](b'new image data', fake_reply(etag='"v2"'), None)
+        self.assertEqual(b'new image data', cached_data(cache, URL))
+
+    def test_validated_in_session(self):
+        self._download()
+        with patch('time.time', return_value=time.time() + 200):
+            self.assertEqual(b'image data', cached_data(self.cache, URL))
+
+    def test_revalidated_with_last_modified(self):
+        last_modified = 'Wed, 21 Oct 2026 07:28:00 GMT'
+        self._download(http=fake_reply(last_modified=last_modified))
+        cache = DownloadedImageCache(self.directory, ttl=100)
+        with patch('time.time', return_value=time.time() + 200):
+            cache.download(self.webservice, URL, self.handler)
+        self.assertEqual({'If-Modified-Since': last_modified}, self._request()['headers'])
+
+    def test_read_on_worker_thread(self):
+        self._download()
+        cache = DownloadedImageCache(self.directory, ttl=100)
+        tasks = []
+        callback = MagicMock()
+        with patch_run_task(tasks):
+            cache.get(URL, callback)
+        callback.assert_not_called()
+        # Not even the index got loaded yet
+        self.assertIsNone(cache.disk_cache._entries)
+        func, next_func = tasks.pop()
+        next_func(result=func())
+        callback.assert_called_once_with(b'image data')
+
+    def test_entry_being_written(self):
+        self.cache.download(self.webservice, URL, self.handler)
+        tasks = []
+        with patch_run_task(tasks):
+            self._request()['handler'](b'image data', fake_reply(), None)
+            self.handler.assert_called_once()
+            self.assertEqual(b'image data', cached_data(self.cache, URL))
+        self.assertEqual(0, self.cache.disk_cache.size)
+        func, next_func = tasks.pop()
+        next_func(result=func())
+        self.assertEqual({}, self.cache._writing)
+        self.assertEqual(b'image data', cached_data(DownloadedImageCache(self.directory, ttl=100), URL))
+
+    def test_error_not_using_cached(self):
+        self._download()
+        self.cache.download(self.webservice, URL, self.handler)
+        http = fake_reply(status=0)
+        self._request()['handler'](b'', http, 1)
+        self.handler.assert_called_with(b'', http, 1)
+
+
+INDEX_URL = QUrl('https://coverartarchive.org/release/a3f7e6d4-0bd5-4a5e-8f3c-5e7b2c1d9e8f/')
+
+
+class CaaIndexCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch('picard.util.thread.to_main', mock_to_main)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = CaaIndexCache(self.mktmpdir())
+        self.webservice = MagicMock()
+        self.handler = MagicMock()
+        self.cache.download(self.webservice, INDEX_URL, self.handler)
+        self._request()['handler'](b'{"images": []}', fake_reply(etag='"v1"'), None)
+
+    def _request(self):
+        return self.webservice.download_url.call_args.kwargs
+
+    def test_always_revalidated(self):
+        self.assertIsNone(cached_data(self.cache, INDEX_URL))
+        self.cache.download(self.webservice, INDEX_URL, self.handler)
+        self.assertEqual(2, self.webservice.download_url.call_count)
+        request = self._request()
+        self.assertEqual({'If-None-Match': '"v1"'}, request['headers'])
+        request['handler'](b'', fake_reply(status=304), None)
+        self.assertEqual(b'{"images": []}', self.handler.call_args.args[0])
+
+    def test_cached_used_when_offline(self):
+        self.cache.download(self.webservice, INDEX_URL, self.handler)
+        http = fake_reply(status=None)
+        self._request()['handler'](b'', http, 99)
+        self.handler.assert_called_with(b'{"images": []}', http, None)
+
+    def test_not_found(self):
+        self.cache.download(self.webservice, INDEX_URL, self.handler)
+        http = fake_reply(status=404)
+        self._request()['handler'](b'', http, 203)
+        self.handler.assert_called_with(b'', http, 203)
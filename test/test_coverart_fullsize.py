@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from PyQt6.QtCore import QUrl
+
+from test.picardtestcase import PicardTestCase
+from test.test_coverart import create_image_data
+from test.test_coverart_processing import (
+    DEFAULT_PROCESSING_SETTINGS,
+    create_fake_image,
+    mock_to_main,
+)
+
+from picard.album import Album
+from picard.coverart.fullsize import FullSizeImageLoader
+from picard.coverart.image import CaaCoverArtImage
+from picard.file import File
+from picard.track import Track
+from picard.util.imagelist import ImageList
+
+
+class FullSizeImageLoaderTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                **DEFAULT_PROCESSING_SETTINGS,
+                'filter_cover_by_size': False,
+                'dont_replace_with_smaller_cover': False,
+                'dont_replace_cover_of_types': False,
+            }
+        )
+        patcher = patch('picard.util.thread.to_main', mock_to_main)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.downloads = {}
+        self.tagger.webservice.download_url = self._download_url
+        self.album = Album('album')
+        self.tracks = [Track('t%d' % i, album=self.album) for i in range(2)]
+        self.album.tracks.extend(self.tracks)
+        self.thumbnail = self._create_thumbnail('front')
+        self.album.metadata.images.append(self.thumbnail)
+        self.files = []
+        for i, track in enumerate(self.tracks):
+            track.metadata.images = self.album.metadata.images.copy()
+            file = File('/music/%d.flac' % i)
+            file.parent_item = track
+            file.metadata.images = track.metadata.images.copy()
+            track.files.append(file)
+            self.files.append(file)
+        patcher = patch.object(File, 'save', autospec=True)
+        self.save = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.loader = FullSizeImageLoader()
+
+    def _create_thumbnail(self, name):
+        thumbnail = CaaCoverArtImage(
+            'https://images.example.com/%s-250.jpg' % name,
+            types=['front'],
+            is_front=True,
+            data=create_image_data(),
+        )
+        thumbnail.full_size_url = QUrl('https://images.example.com/%s.jpg' % name)
+        thumbnail.can_be_filtered = False
+        thumbnail.can_be_processed = False
+        return thumbnail
+
+    def _download_url(self, url, handler, priority):
+        self.downloads[url.fileName()] = handler
+        return MagicMock()
+
+    def _finish_download(self, name, data=None, error=None):
+        if data is None:
+            data = create_fake_image(1000, 1000, 'jpg')[0]
+        handler = self.downloads.pop(name)
+        handler(data, MagicMock(), error)
+
+    def _saved_files(self):
+        return [call.args[0] for call in self.save.call_args_list]
+
+    def test_files_without_thumbnails_saved_immediately(self):
+        file = File('/music/other.flac')
+        self.loader.save_files([file])
+        self.assertEqual([file], self._saved_files())
+        self.assertEqual({}, self.downloads)
+
+    def test_full_size_image_downloaded_once(self):
+        self.loader.save_files(self.files)
+        self.assertEqual({'front.jpg'}, set(self.downloads))
+        self.assertEqual([], self._saved_files())
+        self.assertEqual(1, self.loader.pending)
+        self.assertEqual(File.State.PENDING, self.files[0].state)
+
+    def test_thumbnail_replaced_before_saving(self):
+        self.loader.save_files(self.files)
+        self._finish_download('front.jpg')
+        self.assertEqual(self.files, self._saved_files())
+        self.assertEqual(0, self.loader.pending)
+        for obj in (self.album, *self.tracks, *self.files):
+            image = obj.metadata.images[0]
+            self.assertIsNot(self.thumbnail, image)
+            self.assertIsNone(image.full_size_url)
+            self.assertEqual('front.jpg', image.url.fileName())
+        # The images are resized by the processors
+        image = self.files[0].metadata.images[0]
+        self.assertEqual((500, 500), (image.width, image.height))
+        self.assertIs(image, self.album.metadata.images[0])
+
+    def test_file_saved_after_all_images(self):
+        back = self._create_thumbnail('back')
+        self.files[0].metadata.images.append(back)
+        self.loader.save_files(self.files[:1])
+        self.assertEqual({'front.jpg', 'back.jpg'}, set(self.downloads))
+        self._finish_download('front.jpg')
+        self.assertEqual([], self._saved_files())
+        self._finish_download('back.jpg')
+        self.assertEqual(self.files[:1], self._saved_files())
+
+    def test_download_error_keeps_thumbnail(self):
+        self.loader.save_files(self.files)
+        self._finish_download('front.jpg', data=b'', error=1)
+        self.assertEqual(self.files, self._saved_files())
+        self.assertIs(self.thumbnail, self.files[0].metadata.images[0])
+
+    def test_filtered_image_removed(self):
+        self.set_config_values(
+            {'filter_cover_by_size': True, 'cover_minimum_width': 2000, 'cover_minimum_height': 2000}
+        )
+        self.loader.save_files(self.files)
+        self._finish_download('front.jpg')
+        self.assertEqual(self.files, self._saved_files())
+        self.assertEqual(0, len(self.album.metadata.images))
+        self.assertEqual(0, len(self.files[1].metadata.images))
+
+    def test_download_error_not_retried(self):
+        self.loader.save_files(self.files[:1])
+        self._finish_download('front.jpg', data=b'', error=1)
+        self.loader.save_files(self.files[1:])
+        self.assertEqual({}, self.downloads)
+        self.assertEqual(self.files, self._saved_files())
+
+    def test_album_refreshed_while_waiting(self):
+        self.loader.save_files(self.files[:1])
+        # Refreshing the album sets new thumbnails on the file
+        thumbnail = self._create_thumbnail('front')
+        self.files[0].metadata.images = ImageList([thumbnail])
+        self._finish_download('front.jpg')
+        self.assertEqual([], self._saved_files())
+        self.assertEqual({'front.jpg'}, set(self.downloads))
+        self._finish_download('front.jpg')
+        self.assertEqual(self.files[:1], self._saved_files())
+        image = self.files[0].metadata.images[0]
+        self.assertIsNone(image.full_size_url)
+        self.assertEqual('front.jpg', image.url.fileName())
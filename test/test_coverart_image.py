@@ -25,6 +25,7 @@ from collections import Counter
 import os.path
 from tempfile import TemporaryDirectory
 import unittest
+from unittest.mock import patch
 
 from test.picardtestcase import (
     PicardTestCase,
@@ -374,6 +375,21 @@ class DataHashTest(PicardTestCase):
         del b
         self.assertFalse(os.path.exists(filename))
 
+    def test_deferred_file_deletion(self):
+        a = DataHash(b'deferred a')
+        b = DataHash(b'deferred b')
+        filenames = [a.filename, b.filename]
+        with patch('picard.coverart.image.thread.run_task') as run_task:
+            with DataHash.deferred_file_deletion():
+                with DataHash.deferred_file_deletion():
+                    del a
+                del b
+                self.assertTrue(all(os.path.exists(filename) for filename in filenames))
+            run_task.assert_called_once()
+            self.assertTrue(all(os.path.exists(filename) for filename in filenames))
+            run_task.call_args.args[0]()
+        self.assertFalse(any(os.path.exists(filename) for filename in filenames))
+
 
 class CoverArtImageMakeFilenameTest(PicardTestCase):
     def setUp(self):
@@ -21,12 +21,18 @@
 
 
 from copy import copy
+from functools import partial
+import os
+import threading
 from unittest.mock import (
     Mock,
     patch,
 )
 
-from PyQt6.QtCore import QBuffer
+from PyQt6.QtCore import (
+    QBuffer,
+    QThreadPool,
+)
 from PyQt6.QtGui import QImage
 
 from test.picardtestcase import PicardTestCase
@@ -39,7 +45,14 @@ from picard.const.cover_processing import (
     ResizeModes,
 )
 from picard.coverart.image import CoverArtImage
-from picard.coverart.processing import CoverArtImageProcessing
+from picard.coverart.processing import (
+    CoverArtImageProcessing,
+    processing_settings_fingerprint,
+)
+from picard.coverart.processing.cache import (
+    ProcessedImageCache,
+    make_cache_key,
+)
 from picard.coverart.processing.filters import (
     bigger_previous_image_filter,
     image_types_filter,
@@ -140,28 +153,31 @@ class ImageFiltersTest(PicardTestCase):
         self.assertTrue(image_types_filter(image, info, album, coverartimage5))
 
 
+DEFAULT_PROCESSING_SETTINGS = {
+    'enabled_plugins': [],
+    'cover_tags_resize': True,
+    'cover_tags_enlarge': True,
+    'cover_tags_resize_target_width': 500,
+    'cover_tags_resize_target_height': 500,
+    'cover_tags_resize_mode': ResizeModes.MAINTAIN_ASPECT_RATIO,
+    'cover_tags_convert_images': False,
+    'cover_tags_convert_to_format': ImageFormat.JPEG,
+    'cover_file_resize': True,
+    'cover_file_enlarge': True,
+    'cover_file_resize_target_width': 750,
+    'cover_file_resize_target_height': 750,
+    'cover_file_resize_mode': ResizeModes.MAINTAIN_ASPECT_RATIO,
+    'save_images_to_tags': True,
+    'save_images_to_files': True,
+    'cover_file_convert_images': False,
+    'cover_file_convert_to_format': ImageFormat.JPEG,
+}
+
+
 class ImageProcessorsTest(PicardTestCase):
     def setUp(self):
         super().setUp()
-        self.settings = {
-            'enabled_plugins': [],
-            'cover_tags_resize': True,
-            'cover_tags_enlarge': True,
-            'cover_tags_resize_target_width': 500,
-            'cover_tags_resize_target_height': 500,
-            'cover_tags_resize_mode': ResizeModes.MAINTAIN_ASPECT_RATIO,
-            'cover_tags_convert_images': False,
-            'cover_tags_convert_to_format': ImageFormat.JPEG,
-            'cover_file_resize': True,
-            'cover_file_enlarge': True,
-            'cover_file_resize_target_width': 750,
-            'cover_file_resize_target_height': 750,
-            'cover_file_resize_mode': ResizeModes.MAINTAIN_ASPECT_RATIO,
-            'save_images_to_tags': True,
-            'save_images_to_files': True,
-            'cover_file_convert_images': False,
-            'cover_file_convert_to_format': ImageFormat.JPEG,
-        }
+        self.settings = copy(DEFAULT_PROCESSING_SETTINGS)
 
     def _check_image_processors(self, size, expected_tags_size, expected_file_size=None):
         coverartimage = CoverArtImage()
@@ -171,7 +187,6 @@ class ImageProcessorsTest(PicardTestCase):
         callback = Mock()
         with patch('picard.util.thread.to_main', mock_to_main):
             image_processing.run_image_processors(coverartimage, image, info, callback)
-            image_processing.wait_for_processing()
             callback.assert_called_once_with(coverartimage, None)
         tags_size = (coverartimage.width, coverartimage.height)
         if config.setting['save_images_to_tags']:
@@ -327,7 +342,6 @@ class ImageProcessorsTest(PicardTestCase):
         callback = Mock()
         with patch('picard.util.thread.to_main', mock_to_main):
             image_processing.run_image_processors(coverartimage, image, info, callback)
-            image_processing.wait_for_processing()
             callback.assert_called_once_with(coverartimage, None)
         self.assertNotEqual(album.errors, [])
         for error in album.errors:
@@ -343,6 +357,182 @@ class ImageProcessorsTest(PicardTestCase):
         self._check_processing_error(image, info)
 
 
+class ProcessedImageCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = os.path.join(self.mktmpdir(), 'cache')
+
+    def test_get_put(self):
+        cache = ProcessedImageCache(self.directory)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', b'data')
+        self.assertEqual(b'data', cache.get('a'))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(0.5, cache.hit_rate)
+        self.assertEqual(4, cache.size)
+
+    def test_persistent(self):
+        ProcessedImageCache(self.directory).put('a', b'data')
+        cache = ProcessedImageCache(self.directory)
+        self.assertEqual(4, cache.size)
+        self.assertEqual(b'data', cache.get('a'))
+
+    def test_lru_eviction(self):
+        cache = ProcessedImageCache(self.directory, max_size=10)
+        cache.put('a', b'aaaa')
+        cache.put('b', b'bbbb')
+        self.assertEqual(b'aaaa', cache.get('a'))
+        cache.put('c', b'cccc')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(b'aaaa', cache.get('a'))
+        self.assertEqual(b'cccc', cache.get('c'))
+        self.assertEqual(8, cache.size)
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'b')))
+
+    def test_too_large(self):
+        cache = ProcessedImageCache(self.directory, max_size=2)
+        cache.put('a', b'aaaa')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, cache.size)
+
+    def test_missing_file(self):
+        cache = ProcessedImageCache(self.directory)
+        cache.put('a', b'data')
+        os.remove(os.path.join(self.directory, 'a'))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, cache.size)
+
+    def test_clear(self):
+        cache = ProcessedImageCache(self.directory)
+        cache.put('a', b'data')
+        cache.clear()
+        self.assertEqual(0, cache.size)
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_make_cache_key(self):
+        key = make_cache_key('hash', ImageProcessor.Target.TAGS, 'fingerprint')
+        self.assertEqual(key, make_cache_key('hash', ImageProcessor.Target.TAGS, 'fingerprint'))
+        self.assertNotEqual(key, make_cache_key('hash', ImageProcessor.Target.FILE, 'fingerprint'))
+        self.assertNotEqual(key, make_cache_key('hash', ImageProcessor.Target.TAGS, 'other'))
+        self.assertNotEqual(key, make_cache_key('other', ImageProcessor.Target.TAGS, 'fingerprint'))
+
+
+class ProcessedImageCacheProcessingTest(ImageProcessorsTest):
+    def setUp(self):
+        super().setUp()
+        self.settings['cover_image_quality'] = 90
+        self.set_config_values(self.settings)
+        self.tagger.processed_image_cache = ProcessedImageCache(self.mktmpdir())
+
+    def _process(self, data, info):
+        coverartimage = CoverArtImage()
+        image_processing = CoverArtImageProcessing(Album(None))
+        callback = Mock()
+        with patch('picard.util.thread.to_main', mock_to_main):
+            image_processing.run_image_processors(coverartimage, data, info, callback)
+        callback.assert_called_once_with(coverartimage, None)
+        return coverartimage
+
+    def test_cached_results(self):
+        cache = self.tagger.processed_image_cache
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        first = self._process(data, info)
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        with patch('picard.coverart.processing.ProcessingImage') as processing_image:
+            second = self._process(data, info)
+            processing_image.assert_not_called()
+        self.assertEqual((2, 1), (cache.hits, cache.misses))
+        self.assertEqual(first.data, second.data)
+        self.assertEqual((500, 500), (second.width, second.height))
+        self.assertEqual(first.external_file_coverart.data, second.external_file_coverart.data)
+        self.assertEqual((750, 750), (second.external_file_coverart.width, second.external_file_coverart.height))
+
+    def test_settings_change(self):
+        cache = self.tagger.processed_image_cache
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        self._process(data, info)
+        self.set_config_values({'cover_tags_resize_target_width': 400, 'cover_tags_resize_target_height': 400})
+        coverartimage = self._process(data, info)
+        self.assertEqual(0, cache.hits)
+        self.assertEqual((400, 400), (coverartimage.width, coverartimage.height))
+
+    def test_unchanged_image(self):
+        # Only processors for both targets, the TAGS and FILE queues return the source image
+        self.set_config_values({'cover_file_resize_target_width': 500, 'cover_file_resize_target_height': 500})
+        data, info = create_fake_image(1000, 1000, 'jpg')
+        first = self._process(data, info)
+        second = self._process(data, info)
+        self.assertEqual(2, self.tagger.processed_image_cache.hits)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first.external_file_coverart.data, second.external_file_coverart.data)
+
+    def test_no_processors(self):
+        self.assertIsNone(processing_settings_fingerprint({}))
+
+    def test_plugin_processor(self):
+        class PluginProcessor(ImageProcessor):
+            pass
+
+        PluginProcessor.__module__ = 'picard.plugins.example'
+        queues = {ImageProcessor.Target.SAME: [ResizeImage(), PluginProcessor()]}
+        self.assertIsNone(processing_settings_fingerprint(queues))
+        queues = {ImageProcessor.Target.SAME: [ResizeImage()]}
+        self.assertIsNotNone(processing_settings_fingerprint(queues))
+
+
+class ImageProcessingPipelineTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(DEFAULT_PROCESSING_SETTINGS)
+        # A real thread pool with a single thread, nested blocking waits
+        # for sub tasks would never finish.
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(1)
+        self.addCleanup(self.thread_pool.waitForDone)
+        self.tagger.image_processing_thread_pool = self.thread_pool
+        self.lock = threading.Lock()
+        self.finished = []
+        self.all_finished = threading.Event()
+
+    def _callback(self, count, coverartimage, error):
+        with self.lock:
+            self.finished.append((coverartimage, error))
+            if len(self.finished) == count:
+                self.all_finished.set()
+
+    def _process_images(self, images):
+        album = Album(None)
+        image_processing = CoverArtImageProcessing(album)
+        callback = partial(self._callback, len(images))
+        coverartimages = []
+        with patch('picard.util.thread.to_main', mock_to_main):
+            for data, info in images:
+                coverartimage = CoverArtImage()
+                coverartimages.append(coverartimage)
+                image_processing.run_image_processors(coverartimage, data, info, callback)
+            self.assertTrue(self.all_finished.wait(10))
+        return album, coverartimages
+
+    def test_single_thread(self):
+        images = [create_fake_image(1000, 1000, 'jpg') for _i in range(5)]
+        album, coverartimages = self._process_images(images)
+        self.assertEqual(5, len(self.finished))
+        self.assertEqual([], album.errors)
+        for coverartimage in coverartimages:
+            self.assertEqual((500, 500), (coverartimage.width, coverartimage.height))
+            external_cover = coverartimage.external_file_coverart
+            self.assertEqual((750, 750), (external_cover.width, external_cover.height))
+
+    def test_errors(self):
+        images = [create_fake_image(0, 0, 'jpg'), create_fake_image(500, 500, 'jpg')]
+        album, coverartimages = self._process_images(images)
+        self.assertEqual(2, len(self.finished))
+        self.assertEqual(1, len(album.errors))
+        self.assertIsInstance(album.errors[0], CoverArtProcessingError)
+        self.assertEqual((500, 500), (coverartimages[1].width, coverartimages[1].height))
+
+
 class ProcessingImageTest(PicardTestCase):
     def test_image_from_binary(self):
         data, info = create_fake_image(500, 500, "jpg")
@@ -385,7 +575,6 @@ class ProcessingImageTest(PicardTestCase):
 
         with patch('picard.util.thread.to_main', mock_to_main):
             image_processing.run_image_processors(coverartimage, original_data, info, callback)
-            image_processing.wait_for_processing()
             callback.assert_called_once_with(coverartimage, None)
 
         # Image data should be identical to original (no re-encoding)
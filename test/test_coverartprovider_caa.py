@@ -20,10 +20,21 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
+import json
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 
 from test.picardtestcase import PicardTestCase
+from test.test_coverart_downloadcache import fake_reply
+from test.test_coverart_processing import mock_to_main
 
-from picard.coverart.providers.caa import caa_url_fallback_list
+from picard.coverart.downloadcache import CaaIndexCache
+from picard.coverart.providers.caa import (
+    CoverArtProviderCaa,
+    caa_url_fallback_list,
+)
 
 
 class CoverArtImageProviderCaaTest(PicardTestCase):
@@ -90,3 +101,83 @@ class CoverArtImageProviderCaaTest(PicardTestCase):
 
         with self.assertRaises(AttributeError):
             caa_url_fallback_list(250, 666)
+
+
+INDEX = {
+    'images': [
+        {
+            'approved': True,
+            'comment': '',
+            'front': True,
+            'image': 'https://coverartarchive.org/release/r1/1.jpg',
+            'thumbnails': {'500': 'https://coverartarchive.org/release/r1/1-500.jpg'},
+            'types': ['Front'],
+        },
+    ],
+}
+
+
+class CoverArtProviderCaaIndexCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                'caa_approved_only': False,
+                'caa_image_size': 500,
+                'caa_restrict_image_types': False,
+                'caa_thumbnails_first': False,
+                'save_images_to_files': False,
+                'save_only_one_front_image': False,
+            }
+        )
+        self.coverart = MagicMock()
+        self.coverart.metadata = {'musicbrainz_albumid': 'r1'}
+        self.album = self.coverart.album
+        self.album.tagger.caa_index_cache = CaaIndexCache(self.mktmpdir())
+        self.webservice = self.album.tagger.webservice
+        patcher = patch('picard.util.thread.to_main', mock_to_main)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _load(self, data, http):
+        provider = CoverArtProviderCaa(self.coverart)
+        self.assertEqual(CoverArtProviderCaa.QueueState.WAIT, provider.queue_images())
+        self.album.add_task.call_args.kwargs['request_factory']()
+        request = self.webservice.download_url.call_args.kwargs
+        self.assertEqual('https://coverartarchive.org/release/r1/', request['url'].toString())
+        request['handler'](data, http, None)
+
+    def _queued_urls(self):
+        return [call.args[0].url.toString() for call in self.coverart.queue_put.call_args_list]
+
+    def test_index_downloaded(self):
+        self._load(json.dumps(INDEX).encode('utf-8'), fake_reply(etag='"v1"'))
+        self.webservice.get_url.assert_not_called()
+        self.assertEqual(['https://coverartarchive.org/release/r1/1-500.jpg'], self._queued_urls())
+        self.album.complete_task.assert_called_once_with('caa_json_r1')
+        self.coverart.next_in_queue.assert_called_once_with()
+
+    def test_unchanged_index(self):
+        self._load(json.dumps(INDEX).encode('utf-8'), fake_reply(etag='"v1"'))
+        self.coverart.queue_put.reset_mock()
+        self._load(b'', fake_reply(status=304))
+        self.assertEqual({'If-None-Match': '"v1"'}, self.webservice.download_url.call_args.kwargs['headers'])
+        self.assertEqual(['https://coverartarchive.org/release/r1/1-500.jpg'], self._queued_urls())
+
+    def test_cancelled(self):
+        provider = CoverArtProviderCaa(self.coverart)
+        provider.queue_images()
+        kwargs = self.album.add_task.call_args.kwargs
+        kwargs['request_factory']()
+        # The shared download can't be aborted
+        kwargs['on_cancel']()
+        request = self.webservice.download_url.call_args.kwargs
+        request['handler'](json.dumps(INDEX).encode('utf-8'), fake_reply(), None)
+        self.coverart.queue_put.assert_not_called()
+        self.album.complete_task.assert_not_called()
+        self.coverart.next_in_queue.assert_not_called()
+
+    def test_invalid_index(self):
+        self._load(b'not json', fake_reply())
+        self.coverart.queue_put.assert_not_called()
+        self.album.complete_task.assert_called_once_with('caa_json_r1')
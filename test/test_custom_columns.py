@@ -31,6 +31,7 @@ import pytest
 
 from picard.ui.columns import ColumnSortType
 from picard.ui.itemviews.custom_columns import (
+    CasefoldSortAdapter,
     ColumnValueProvider,
     CustomColumn,
     make_callable_column,
@@ -824,3 +825,47 @@ def test_album_like_object_avoids_caching_until_loaded() -> None:
     obj._artist = "Artist 3"
     obj._album = "Album 3"
     assert col.provider.evaluate(obj) == "Artist 2 - Album 2"
+
+
+def test_script_provider_compute_values_bypasses_cache() -> None:
+    provider = ChainedValueProvider("$upper(%artist%)", max_runtime_ms=1000)
+    items = [_FakeItem(values={"artist": f"artist {i}"}) for i in range(3)]
+
+    assert provider.compute_values(items) == ["ARTIST 0", "ARTIST 1", "ARTIST 2"]
+    assert not any(provider.is_cached(item) for item in items)
+
+
+def test_script_provider_prime_fills_cache() -> None:
+    provider = ChainedValueProvider("%artist%", max_runtime_ms=1000)
+    item = _FakeItem(values={"artist": "Artist A"})
+
+    provider.prime(item, "Primed")
+    assert provider.is_cached(item)
+    assert provider.evaluate(item) == "Primed"
+
+    provider.invalidate(item)
+    assert not provider.is_cached(item)
+    assert provider.evaluate(item) == "Artist A"
+
+
+def test_script_provider_prime_skips_unloaded_albums() -> None:
+    class AlbumLike(_FakeItem):
+        is_album_like = True
+        loaded = False
+
+    provider = ChainedValueProvider("%album%", max_runtime_ms=1000)
+    item = AlbumLike(values={"album": "Album 1"})
+
+    provider.prime(item, "Album 1")
+    assert not provider.is_cached(item)
+
+
+def test_custom_column_script_provider() -> None:
+    script_column = make_script_column("Scripted", "script_key", "%artist%")
+    assert script_column.script_provider is script_column.provider
+
+    field_column = make_field_column("Artist", "artist")
+    assert field_column.script_provider is None
+
+    wrapped = make_provider_column("Wrapped", "wrapped", CasefoldSortAdapter(ChainedValueProvider("%artist%")))
+    assert isinstance(wrapped.script_provider, ChainedValueProvider)
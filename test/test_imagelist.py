@@ -21,6 +21,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from unittest.mock import patch
+
 from test.picardtestcase import (
     PicardTestCase,
     create_fake_png,
@@ -31,7 +33,10 @@ from picard.cluster import Cluster
 from picard.coverart.image import CoverArtImage
 from picard.file import File
 from picard.track import Track
-from picard.util.imagelist import ImageList
+from picard.util.imagelist import (
+    ImageList,
+    ImageMultiset,
+)
 
 
 def create_test_files():
@@ -247,6 +252,94 @@ class AddMetadataImagesTest(PicardTestCase):
         self.assertTrue(cluster.update_metadata_images_from_children())
         self.assertFalse(cluster.add_metadata_images_from_children([]))
 
+    def test_add_is_incremental(self):
+        cluster = Cluster('Test')
+        cluster.files = list(self.test_files[:2])
+        self.assertTrue(cluster.update_metadata_images_from_children())
+        cluster.files.append(self.test_files[2])
+        with patch.object(ImageList, 'hash_dict', autospec=True, side_effect=ImageList.hash_dict) as hash_dict:
+            self.assertFalse(cluster.add_metadata_images_from_children([self.test_files[2]]))
+        # Only the images of the added file got counted
+        file = self.test_files[2]
+        self.assertEqual(
+            {id(call.args[0]) for call in hash_dict.call_args_list},
+            {id(file.metadata.images), id(file.orig_metadata.images)},
+        )
+        self.assertEqual(set(self.test_images), set(cluster.metadata.images))
+        self.assertFalse(cluster.metadata.has_common_images)
+
+    def test_add_after_external_change(self):
+        cluster = Cluster('Test')
+        cluster.files = [self.test_files[0]]
+        self.assertTrue(cluster.update_metadata_images_from_children())
+        cluster.metadata.images = ImageList()
+        cluster.files.append(self.test_files[1])
+        self.assertTrue(cluster.add_metadata_images_from_children([self.test_files[1]]))
+        self.assertEqual(set(self.test_images), set(cluster.metadata.images))
+
+
+class ImageMultisetTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        (self.test_images, self.test_files) = create_test_files()
+        self.multiset = ImageMultiset()
+
+    def test_add(self):
+        self.assertTrue(self.multiset.add('a', ImageList(self.test_images[:1])))
+        self.assertFalse(self.multiset.add('b', ImageList(self.test_images[:1])))
+        self.assertTrue(self.multiset.add('c', ImageList(self.test_images)))
+        self.assertEqual(set(self.test_images), set(self.multiset.to_imagelist()))
+        self.assertIn('c', self.multiset)
+
+    def test_add_unchanged(self):
+        images = ImageList(self.test_images)
+        self.multiset.add('a', images)
+        with patch.object(ImageList, 'hash_dict') as hash_dict:
+            self.assertFalse(self.multiset.add('a', images))
+        hash_dict.assert_not_called()
+
+    def test_replace(self):
+        images = ImageList(self.test_images)
+        self.multiset.add('a', images)
+        images.pop()
+        self.assertTrue(self.multiset.add('a', images))
+        self.assertEqual(self.test_images[:1], list(self.multiset.to_imagelist()))
+
+    def test_discard(self):
+        self.multiset.add('a', ImageList(self.test_images[:1]))
+        self.multiset.add('b', ImageList(self.test_images))
+        self.assertFalse(self.multiset.discard('a'))
+        self.assertTrue(self.multiset.discard('b'))
+        self.assertFalse(self.multiset.discard('b'))
+        self.assertEqual(0, len(self.multiset))
+
+    def test_retain(self):
+        self.multiset.add('a', ImageList(self.test_images[:1]))
+        self.multiset.add('b', ImageList(self.test_images[1:]))
+        self.assertTrue(self.multiset.retain({'b'}))
+        self.assertEqual(self.test_images[1:], list(self.multiset.to_imagelist()))
+
+    def test_has_common_images(self):
+        self.assertTrue(self.multiset.has_common_images)
+        self.multiset.add('a', ImageList(self.test_images))
+        self.multiset.add('b', ImageList(self.test_images))
+        self.assertTrue(self.multiset.has_common_images)
+        self.multiset.add('c', ImageList(self.test_images[1:]))
+        self.assertFalse(self.multiset.has_common_images)
+        # Sources without images are not taken into account
+        self.multiset.add('c', ImageList())
+        self.assertTrue(self.multiset.has_common_images)
+        self.multiset.discard('b')
+        self.assertTrue(self.multiset.has_common_images)
+
+    def test_is_result(self):
+        self.multiset.add('a', ImageList(self.test_images))
+        images = self.multiset.to_imagelist()
+        self.assertTrue(self.multiset.is_result(images))
+        self.assertFalse(self.multiset.is_result(images.copy()))
+        images.pop()
+        self.assertFalse(self.multiset.is_result(images))
+
 
 class ImageListTest(PicardTestCase):
     def setUp(self):
@@ -289,6 +382,38 @@ class ImageListTest(PicardTestCase):
         self.assertEqual(list1, list2)
         self.assertNotEqual(list1, list3)
 
+    def test_eq_same_types(self):
+        list1 = ImageList([self.images['b'], self.images['c']])
+        list2 = ImageList([self.images['c'], self.images['b']])
+        self.assertEqual(list1, list2)
+
+    def test_eq_mixed_types_support(self):
+        data = create_fake_png(b'mixed')
+        # e.g. loaded from an ID3 APIC frame, which supports a single type
+        single_type = CoverArtImage(data=data, types=['front'], support_types=True)
+        # e.g. from the Cover Art Archive
+        multi_types = CoverArtImage(
+            url='https://example.com/front.png',
+            data=data,
+            types=['front', 'medium'],
+            support_types=True,
+            support_multi_types=True,
+        )
+        self.assertEqual(single_type, multi_types)
+        self.assertEqual(ImageList([single_type]), ImageList([multi_types]))
+        self.assertEqual(ImageList([self.images['a'], single_type]), ImageList([multi_types, self.images['a']]))
+        self.assertNotEqual(ImageList([self.images['a'], single_type]), ImageList([multi_types, self.images['b']]))
+        without_types = CoverArtImage(data=data)
+        self.assertEqual(ImageList([without_types]), ImageList([multi_types]))
+
+    def test_fingerprint_cached(self):
+        imagelist = ImageList([self.images['a'], self.images['b']])
+        fingerprint = imagelist.fingerprint()
+        self.assertIs(fingerprint, imagelist.fingerprint())
+        self.assertIs(fingerprint, imagelist.copy().fingerprint())
+        imagelist.append(self.images['c'])
+        self.assertNotEqual(fingerprint, imagelist.fingerprint())
+
     def test_get_front_image(self):
         self.imagelist.append(self.images['a'])
         self.imagelist.append(self.images['b'])
@@ -365,6 +490,14 @@ class ImageListTest(PicardTestCase):
         self.assertEqual(imagelist2[0], 'a')
         self.assertEqual(imagelist3[0], 'c')
 
+    def test_imagelist_copy_on_write(self):
+        imagelist1 = ImageList(['a', 'b'])
+        imagelist2 = imagelist1.copy()
+        imagelist2.append('c')
+        del imagelist1[0]
+        self.assertEqual(['b'], list(imagelist1))
+        self.assertEqual(['a', 'b', 'c'], list(imagelist2))
+
     def test_imagelist_del(self):
         imagelist = ImageList(['a', 'b'])
         del imagelist[0]
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from test.picardtestcase import PicardTestCase
+
+from picard.file import File
+
+from picard.ui.itemviews import (
+    FileItem,
+    TreeItem,
+    get_column_text,
+)
+from picard.ui.itemviews.basetreeview import BaseTreeView
+from picard.ui.itemviews.columns import FILEVIEW_COLUMNS
+from picard.ui.itemviews.custom_columns import make_script_column
+
+
+class LazyColumnTextTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file = File('/music/test.mp3')
+        self.file.metadata['title'] = 'Title'
+        self.item = TreeItem(self.file)
+        self.title_column = FILEVIEW_COLUMNS.pos('title')
+        patcher = patch('picard.ui.itemviews.get_column_text', wraps=get_column_text)
+        self.get_column_text = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _evaluated_columns(self):
+        return [call.args[1].key for call in self.get_column_text.call_args_list]
+
+    def test_custom_columns_not_evaluated_on_update(self):
+        self.item.update_colums_text()
+        self.assertNotIn('title', self._evaluated_columns())
+
+    def test_evaluated_when_shown(self):
+        self.item.update_colums_text()
+        self.assertEqual('Title', self.item.text(self.title_column))
+        # Evaluated only once
+        self.assertEqual('Title', self.item.text(self.title_column))
+        self.assertEqual(1, self._evaluated_columns().count('title'))
+
+    def test_evaluated_again_after_update(self):
+        self.item.update_colums_text()
+        self.assertEqual('Title', self.item.text(self.title_column))
+        self.file.metadata['title'] = 'New title'
+        self.item.update_colums_text()
+        self.assertEqual('New title', self.item.text(self.title_column))
+        self.assertEqual(2, self._evaluated_columns().count('title'))
+
+    def test_evaluated_when_sorted(self):
+        self.item.update_colums_text()
+        self.item.sortkey(self.title_column)
+        self.assertEqual(1, self._evaluated_columns().count('title'))
+
+    def test_sortkey_cached_per_metadata_generation(self):
+        self.item.update_colums_text()
+        self.assertEqual(self.item.sortkey(self.title_column), self.item.sortkey(self.title_column))
+        self.assertEqual(1, self._evaluated_columns().count('title'))
+        self.file.metadata['title'] = 'New title'
+        self.assertEqual('New title', self.item.text(self.title_column))
+        self.item.sortkey(self.title_column)
+        self.assertEqual(2, self._evaluated_columns().count('title'))
+
+    def test_set_text_overrides_lazy_text(self):
+        self.item.update_colums_text()
+        self.item.setText(self.title_column, 'Explicit')
+        self.assertEqual('Explicit', self.item.text(self.title_column))
+
+
+class FileItemCustomColumnTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        column = make_script_column('Matched', 'matched', '$matchedtracks()')
+        patcher = patch.object(FileItem, 'columns', [column])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.file = File('/music/test.mp3')
+        self.album = Mock()
+        self.album.get_num_matched_tracks.return_value = 1
+        self.file.parent_item = Mock(album=self.album)
+        self.item = FileItem(self.file)
+
+    def test_evaluated_again_after_album_change(self):
+        self.item.update_colums_text()
+        self.assertEqual('1', self.item.text(0))
+        # The file metadata is unchanged, but the value depends on the album
+        self.album.get_num_matched_tracks.return_value = 2
+        self.item.update_colums_text()
+        self.assertEqual('2', self.item.text(0))
+
+
+class BulkSortTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.column = make_script_column('Scripted', 'scripted', '$upper(%title%)')
+        self.provider = self.column.script_provider
+        self.view = Mock(
+            columns=[self.column],
+            deferred_sort_column=0,
+            _bulk_sort_serial=1,
+            _bulk_sort_resorting=False,
+        )
+        self.view.sortColumn.return_value = 0
+        self.files = []
+        for i in range(3):
+            file = File('/music/%d.mp3' % i)
+            file.metadata['title'] = 'title %d' % i
+            self.files.append(file)
+
+    def test_values_primed_and_sorted(self):
+        generations = [file.metadata.generation for file in self.files]
+        values = self.provider.compute_values(self.files)
+        self.files[2].metadata['title'] = 'changed'
+        BaseTreeView._on_bulk_sort_values_computed(
+            self.view, 1, 0, self.provider, self.files, generations, result=values
+        )
+        self.assertEqual(-1, self.view.deferred_sort_column)
+        self.assertTrue(self.provider.is_cached(self.files[0]))
+        self.assertEqual('TITLE 1', self.provider.evaluate(self.files[1]))
+        # Changed while computing
+        self.assertFalse(self.provider.is_cached(self.files[2]))
+        self.assertEqual('CHANGED', self.provider.evaluate(self.files[2]))
+        self.view.sortByColumn.assert_called_once()
+
+    def test_outdated_results_ignored(self):
+        self.view._bulk_sort_serial = 2
+        BaseTreeView._on_bulk_sort_values_computed(
+            self.view, 1, 0, self.provider, self.files, [None] * 3, result=['x'] * 3
+        )
+        self.assertEqual(0, self.view.deferred_sort_column)
+        self.assertFalse(any(self.provider.is_cached(file) for file in self.files))
+        self.view.sortByColumn.assert_not_called()
+
+    def test_not_resorted_if_sort_column_changed(self):
+        self.view.sortColumn.return_value = 3
+        BaseTreeView._on_bulk_sort_values_computed(
+            self.view, 1, 0, self.provider, self.files, [None] * 3, result=['x'] * 3
+        )
+        self.view.sortByColumn.assert_not_called()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+
+from unittest.mock import Mock
+
+from test.picardtestcase import PicardTestCase
+
+from picard.ui.itemviews.updatescheduler import ItemUpdateScheduler
+
+
+class FakeItem:
+    def __init__(self, scheduler, name, parent=None, attached=True):
+        self.scheduler = scheduler
+        self.name = name
+        self._parent = parent
+        self.attached = attached
+        self.updates = []
+
+    def parent(self):
+        return self._parent
+
+    def treeWidget(self):
+        return Mock() if self.attached else None
+
+    def update(self, **kwargs):
+        self.updates.append(kwargs)
+        if self._parent and kwargs.get('update_parent', True):
+            self.scheduler.schedule(self._parent, update_children=False)
+        if kwargs.get('update_selection', True):
+            self.scheduler.request_selection_update()
+
+
+class ItemUpdateSchedulerTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.update_selection = Mock()
+        self.scheduler = ItemUpdateScheduler(update_selection=self.update_selection)
+        self.scheduler._timer = Mock()
+        self.scheduler._timer.isActive.return_value = False
+        self.album = FakeItem(self.scheduler, 'album')
+        self.track = FakeItem(self.scheduler, 'track', parent=self.album)
+        self.files = [FakeItem(self.scheduler, 'file%d' % i, parent=self.track) for i in range(3)]
+
+    def test_schedule_starts_timer(self):
+        self.scheduler.schedule(self.album)
+        self.scheduler._timer.start.assert_called_once()
+        self.assertEqual([], self.album.updates)
+
+    def test_updates_are_coalesced(self):
+        self.scheduler.schedule(self.track, update_parent=False)
+        self.scheduler.schedule(self.track, update_parent=False)
+        self.scheduler.flush()
+        self.assertEqual([{'update_parent': False}], self.track.updates)
+        self.assertEqual(2, self.scheduler.num_requested)
+        self.assertEqual(1, self.scheduler.num_coalesced)
+
+    def test_merge_arguments(self):
+        self.scheduler.schedule(self.track, update_parent=False, update_selection=False)
+        self.scheduler.schedule(self.track, update_selection=False)
+        self.scheduler.flush()
+        self.assertEqual([{'update_parent': True, 'update_selection': False}], self.track.updates)
+
+    def test_parents_updated_once(self):
+        for file in self.files:
+            self.scheduler.schedule(file)
+        self.scheduler.schedule(self.album)
+        self.scheduler.flush()
+        for file in self.files:
+            self.assertEqual(1, len(file.updates))
+        self.assertEqual(1, len(self.track.updates))
+        self.assertEqual(1, len(self.album.updates))
+        self.assertEqual(3, self.scheduler.num_coalesced)
+        self.assertEqual(5, self.scheduler.num_performed)
+
+    def test_selection_updated_once(self):
+        for file in self.files:
+            self.scheduler.schedule(file)
+        self.scheduler.flush()
+        self.update_selection.assert_called_once()
+        self.assertEqual(5, self.scheduler.num_selection_requested)
+        self.assertEqual(4, self.scheduler.num_selection_avoided)
+
+    def test_selection_update_outside_flush(self):
+        self.scheduler.request_selection_update()
+        self.update_selection.assert_called_once()
+
+    def test_detached_items_dropped(self):
+        self.track.attached = False
+        self.scheduler.schedule(self.track)
+        self.scheduler.flush()
+        self.assertEqual([], self.track.updates)
+        self.assertEqual(1, self.scheduler.num_dropped)
+        self.assertEqual(1, self.scheduler.num_avoided)
+
+    def test_deleted_items_dropped(self):
+        self.track.treeWidget = Mock(side_effect=RuntimeError)
+        self.scheduler.schedule(self.track, update_parent=False)
+        self.scheduler.flush()
+        self.assertEqual([], self.track.updates)
+
+    def test_resume_flushes(self):
+        self.scheduler.suspend()
+        self.scheduler._timer.setInterval.assert_called_with(250)
+        self.scheduler.schedule(self.album)
+        self.assertEqual([], self.album.updates)
+        self.scheduler.resume()
+        self.scheduler._timer.setInterval.assert_called_with(0)
+        self.assertEqual(1, len(self.album.updates))
@@ -27,6 +27,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
 
+from unittest.mock import patch
+
 from test.picardtestcase import (
     PicardTestCase,
     load_test_json,
@@ -40,13 +42,16 @@ from picard.const import (
     ALIAS_TYPE_SEARCH_HINT_ID,
 )
 from picard.mbjson import (
+    ArtistTranslationCache,
     _locales_from_aliases,
     _node_skip_empty_iter,
     _parse_attributes,
     _relations_to_metadata,
     _relations_to_metadata_target_type_url,
     _translate_artist_node,
+    _translate_artist_node_uncached,
     artist_to_metadata,
+    artist_translation_cache,
     countries_from_node,
     get_score,
     label_info_from_node,
@@ -681,6 +686,70 @@ class ArtistTranslationTest(MBJSONTest):
         self.assertEqual(artist_name, 'Ed Sheeran')
 
 
+class ArtistTranslationCacheTest(MBJSONTest):
+    filename = 'artist.json'
+
+    def setUp(self):
+        super().setUp()
+        artist_translation_cache.clear()
+        self.addCleanup(artist_translation_cache.clear)
+        self.set_config_values(
+            {
+                "translate_artist_names": True,
+                "translate_artist_names_script_exception": False,
+                "script_exceptions": [],
+                "artist_locales": ['en_CA', 'en'],
+            }
+        )
+
+    def test_cache_hit(self):
+        with patch('picard.mbjson._translate_artist_node_uncached', wraps=_translate_artist_node_uncached) as func:
+            self.assertEqual('Ed Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+            self.assertEqual('Ed Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+            func.assert_called_once()
+        self.assertEqual(1, artist_translation_cache.hits)
+        self.assertEqual(1, artist_translation_cache.misses)
+
+    def test_cache_setting_change(self):
+        self.assertEqual('Ed Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+        self.set_config_values({"artist_locales": ['en']})
+        self.assertEqual('Ed Sheeran (en)', _translate_artist_node(self.json_doc)[0])
+        self.set_config_values({"translate_artist_names": False})
+        self.assertEqual('Ed Sheeran', _translate_artist_node(self.json_doc)[0])
+        self.assertEqual(2, len(artist_translation_cache))
+
+    def test_cache_node_changes(self):
+        self.assertEqual('Ed Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+        del self.json_doc['aliases']
+        self.assertEqual('Ed Sheeran', _translate_artist_node(self.json_doc)[0])
+
+    def test_cache_alias_changes(self):
+        self.assertEqual('Ed Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+        for alias in self.json_doc['aliases']:
+            if alias['locale'] == 'en_CA':
+                alias['name'] = 'Edward Sheeran (en_CA)'
+        self.assertEqual('Edward Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+        for alias in self.json_doc['aliases']:
+            if alias['locale'] == 'en_CA':
+                alias['primary'] = False
+        self.assertEqual('Ed Sheeran (en)', _translate_artist_node(self.json_doc)[0])
+
+    def test_no_id_not_cached(self):
+        del self.json_doc['id']
+        self.assertEqual('Ed Sheeran (en_CA)', _translate_artist_node(self.json_doc)[0])
+        self.assertEqual(0, len(artist_translation_cache))
+
+    def test_max_size(self):
+        cache = ArtistTranslationCache(max_size=2)
+        cache.set(('a',), ('A', 'A'))
+        cache.set(('b',), ('B', 'B'))
+        self.assertEqual(('A', 'A'), cache.get(('a',)))
+        cache.set(('c',), ('C', 'C'))
+        self.assertIsNone(cache.get(('b',)))
+        self.assertEqual(('A', 'A'), cache.get(('a',)))
+        self.assertEqual(('C', 'C'), cache.get(('c',)))
+
+
 class ArtistTranslationArabicExceptionsTest(MBJSONTest):
     filename = 'artist_arabic.json'
 
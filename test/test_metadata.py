@@ -22,6 +22,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
+from unittest.mock import Mock
 
 from test.picardtestcase import (
     PicardTestCase,
@@ -748,6 +749,126 @@ class MetadataTest(CommonTests.CommonMetadataTestCase):
         return Metadata()
 
 
+class MetadataGenerationTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.metadata = Metadata(title='Title', artist=['A', 'B'])
+
+    def assertChanged(self, func):
+        generation = self.metadata.generation
+        func(self.metadata)
+        self.assertGreater(self.metadata.generation, generation)
+
+    def assertUnchanged(self, func):
+        generation = self.metadata.generation
+        func(self.metadata)
+        self.assertEqual(generation, self.metadata.generation)
+
+    def test_unique_per_instance(self):
+        self.assertNotEqual(Metadata().generation, Metadata().generation)
+
+    def test_set(self):
+        self.assertChanged(lambda m: m.__setitem__('title', 'Other'))
+        self.assertChanged(lambda m: m.__setitem__('album', 'Album'))
+        self.assertChanged(lambda m: m.set('artist', ['A']))
+
+    def test_set_same_value(self):
+        self.assertUnchanged(lambda m: m.__setitem__('title', 'Title'))
+        self.assertUnchanged(lambda m: m.set('artist', ['A', 'B']))
+
+    def test_delete(self):
+        self.assertChanged(lambda m: m.__delitem__('title'))
+        self.assertUnchanged(lambda m: m.__delitem__('title'))
+        self.assertChanged(lambda m: m.__delitem__('album'))
+
+    def test_add_and_unset(self):
+        self.assertChanged(lambda m: m.add('genre', 'Rock'))
+        self.assertChanged(lambda m: m.unset('genre'))
+        self.assertUnchanged(lambda m: m.unset('genre'))
+
+    def test_update_and_clear(self):
+        self.assertChanged(lambda m: m.update({'title': 'Other'}))
+        self.assertUnchanged(lambda m: m.update({'title': 'Other'}))
+        self.assertChanged(lambda m: m.clear())
+        self.assertChanged(lambda m: m.clear_deleted())
+
+    def test_length(self):
+        self.assertChanged(lambda m: setattr(m, 'length', 1000))
+        self.assertUnchanged(lambda m: setattr(m, 'length', 1000))
+
+    def test_images(self):
+        image = create_image(b'a', types=['front'])
+        self.assertChanged(lambda m: m.images.append(image))
+        self.assertChanged(lambda m: m.images.remove(image))
+        self.assertChanged(lambda m: setattr(m, 'images', ImageList()))
+        self.assertChanged(lambda m: m.add_images({image}))
+
+
+class MetadataCopyOnWriteTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.original = Metadata(title='Title', artist=['A', 'B'], length=1000)
+        del self.original['comment']
+
+    def test_copy_shares_tags(self):
+        copy = Metadata(self.original)
+        self.assertIs(self.original._store, copy._store)
+        self.assertEqual(self.original, copy)
+        self.assertEqual({'comment'}, copy.deleted_tags)
+        self.assertEqual(1000, copy.length)
+
+    def test_modify_copy(self):
+        copy = Metadata()
+        copy.copy(self.original)
+        copy['title'] = 'Other'
+        copy.add('artist', 'C')
+        del copy['artist']
+        self.assertEqual('Title', self.original['title'])
+        self.assertEqual(['A', 'B'], self.original.getall('artist'))
+        self.assertNotIn('artist', self.original.deleted_tags)
+        self.assertEqual('Other', copy['title'])
+
+    def test_modify_original(self):
+        copy = Metadata(self.original)
+        self.original.add('artist', 'C')
+        self.original.unset('title')
+        self.original.clear()
+        self.assertEqual('Title', copy['title'])
+        self.assertEqual(['A', 'B'], copy.getall('artist'))
+
+    def test_add_does_not_modify_shared_values(self):
+        copy = Metadata(self.original)
+        values = self.original.getall('artist')
+        copy.add('artist', 'C')
+        self.assertEqual(['A', 'B'], values)
+        self.assertEqual(['A', 'B', 'C'], copy.getall('artist'))
+
+    def test_copy_clears_deleted_tags_of_copied_tags(self):
+        copy = Metadata()
+        del copy['title']
+        copy.update(self.original)
+        self.assertEqual({'comment'}, copy.deleted_tags)
+
+    def test_copy_locks_original_for_writing(self):
+        lock = self.original._lock
+        self.original._lock = Mock(wraps=lock)
+        copy = Metadata()
+        copy.update(self.original)
+        self.original._lock.lock_for_write.assert_called_once_with()
+        self.assertTrue(self.original._shared)
+        # A later write to the original does not modify the shared tags
+        self.original['title'] = 'Other'
+        self.assertFalse(self.original._shared)
+        self.assertIsNot(self.original._store, copy._store)
+        self.assertEqual('Title', copy['title'])
+
+    def test_copy_changes_generation(self):
+        copy = Metadata()
+        generation = copy.generation
+        copy.copy(self.original)
+        self.assertGreater(copy.generation, generation)
+
+
 class MultiMetadataProxyAsMetadataTest(CommonTests.CommonMetadataTestCase):
     @staticmethod
     def get_metadata_object():
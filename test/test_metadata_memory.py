@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+
+import tracemalloc
+
+from test.picardtestcase import PicardTestCase
+
+from picard.metadata import Metadata
+
+
+FILE_COUNT = 1000
+
+# Upper limit for the memory used by the metadata of a loaded file
+MAX_BYTES_PER_FILE = 4500
+
+TAGS = (
+    'title',
+    'artist',
+    'album',
+    'albumartist',
+    'date',
+    'tracknumber',
+    'totaltracks',
+    'discnumber',
+    'genre',
+    'musicbrainz_recordingid',
+    'musicbrainz_albumid',
+    '~format',
+    '~bitrate',
+    '~channels',
+    '~sample_rate',
+)
+
+
+def _load_file_metadata(number):
+    # Like File._load, tag names read from files are not interned
+    orig_metadata = Metadata()
+    for tag in TAGS:
+        orig_metadata[''.join(list(tag))] = '%s %d' % (tag, number)
+    orig_metadata.length = 180000 + number
+    metadata = Metadata()
+    metadata.copy(orig_metadata)
+    return orig_metadata, metadata
+
+
+class MetadataMemoryTest(PicardTestCase):
+    def test_bytes_per_loaded_file(self):
+        tracemalloc.start()
+        try:
+            corpus = [_load_file_metadata(i) for i in range(FILE_COUNT)]
+            used, _peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(FILE_COUNT, len(corpus))
+        bytes_per_file = used / FILE_COUNT
+        self.assertLess(
+            bytes_per_file,
+            MAX_BYTES_PER_FILE,
+            "Metadata of a loaded file uses %.0f bytes" % bytes_per_file,
+        )
+
+    def test_tag_names_interned(self):
+        first, _copy = _load_file_metadata(1)
+        second, _copy = _load_file_metadata(2)
+        for name1, name2 in zip(first, second, strict=True):
+            self.assertIs(name1, name2)
+
+    def test_deleted_tags_and_images_allocated_lazily(self):
+        metadata, copy = _load_file_metadata(1)
+        self.assertIsNone(metadata._deleted_tags)
+        self.assertIsNone(copy._images)
+        self.assertEqual(set(), metadata.deleted_tags)
+        del metadata['title']
+        self.assertEqual({'title'}, metadata.deleted_tags)
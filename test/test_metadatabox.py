@@ -18,12 +18,18 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from PyQt6 import QtCore
 
 from test.picardtestcase import PicardTestCase
 
 from picard.browser.filelookup import FileLookup
+from picard.file import File
 
 from picard.ui.metadatabox import MetadataBox
+from picard.ui.metadatabox.tagdiff import TagDiffAggregator
 
 
 class MetadataBoxFileLookupTest(PicardTestCase):
@@ -33,3 +39,72 @@ class MetadataBoxFileLookupTest(PicardTestCase):
             method = getattr(FileLookup, method_as_string, None)
             self.assertIsNotNone(method, f"No such FileLookup.{method_as_string}")
             self.assertTrue(callable(method), f"FileLookup.{method_as_string} is not callable")
+
+
+class MetadataBoxLite:
+    """The parts of MetadataBox needed to build the tag diff, without widgets."""
+
+    _update_tags = MetadataBox._update_tags
+    _add_files_to_tag_diff = MetadataBox._add_files_to_tag_diff
+    _add_tracks_to_tag_diff = MetadataBox._add_tracks_to_tag_diff
+    _file_tag_diff_entries = staticmethod(MetadataBox._file_tag_diff_entries)
+    _is_stale = MetadataBox._is_stale
+
+    def __init__(self, files):
+        self.selection_mutex = QtCore.QMutex()
+        self.files = set(files)
+        self.tracks = set()
+        self.tag_diff = None
+        self._update_serial = 0
+        self._drop_tag_diff_cache = False
+        self._tag_diff_aggregator = TagDiffAggregator()
+
+
+class FakeSettings(dict):
+    def as_dict(self):
+        return dict(self)
+
+
+class MetadataBoxTagDiffTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        config = SimpleNamespace(
+            setting=FakeSettings(
+                {
+                    'clear_existing_tags': False,
+                    'ignore_track_duration_difference_under': 2,
+                    'metadatabox_top_tags': [],
+                    'move_files': False,
+                    'rename_files': False,
+                }
+            ),
+            persist={'show_changes_first': False},
+        )
+        patcher = patch('picard.ui.metadatabox.get_config', return_value=config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _file(name, title):
+        file = File(name)
+        file.metadata['title'] = title
+        file.orig_metadata['title'] = title
+        return file
+
+    def test_files_counted_once(self):
+        box = MetadataBoxLite([self._file('/a.mp3', 'Title'), self._file('/b.mp3', 'Title')])
+        tag_diff = box._update_tags()
+        self.assertEqual(2, tag_diff.objects)
+        self.assertEqual(('Title', False), tag_diff.new.display_value('title'))
+
+    def test_files_missing_tag(self):
+        box = MetadataBoxLite([self._file('/a.mp3', 'Title'), File('/b.mp3')])
+        tag_diff = box._update_tags()
+        self.assertEqual(2, tag_diff.objects)
+        self.assertTrue(tag_diff.new.display_value('title')[1])
+
+    def test_reused_contributions_counted_once(self):
+        box = MetadataBoxLite([self._file('/a.mp3', 'Title'), self._file('/b.mp3', 'Title')])
+        box._update_tags()
+        tag_diff = box._update_tags()
+        self.assertEqual(2, tag_diff.objects)
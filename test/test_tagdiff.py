@@ -23,6 +23,7 @@ from test.picardtestcase import PicardTestCase
 from picard.ui.metadatabox.tagdiff import (
     TagCounter,
     TagDiff,
+    TagDiffAggregator,
     TagStatus,
 )
 
@@ -362,3 +363,89 @@ class TestTagDiff(PicardTestCase):
         self.tag_diff.update_tag_names()
         tags = self.tag_diff.to_tsv(prettify_times=False)
         self.assertEqual(tags, '~length\t10000\t20000\r\n')
+
+
+class TestTagDiffAggregator(PicardTestCase):
+    objects = {
+        'a': [
+            ("artist", ["Artist 1"], ["Artist 1"]),
+            ("title", ["Title"], ["New Title"]),
+            ("~length", "10000", "10000"),
+        ],
+        'b': [
+            ("artist", ["Artist 2"], ["Artist 2"]),
+            ("album", None, ["Album"]),
+            ("~length", "20000", "20000"),
+        ],
+        'c': [
+            ("artist", ["Artist 1"], ["Artist 1"]),
+            ("~length", "10000", "10000"),
+        ],
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.aggregator = TagDiffAggregator()
+
+    def _set(self, key, stamp=1):
+        entries = [TagDiff().make_entry(tag, old, new) for tag, old, new in self.objects[key]]
+        self.aggregator.set(key, stamp, entries)
+
+    def _expected(self, *keys):
+        tag_diff = TagDiff()
+        for key in keys:
+            for tag, old, new in self.objects[key]:
+                tag_diff.add(tag, old, new)
+            tag_diff.objects += 1
+        tag_diff.update_tag_names()
+        return tag_diff
+
+    def _aggregated(self):
+        tag_diff = TagDiff()
+        self.aggregator.apply(tag_diff)
+        tag_diff.update_tag_names()
+        return tag_diff
+
+    def assertTagDiffEqual(self, tag_diff, expected):
+        self.assertEqual(tag_diff.objects, expected.objects)
+        self.assertEqual(tag_diff.tag_names, expected.tag_names)
+        for tag in expected.tag_names:
+            self.assertEqual(tag_diff.tag_status(tag), expected.tag_status(tag), tag)
+            self.assertEqual(tag_diff.old.display_value(tag), expected.old.display_value(tag), tag)
+            self.assertEqual(tag_diff.new.display_value(tag), expected.new.display_value(tag), tag)
+
+    def test_matches_tag_diff(self):
+        for key in self.objects:
+            self._set(key)
+        self.assertEqual(len(self.aggregator), 3)
+        self.assertTagDiffEqual(self._aggregated(), self._expected('a', 'b', 'c'))
+
+    def test_remove(self):
+        for key in self.objects:
+            self._set(key)
+        self.aggregator.remove('b')
+        self.assertNotIn('b', self.aggregator)
+        tag_diff = self._aggregated()
+        self.assertTagDiffEqual(tag_diff, self._expected('a', 'c'))
+        self.assertEqual(tag_diff.new["artist"], ["Artist 1"])
+        self.assertNotIn("album", tag_diff.tag_names)
+
+    def test_retain(self):
+        for key in self.objects:
+            self._set(key)
+        self.aggregator.retain({'c'})
+        self.assertTagDiffEqual(self._aggregated(), self._expected('c'))
+
+    def test_replace(self):
+        self._set('a', stamp=1)
+        self.assertTrue(self.aggregator.is_current('a', 1))
+        self.assertFalse(self.aggregator.is_current('a', 2))
+        self._set('a', stamp=2)
+        self.assertTrue(self.aggregator.is_current('a', 2))
+        self.assertTagDiffEqual(self._aggregated(), self._expected('a'))
+
+    def test_clear(self):
+        self._set('a')
+        self.aggregator.clear()
+        self.assertEqual(len(self.aggregator), 0)
+        self.assertEqual(self._aggregated().tag_names, [])
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+from unittest.mock import (
+    MagicMock,
+    PropertyMock,
+    patch,
+)
+
+from test.picardtestcase import PicardTestCase
+from test.test_coverart import create_image_data
+
+from picard.coverart.image import CoverArtImageIOError
+
+from picard.ui.thumbnailloader import (
+    ThumbnailLoader,
+    decode_image,
+)
+
+
+def fake_image(data, datahash='hash'):
+    image = MagicMock(data=data)
+    image.datahash.hash = datahash
+    return image
+
+
+class DecodeImageTest(PicardTestCase):
+    def test_scaled_down(self):
+        qimage = decode_image(fake_image(create_image_data()), 32)
+        self.assertEqual((32, 32), (qimage.width(), qimage.height()))
+
+    def test_not_scaled_up(self):
+        qimage = decode_image(fake_image(create_image_data()), 100)
+        self.assertEqual((64, 64), (qimage.width(), qimage.height()))
+
+    def test_invalid_data(self):
+        self.assertIsNone(decode_image(fake_image(b'not an image'), 32))
+
+    def test_missing_file(self):
+        image = MagicMock()
+        type(image).data = PropertyMock(side_effect=CoverArtImageIOError('missing'))
+        self.assertIsNone(decode_image(image, 32))
+
+
+class ThumbnailLoaderTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.loader = ThumbnailLoader()
+        self.decoded = MagicMock()
+        self.loader.decoded.connect(self.decoded)
+        self.image = fake_image(create_image_data())
+        patcher = patch('picard.ui.thumbnailloader.QtGui.QPixmap')
+        self.pixmap_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('picard.ui.thumbnailloader.thread.run_task')
+        self.run_task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_task(self):
+        func, next_func = self.run_task.call_args.args
+        next_func(result=func())
+
+    def test_decoded_asynchronously(self):
+        self.assertIsNone(self.loader.load(self.image, 32))
+        self.assertIsNone(self.loader.load(self.image, 32))
+        self.run_task.assert_called_once()
+        self._run_task()
+        self.decoded.assert_called_once_with(ThumbnailLoader.cache_key(self.image, 32))
+        qimage = self.pixmap_class.fromImage.call_args.args[0]
+        self.assertEqual(32, qimage.width())
+        self.assertEqual(self.pixmap_class.fromImage.return_value, self.loader.load(self.image, 32))
+        self.run_task.assert_called_once()
+
+    def test_cached_by_data_hash_and_size(self):
+        self.loader.load(self.image, 32)
+        self._run_task()
+        self.assertIsNotNone(self.loader.load(fake_image(b'', datahash='hash'), 32))
+        self.assertIsNone(self.loader.load(self.image, 64))
+        self.assertIsNone(self.loader.load(fake_image(b'', datahash='other'), 32))
+
+    def test_decoding_failed(self):
+        self.loader.load(fake_image(b'not an image'), 32)
+        self._run_task()
+        self.pixmap_class.fromImage.assert_not_called()
+        self.assertEqual(self.pixmap_class.return_value, self.loader.load(self.image, 32))
+
+    def test_no_data(self):
+        self.image.datahash = None
+        self.assertEqual(self.pixmap_class.return_value, self.loader.load(self.image, 32))
+        self.run_task.assert_not_called()
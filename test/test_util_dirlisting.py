@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+import os
+import re
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from test.picardtestcase import PicardTestCase
+
+from picard.album import Album
+from picard.coverart.providers.local import CoverArtProviderLocal
+from picard.file import File
+from picard.tagger import Tagger
+from picard.track import Track
+from picard.util.dirlisting import DirectoryListings
+
+
+LOCAL_COVER_REGEX = r'^(?:cover|folder|albumart)(.*)\.(?:jpe?g|png|gif|tiff?|webp)$'
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb'):
+        pass
+
+
+class DirectoryListingsTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = self.mktmpdir()
+        touch(os.path.join(self.root, 'a.mp3'))
+        touch(os.path.join(self.root, 'sub', 'b.mp3'))
+        touch(os.path.join(self.root, 'sub', 'deep', 'c.mp3'))
+        self.listings = DirectoryListings()
+
+    def _walk(self):
+        return [(root, sorted(dirs), sorted(files)) for root, dirs, files in self.listings.walk(self.root)]
+
+    def test_walk(self):
+        expected = [(root, sorted(dirs), sorted(files)) for root, dirs, files in os.walk(self.root)]
+        self.assertEqual(expected, self._walk())
+        self.assertEqual(3, len(self.listings))
+
+    def test_populated_by_file_scan(self):
+        with patch('picard.tagger.directory_listings', self.listings):
+            files = list(Tagger._scan_paths_recursive([self.root], recursive=True, ignore_hidden=False))
+        self.assertEqual(3, len(files))
+        self.assertEqual(3, len(self.listings))
+        self.assertEqual(('a.mp3',), self.listings.get(self.root).files)
+
+    def test_cached(self):
+        self._walk()
+        touch(os.path.join(self.root, 'new.jpg'))
+        self.assertNotIn('new.jpg', self.listings.get(self.root).files)
+        self.listings.invalidate(self.root)
+        self.assertIn('new.jpg', self.listings.get(self.root).files)
+
+    def test_set(self):
+        self.listings.set(self.root, ['x.jpg'], [])
+        self.assertEqual([(self.root, [], ['x.jpg'])], self._walk())
+
+    def test_invalidate_parents(self):
+        self._walk()
+        self.listings.invalidate(os.path.join(self.root, 'sub', 'deep'), parents=True)
+        self.assertNotIn(self.root, self.listings)
+        self.assertNotIn(os.path.join(self.root, 'sub'), self.listings)
+
+    def test_invalidate_recursive(self):
+        self._walk()
+        self.listings.invalidate(os.path.join(self.root, 'sub'), recursive=True)
+        self.assertIn(self.root, self.listings)
+        self.assertNotIn(os.path.join(self.root, 'sub', 'deep'), self.listings)
+
+    def test_missing_directory(self):
+        listing = self.listings.get(os.path.join(self.root, 'missing'))
+        self.assertEqual((), listing.files)
+        self.assertEqual((), listing.dirs)
+
+
+class LocalCoverArtProviderTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values({'local_cover_regex': LOCAL_COVER_REGEX})
+        self.root = self.mktmpdir()
+        touch(os.path.join(self.root, 'cover.jpg'))
+        touch(os.path.join(self.root, 'scans', 'cover_back.png'))
+        touch(os.path.join(self.root, 'notes.txt'))
+        self.album = Album('album')
+        track = Track('t', album=self.album)
+        self.album.tracks.append(track)
+        file = File(os.path.join(self.root, 'a.mp3'))
+        file.parent_item = track
+        track.files.append(file)
+        self.coverart = MagicMock(album=self.album)
+        self.listings = DirectoryListings()
+        patcher = patch('picard.coverart.providers.local.directory_listings', self.listings)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_find_local_images(self):
+        provider = CoverArtProviderLocal(self.coverart)
+        match_re = re.compile(LOCAL_COVER_REGEX, re.IGNORECASE)
+        images = {
+            os.path.relpath(image.url.toLocalFile(), self.root): image.types
+            for image in provider.find_local_images(self.root, match_re)
+        }
+        self.assertEqual({'cover.jpg': ['front'], os.path.join('scans', 'cover_back.png'): ['back']}, images)
+
+    def test_queue_images_async(self):
+        provider = CoverArtProviderLocal(self.coverart)
+        with patch('picard.coverart.providers.local.thread.run_task') as run_task:
+            self.assertEqual(CoverArtProviderLocal.QueueState.WAIT, provider.queue_images())
+        func, next_func = run_task.call_args.args
+        next_func(result=func())
+        self.assertEqual(2, self.coverart.queue_put.call_count)
+        self.coverart.next_in_queue.assert_called_once_with()
+        self.assertEqual({}, self.album.get_pending_tasks())
+
+    def test_no_regex(self):
+        self.set_config_values({'local_cover_regex': ''})
+        provider = CoverArtProviderLocal(self.coverart)
+        self.assertEqual(CoverArtProviderLocal.QueueState.FINISHED, provider.queue_images())
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+import os
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+
+from test.picardtestcase import PicardTestCase
+from test.test_coverart_processing import mock_to_main
+
+from picard.util import periodictouch
+
+
+class PeriodicTouchTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = self.mktmpdir()
+        for name, value in (('_touch_timer', MagicMock()), ('_files_to_touch', set()), ('_touching', False)):
+            patcher = patch.object(periodictouch, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch('picard.util.thread.to_main', mock_to_main)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _create_file(self, name):
+        filepath = os.path.join(self.directory, name)
+        with open(filepath, 'wb'):
+            pass
+        os.utime(filepath, (1000, 1000))
+        periodictouch.register_file(filepath)
+        return filepath
+
+    def test_touch_files(self):
+        filepath = self._create_file('a')
+        periodictouch._touch_files()
+        self.assertGreater(os.path.getmtime(filepath), 1000)
+        self.assertFalse(periodictouch._touching)
+
+    def test_missing_files_unregistered(self):
+        filepath = self._create_file('a')
+        os.unlink(filepath)
+        periodictouch._touch_files()
+        self.assertFalse(os.path.exists(filepath))
+        self.assertEqual(set(), periodictouch._files_to_touch)
+
+    def test_unregister(self):
+        filepath = self._create_file('a')
+        periodictouch.unregister_file(filepath)
+        self.assertEqual(set(), periodictouch._files_to_touch)
+
+    def test_touched_on_worker_thread(self):
+        self._create_file('a')
+        with patch('picard.util.periodictouch.thread.run_task') as run_task:
+            periodictouch._touch_files()
+            periodictouch._touch_files()
+        run_task.assert_called_once()
+        func, next_func = run_task.call_args.args
+        next_func(result=func())
+        self.assertFalse(periodictouch._touching)
+
+    def test_chunks_stop_on_shutdown(self):
+        files = [self._create_file(str(i)) for i in range(5)]
+        self.assertEqual(5, periodictouch.touch_files(files, chunk_size=2))
+        self.tagger.stopping = True
+        self.assertEqual(0, periodictouch.touch_files(files, chunk_size=2))
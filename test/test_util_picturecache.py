@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Picard, the next-generation MusicBrainz tagger
+#
+# Copyright (C) 2026 The MusicBrainz Team
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+from unittest.mock import MagicMock
+
+from test.picardtestcase import PicardTestCase
+
+from picard.util.picturecache import EncodedPictureCache
+
+
+class EncodedPictureCacheTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = EncodedPictureCache(max_size=10)
+        self.encode = MagicMock(return_value=b'abcd')
+        self.image = self._image('hash')
+
+    @staticmethod
+    def _image(datahash):
+        image = MagicMock(data=b'image')
+        image.datahash.hash = datahash
+        return image
+
+    def test_encoded_once_while_saving(self):
+        self.cache.start_saving()
+        self.assertEqual(b'abcd', self.cache.get(self.image, 'key', self.encode))
+        self.assertEqual(b'abcd', self.cache.get(self.image, 'key', self.encode))
+        self.encode.assert_called_once_with()
+
+    def test_not_cached_without_saving(self):
+        self.assertEqual(b'abcd', self.cache.get(self.image, 'key', self.encode))
+        self.assertEqual(b'abcd', self.cache.get(self.image, 'key', self.encode))
+        self.assertEqual(2, self.encode.call_count)
+        self.assertEqual(0, len(self.cache))
+
+    def test_cleared_after_last_save(self):
+        self.cache.start_saving()
+        self.cache.start_saving()
+        self.cache.get(self.image, 'key', self.encode)
+        self.cache.finish_saving()
+        self.assertEqual(1, len(self.cache))
+        self.cache.finish_saving()
+        self.assertEqual(0, len(self.cache))
+
+    def test_size_limit(self):
+        self.cache.start_saving()
+        self.cache.get(self.image, 'a', self.encode)
+        self.cache.get(self.image, 'b', self.encode)
+        self.cache.get(self.image, 'a', self.encode)
+        self.cache.get(self.image, 'c', self.encode)
+        self.assertEqual(2, len(self.cache))
+        self.encode.reset_mock()
+        self.cache.get(self.image, 'a', self.encode)
+        self.encode.assert_not_called()
+        self.cache.get(self.image, 'b', self.encode)
+        self.encode.assert_called_once_with()
+
+    def test_too_large_not_cached(self):
+        self.cache.start_saving()
+        self.cache.get(self.image, 'key', lambda: b'x' * 11)
+        self.assertEqual(0, len(self.cache))
+
+    def test_shared_between_images(self):
+        self.cache.start_saving()
+        self.cache.get(self.image, 'key', self.encode)
+        self.cache.get(self._image('hash'), 'key', self.encode)
+        self.encode.assert_called_once_with()
+        self.cache.get(self._image('other'), 'key', self.encode)
+        self.assertEqual(2, self.encode.call_count)
+
+    def test_no_datahash(self):
+        self.image.datahash = None
+        self.cache.start_saving()
+        self.cache.get(self.image, 'key', self.encode)
+        self.assertEqual(0, len(self.cache))
+
+    def test_data(self):
+        self.cache.start_saving()
+        self.assertEqual(b'image', self.cache.data(self.image))
+        self.image.data = b'other'
+        self.assertEqual(b'image', self.cache.data(self.image))
@@ -48,6 +48,8 @@ from unittest.mock import (
     patch,
 )
 
+from PyQt6 import QtCore
+
 from test.picardtestcase import (
     PicardTestCase,
     get_test_data_path,
@@ -83,6 +85,7 @@ from picard.util import (
     iter_files_from_objects,
     iter_unique,
     limited_join,
+    load_json,
     make_filename_from_title,
     normpath,
     parse_date,
@@ -1208,3 +1211,26 @@ class URLsTest(PicardTestCase):
             key,
             test_text,
         )
+
+
+class LoadJsonTest(PicardTestCase):
+    document = {'id': '1', 'title': 'Über', 'count': 2}
+    text = '{"id": "1", "title": "Über", "count": 2}'
+
+    def test_load_json_str(self):
+        self.assertEqual(self.document, load_json(self.text))
+
+    def test_load_json_bytes(self):
+        self.assertEqual(self.document, load_json(self.text.encode('utf-8')))
+        self.assertEqual(self.document, load_json(bytearray(self.text.encode('utf-8'))))
+
+    def test_load_json_qbytearray(self):
+        self.assertEqual(self.document, load_json(QtCore.QByteArray(self.text.encode('utf-8'))))
+
+    def test_load_json_without_orjson(self):
+        with patch('picard.util.orjson', None):
+            self.assertEqual(self.document, load_json(self.text.encode('utf-8')))
+
+    def test_load_json_invalid(self):
+        with self.assertRaises(ValueError):
+            load_json(b'{"id": ')
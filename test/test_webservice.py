@@ -28,9 +28,13 @@ from unittest.mock import (
     patch,
 )
 
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import (
+    QByteArray,
+    QUrl,
+)
 from PyQt6.QtNetwork import (
     QNetworkProxy,
+    QNetworkReply,
     QNetworkRequest,
 )
 
@@ -38,6 +42,7 @@ from test.picardtestcase import PicardTestCase
 
 from picard import config
 from picard.webservice import (
+    ASYNC_PARSE_MIN_BYTES,
     TEMP_ERRORS_RETRIES,
     PendingRequest,
     RequestPriorityQueue,
@@ -374,6 +379,81 @@ class WebServiceProxyTest(PicardTestCase):
             self.assertEqual(proxy.port(), PROXY_SETTINGS['proxy_server_port'])
 
 
+def mock_to_main(func, *args, **kwargs):
+    func(*args, **kwargs)
+
+
+class WebServiceReplyParsingTest(PicardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.set_config_values(
+            {
+                'use_proxy': False,
+                'network_transfer_timeout_seconds': 30,
+                'network_cache_size_bytes': 100 * 1000 * 1000,
+            }
+        )
+        self.ws = WebService()
+        self.ws._timer_run_next_task = MagicMock()
+        self.handler = MagicMock()
+        self.request = WSRequest(
+            method='GET',
+            url='http://abc.xyz/release',
+            handler=self.handler,
+            parse_response_type='json',
+        )
+        self.ws._active_requests = {}
+
+    def _make_reply(self, data):
+        reply = MagicMock()
+        reply.error.return_value = QNetworkReply.NetworkError.NoError
+        reply.attribute.return_value = None
+        reply.bytesAvailable.return_value = len(data)
+        reply.readAll.return_value = QByteArray(data)
+        reply.request.return_value.url.return_value = QUrl('http://abc.xyz/release')
+        self.ws._active_requests[reply] = self.request
+        ratecontrol.increment_requests(self.request.get_host_key())
+        return reply
+
+    def test_json_request_has_data_parser(self):
+        self.assertIsNotNone(self.request.response_data_parser)
+
+    def test_small_reply_parsed_synchronously(self):
+        reply = self._make_reply(b'{"id": "1"}')
+        with patch('picard.webservice.thread.run_task') as run_task:
+            self.ws._process_reply(reply)
+            run_task.assert_not_called()
+        self.handler.assert_called_once_with({'id': '1'}, reply, None)
+        reply.deleteLater.assert_called_once()
+
+    def test_large_reply_parsed_on_thread(self):
+        padding = 'x' * ASYNC_PARSE_MIN_BYTES
+        reply = self._make_reply(('{"id": "1", "padding": "%s"}' % padding).encode())
+        with patch('picard.util.thread.to_main', mock_to_main):
+            self.ws._process_reply(reply)
+        self.handler.assert_called_once_with({'id': '1', 'padding': padding}, reply, None)
+        reply.deleteLater.assert_called_once()
+
+    def test_large_reply_release_deferred(self):
+        reply = self._make_reply(b' ' * ASYNC_PARSE_MIN_BYTES + b'{}')
+        with patch('picard.webservice.thread.run_task') as run_task:
+            self.ws._process_reply(reply)
+            run_task.assert_called_once()
+        self.handler.assert_not_called()
+        reply.deleteLater.assert_not_called()
+
+    def test_large_reply_parse_error(self):
+        data = b'{' * ASYNC_PARSE_MIN_BYTES
+        reply = self._make_reply(data)
+        with patch('picard.util.thread.to_main', mock_to_main):
+            self.ws._process_reply(reply)
+        self.handler.assert_called_once()
+        document, http, error = self.handler.call_args[0]
+        self.assertEqual(data, document)
+        self.assertIsInstance(error, ValueError)
+        reply.deleteLater.assert_called_once()
+
+
 class ParserHookTest(PicardTestCase):
     def test_parser_hook(self):
         WebService.add_parser('A', 'mime', 'parser')
@@ -383,11 +463,18 @@ class ParserHookTest(PicardTestCase):
         self.assertEqual(WebService.PARSERS['A'].mimetype, WebService.get_response_mimetype('A'))
         self.assertEqual(WebService.PARSERS['A'].parser, 'parser')
         self.assertEqual(WebService.PARSERS['A'].parser, WebService.get_response_parser('A'))
+        self.assertIsNone(WebService.get_response_data_parser('A'))
+
+        WebService.add_parser('C', 'mime', 'parser', data_parser='data_parser')
+        self.assertEqual(WebService.PARSERS['C'].data_parser, 'data_parser')
+        self.assertEqual('data_parser', WebService.get_response_data_parser('C'))
 
         with self.assertRaises(UnknownResponseParserError):
             WebService.get_response_parser('B')
         with self.assertRaises(UnknownResponseParserError):
             WebService.get_response_mimetype('B')
+        with self.assertRaises(UnknownResponseParserError):
+            WebService.get_response_data_parser('B')
 
 
 class WSRequestTest(PicardTestCase):
@@ -427,6 +514,15 @@ class WSRequestTest(PicardTestCase):
         request = WSRequest(url=QUrl(url), method='GET', handler=dummy_handler)
         self.assertEqual(request.url().toString(), url)
 
+    def test_init_headers(self):
+        request = WSRequest(
+            url='https://example.org/path',
+            method='GET',
+            handler=dummy_handler,
+            headers={'If-None-Match': '"abc"'},
+        )
+        self.assertEqual(b'"abc"', request.rawHeader(b'If-None-Match').data())
+
     def test_init_port_80(self):
         request = WSRequest(url='http://example.org/path', method='GET', handler=dummy_handler)
         self.assertEqual(request.port, 80)